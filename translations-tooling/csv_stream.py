@@ -0,0 +1,124 @@
+"""Streaming reader for the Google Sheets CSV exports.
+
+Shared by validate_google_sheet_csv.py, sanitize_csv_control_chars.py and
+generate_public_scripts_json_from_csv.py so header sanitization and control
+character handling live in one place. Rows are read lazily, one record at a
+time, so memory stays flat regardless of the export size.
+"""
+
+from __future__ import annotations
+
+import csv
+import re
+from pathlib import Path
+from typing import IO, Iterator
+
+CONTROL_CHARS_RE = re.compile(r"[\x00-\x08\x0B-\x1F\x7F]")
+# The same characters as raw bytes: all are ASCII, so in UTF-8 they never occur inside
+# a multi-byte sequence and can be found or deleted without decoding
+CONTROL_BYTES = bytes([*range(0x00, 0x09), *range(0x0B, 0x20), 0x7F])
+CONTROL_BYTES_RE = re.compile(b"[" + re.escape(CONTROL_BYTES) + b"]")
+CHUNK_SIZE = 1024 * 1024
+
+
+def sanitize_header(raw: str | None) -> str:
+    if raw is None:
+        return ""
+
+    value = raw.lstrip("\ufeff")
+    value = CONTROL_CHARS_RE.sub("", value)
+    return value.strip()
+
+
+def clean_text(raw: str | None) -> str:
+    if raw is None:
+        return ""
+
+    return clean_cell(raw)[0]
+
+
+def clean_cell(raw: str) -> tuple[str, bool]:
+    """clean_text() for a raw cell, also reporting whether it held control characters."""
+    value = raw
+    if "\r" in value:
+        value = value.replace("\r\n", "\n").replace("\r", "\n")
+    value, removed = CONTROL_CHARS_RE.subn("", value)
+    return value.strip(), removed > 0 or "\r" in raw
+
+
+def parse_optional_bool(raw: str | None) -> bool | None:
+    if raw is None:
+        return None
+
+    value = clean_text(raw).lower()
+    if value == "":
+        return None
+    if value in {"true", "1", "yes", "y"}:
+        return True
+    if value in {"false", "0", "no", "n"}:
+        return False
+    return None
+
+
+class CsvStream:
+    """A CSV export opened for one lazy pass.
+
+    The header row is read and sanitized once on open. ``raw_rows()`` yields
+    ``(line, cells)`` and ``rows()`` yields ``(line, {header: raw value})``;
+    lines are numbered like ``csv.DictReader`` records (header is line 1,
+    blank lines are skipped without being counted).
+
+        with CsvStream(path) as stream:
+            for line, row in stream.rows():
+                ...
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.raw_headers: list[str] = []
+        self.headers: list[str] = []
+        self._handle: IO[str] | None = None
+        self._reader: Iterator[list[str]] | None = None
+
+    def __enter__(self) -> "CsvStream":
+        self._handle = self.path.open(encoding="utf-8-sig", newline="")
+        self._reader = csv.reader(self._handle)
+        self.raw_headers = next(self._reader, [])
+        self.headers = [sanitize_header(header) for header in self.raw_headers]
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self._handle is not None:
+            self._handle.close()
+
+    @property
+    def empty(self) -> bool:
+        """True when the file has no header row."""
+        return not self.raw_headers
+
+    @property
+    def columns(self) -> list[tuple[int, str]]:
+        """(index, header) of every column whose header is not empty after sanitization."""
+        return [(index, header) for index, header in enumerate(self.headers) if header != ""]
+
+    def raw_rows(self) -> Iterator[tuple[int, list[str]]]:
+        line_number = 1
+        for cells in self._reader:
+            if not cells:
+                continue
+            line_number += 1
+            yield line_number, cells
+
+    def rows(self) -> Iterator[tuple[int, dict[str, str]]]:
+        columns = self.columns
+        for line_number, cells in self.raw_rows():
+            yield line_number, {key: cells[index] if index < len(cells) else "" for index, key in columns}
+
+
+def iter_chunks(handle: IO, size: int = CHUNK_SIZE) -> Iterator:
+    """Read an open file (text or binary) in fixed-size chunks."""
+    while True:
+        chunk = handle.read(size)
+        if not chunk:
+            return
+        yield chunk
@@ -3,48 +3,21 @@
 from __future__ import annotations
 
 import argparse
-import csv
+import hashlib
 import json
 import re
 import sys
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
-CONTROL_CHARS_RE = re.compile(r"[\x00-\x08\x0B-\x1F\x7F]")
-KNOWN_OFFICIAL_IDS = {"trouble_brewing", "bad_moon_rising", "sects_and_violets"}
-
-
-def sanitize_header(raw: str | None) -> str:
-    if raw is None:
-        return ""
-
-    raw = raw.lstrip("\ufeff")
-    raw = CONTROL_CHARS_RE.sub("", raw)
-    return raw.strip()
-
-
-def clean_text(raw: str | None) -> str:
-    if raw is None:
-        return ""
-
-    normalized = raw.replace("\r\n", "\n").replace("\r", "\n")
-    normalized = CONTROL_CHARS_RE.sub("", normalized)
-    return normalized.strip()
-
-
-def parse_optional_bool(raw: str | None) -> bool | None:
-    if raw is None:
-        return None
+from csv_stream import CsvStream, clean_text, parse_optional_bool
 
-    value = clean_text(raw).lower()
-    if value == "":
-        return None
-    if value in {"true", "1", "yes", "y"}:
-        return True
-    if value in {"false", "0", "no", "n"}:
-        return False
-
-    return None
+KNOWN_OFFICIAL_IDS = {"trouble_brewing", "bad_moon_rising", "sects_and_violets"}
+INDEX_FIELDS = ("id", "name", "logo", "official", "teensyville")
+SHARD_HASH_LENGTH = 10
+SHARD_NAME_RE = re.compile(rf"^.+\.[0-9a-f]{{{SHARD_HASH_LENGTH}}}\.json$")
+# Same rule as validate_google_sheet_csv; ids become shard file names, so nothing else may get through
+SCRIPT_ID_RE = re.compile(r"^[a-z0-9_]+$")
 
 
 def load_existing_scripts(path: Path) -> dict[str, dict[str, Any]]:
@@ -66,29 +39,10 @@ def load_existing_scripts(path: Path) -> dict[str, dict[str, Any]]:
     return scripts_by_id
 
 
-def iter_csv_rows(csv_path: Path) -> list[dict[str, str]]:
-    with csv_path.open(encoding="utf-8-sig", newline="") as handle:
-        reader = csv.reader(handle)
-
-        try:
-            raw_headers = next(reader)
-        except StopIteration:
-            return []
-
-        headers = [sanitize_header(header) for header in raw_headers]
-        dict_reader = csv.DictReader(handle, fieldnames=headers)
-
-        rows: list[dict[str, str]] = []
-        for raw_row in dict_reader:
-            normalized: dict[str, str] = {}
-            for raw_key, raw_value in raw_row.items():
-                key = sanitize_header(raw_key)
-                if key == "":
-                    continue
-                normalized[key] = raw_value or ""
-            rows.append(normalized)
-
-        return rows
+def iter_csv_rows(csv_path: Path) -> Iterator[dict[str, str]]:
+    with CsvStream(csv_path) as stream:
+        for _, row in stream.rows():
+            yield row
 
 
 def build_script_row(row: dict[str, str], existing: dict[str, Any]) -> dict[str, Any] | None:
@@ -153,6 +107,56 @@ def generate_scripts(csv_path: Path, existing_path: Path) -> list[dict[str, Any]
     return generated
 
 
+def minified_json(data: Any) -> str:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def invalid_script_ids(scripts: list[dict[str, Any]]) -> list[str]:
+    return [script["id"] for script in scripts if not SCRIPT_ID_RE.fullmatch(script["id"])]
+
+
+def shard_name(script_id: str, content: str) -> str:
+    """<id>.<content hash>.json, so a shard URL can be cached forever and changes name with its content."""
+    digest = hashlib.sha256(content.encode("utf-8")).hexdigest()[:SHARD_HASH_LENGTH]
+    return f"{script_id}.{digest}.json"
+
+
+def write_catalog(scripts: list[dict[str, Any]], index_path: Path, shard_dir: Path) -> tuple[int, int, int]:
+    """Write the minified index and one detail shard per script, removing shards no longer referenced.
+
+    Returns (shards written, shards already present, stale shards removed). Raises ValueError, before
+    writing anything, when a script id can't be used as a file name.
+    """
+    invalid = invalid_script_ids(scripts)
+    if invalid:
+        raise ValueError(f"script id(s) must match regex '{SCRIPT_ID_RE.pattern}': {', '.join(map(repr, invalid))}")
+    shard_dir.mkdir(parents=True, exist_ok=True)
+    index: list[dict[str, Any]] = []
+    current: set[str] = set()
+    written = 0
+    for script in scripts:
+        content = minified_json(script)
+        name = shard_name(script["id"], content)
+        current.add(name)
+        shard_path = shard_dir / name
+        if not shard_path.exists():
+            shard_path.write_text(content, encoding="utf-8")
+            written += 1
+
+        entry = {key: script[key] for key in INDEX_FIELDS if key in script}
+        entry["detail"] = shard_path.relative_to(index_path.parent).as_posix()
+        index.append(entry)
+
+    removed = 0
+    for path in shard_dir.glob("*.json"):
+        if path.name not in current and SHARD_NAME_RE.match(path.name):
+            path.unlink()
+            removed += 1
+
+    index_path.write_text(minified_json(index), encoding="utf-8")
+    return written, len(current) - written, removed
+
+
 def main() -> int:
     script_dir = Path(__file__).resolve().parent
 
@@ -177,6 +181,23 @@ def main() -> int:
         default=None,
         help="Existing scripts.json to preserve non-CSV fields (default: same as --out)",
     )
+    parser.add_argument(
+        "--index-out",
+        type=Path,
+        default=script_dir.parent / "public" / "scripts.index.json",
+        help="Minified list of id/name/logo/flags with each script's detail shard (default: ../public/scripts.index.json)",
+    )
+    parser.add_argument(
+        "--shard-dir",
+        type=Path,
+        default=script_dir.parent / "public" / "scripts",
+        help="Directory for the per-script <id>.<hash>.json detail shards (default: ../public/scripts)",
+    )
+    parser.add_argument(
+        "--skip-catalog",
+        action="store_true",
+        help="Only write scripts.json, not the index and detail shards",
+    )
 
     args = parser.parse_args()
     csv_path = args.csv.resolve()
@@ -188,6 +209,15 @@ def main() -> int:
         return 1
 
     scripts = generate_scripts(csv_path, existing_path)
+    if not args.skip_catalog:
+        invalid = invalid_script_ids(scripts)
+        for script_id in invalid:
+            print(
+                f"[error] script id {script_id!r} must match regex '{SCRIPT_ID_RE.pattern}' to name its shard",
+                file=sys.stderr,
+            )
+        if invalid:
+            return 1
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
     output_path.write_text(
@@ -197,6 +227,16 @@ def main() -> int:
 
     print(f"[ok] Generated {len(scripts)} scripts")
     print(f"[ok] Wrote: {output_path}")
+
+    if not args.skip_catalog:
+        index_path = args.index_out.resolve()
+        shard_dir = args.shard_dir.resolve()
+        if not shard_dir.is_relative_to(index_path.parent):
+            print(f"[error] --shard-dir must be inside the directory of --index-out: {shard_dir}", file=sys.stderr)
+            return 1
+        written, unchanged, removed = write_catalog(scripts, index_path, shard_dir)
+        print(f"[ok] Wrote: {index_path}")
+        print(f"[ok] Shards in {shard_dir}: {written} written, {unchanged} unchanged, {removed} stale removed")
     return 0
 
 
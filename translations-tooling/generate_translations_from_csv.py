@@ -0,0 +1,426 @@
+#!/usr/bin/env python3
+
+"""Generate assets/json/<locale>.json and assets/scripts/<locale>/*.json from the locale CSVs.
+
+Python counterpart of generate_json_from_csv.exs + generate_scripts.exs. Each
+locale CSV is parsed once into an id-keyed index, merged over the en_GB roles,
+and every script definition is resolved against that index; locales are
+generated in parallel worker processes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+from csv_stream import CsvStream, clean_text
+
+NIGHT_ORDER_ALIASES = {
+    "minioninfo": "minion_info",
+    "demoninfo": "demon_info",
+}
+IGNORED_NIGHT_ORDER_IDS = {"dusk", "dawn"}
+NIGHT_ORDER_RE = re.compile(r"[+-]?\d+")
+# The locales the Mix tasks generate, whose committed JSON and scripts match this generator's output.
+# The other locales' files predate it, so they are only regenerated on request (--locale / --all)
+DEFAULT_LOCALES = ("ko_KR",)
+
+ICON_URL = "https://github.com/botc-kr/botc-kr.github.io/blob/main/src/assets/icons/Icon_{role_id}.png?raw=true"
+LEGACY_ICON_PREFIXES = (
+    "../../assets/icons/Icon_",
+    "https://github.com/wonhyo-e/botc-translations/blob/main/assets/icons/Icon_",
+    "https://github.com/botc-kr/botc-kr.github.io/blob/main/public/translations/assets/icons/Icon_",
+)
+
+
+@dataclass(frozen=True)
+class ScriptDefinition:
+    name: str
+    meta: dict[str, Any]
+    roles: list[str]
+
+
+@dataclass
+class LocaleReport:
+    locale: str
+    csv_path: Path
+    rows: int = 0
+    roles: int = 0
+    csv_only: int = 0
+    missing_from_csv: list[str] = field(default_factory=list)
+    scripts_written: int = 0
+    scripts_unchanged: int = 0
+    json_written: bool = False
+    unresolved: dict[str, list[str]] = field(default_factory=dict)
+    parse_seconds: float = 0.0
+    write_seconds: float = 0.0
+
+
+def locale_from_csv(path: Path) -> str:
+    """fr_fr.csv -> fr_FR, so outputs line up with the existing assets/json names."""
+    language, _, region = path.stem.partition("_")
+    return f"{language.lower()}_{region.upper()}" if region else path.stem
+
+
+def load_script_definitions(definitions_dir: Path) -> list[ScriptDefinition]:
+    definitions: list[ScriptDefinition] = []
+    for path in sorted(definitions_dir.glob("*.json")):
+        data = json.loads(path.read_text(encoding="utf-8"))
+        # A bare role list is the old format; the new one wraps it with script metadata
+        if isinstance(data, list):
+            meta, roles = {}, data
+        else:
+            meta, roles = data.get("meta", {}), data["roles"]
+        definitions.append(ScriptDefinition(path.stem, meta, roles))
+    return definitions
+
+
+def load_base_roles(path: Path) -> list[dict[str, Any]]:
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def normalize_night_order_id(role_id: Any) -> str:
+    if not isinstance(role_id, str):
+        return ""
+    normalized = role_id.strip().lower()
+    return NIGHT_ORDER_ALIASES.get(normalized, normalized)
+
+
+def build_night_order_map(order_list: Any) -> dict[str, int]:
+    if not isinstance(order_list, list):
+        return {}
+
+    order: dict[str, int] = {}
+    position = 0
+    for raw_id in order_list:
+        role_id = normalize_night_order_id(raw_id)
+        if role_id == "" or role_id in IGNORED_NIGHT_ORDER_IDS:
+            continue
+        position += 1
+        order.setdefault(role_id, position)
+    return order
+
+
+def load_night_order_overrides(night_orders_dir: Path, locale: str) -> dict[str, dict[str, int]]:
+    path = night_orders_dir / f"{locale}.json"
+    try:
+        overrides = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {"firstNight": {}, "otherNight": {}}
+    except (OSError, ValueError) as error:
+        print(f"[warn] {path}: {error}; using CSV/en_GB night order", file=sys.stderr)
+        return {"firstNight": {}, "otherNight": {}}
+
+    return {
+        "firstNight": build_night_order_map(overrides.get("firstNight", [])),
+        "otherNight": build_night_order_map(overrides.get("otherNight", [])),
+    }
+
+
+def parse_night_order(raw: str) -> int | None:
+    match = NIGHT_ORDER_RE.match(raw)
+    return int(match.group()) if match else None
+
+
+def split_list(raw: str) -> list[str]:
+    if raw == "":
+        return []
+    return [item.strip() for item in raw.split(",")]
+
+
+def csv_row_to_role(row: dict[str, str], night_order: dict[str, dict[str, int]]) -> dict[str, Any]:
+    """Turn a CSV row into a clocktower.online role, dropping empty fields so en_GB fills them in."""
+    role: dict[str, Any] = {key: clean_text(value) for key, value in row.items()}
+    role_id = role["id"]
+
+    if "reminders" in role:
+        role["reminders"] = split_list(role["reminders"])
+    if "remindersGlobal" in role:
+        role["remindersGlobal"] = sorted(set(split_list(role["remindersGlobal"])))
+
+    night_order_id = normalize_night_order_id(role_id)
+    for key in ("firstNight", "otherNight"):
+        override = night_order[key].get(night_order_id)
+        role[key] = override if override is not None else parse_night_order(role.get(key, ""))
+
+    return {key: value for key, value in role.items() if value not in (None, "", [])}
+
+
+def normalize_icon_path(role: dict[str, Any]) -> dict[str, Any]:
+    role_id = role.get("id")
+    image = role.get("image", "")
+    if isinstance(role_id, str) and (image == "" or (isinstance(image, str) and image.startswith(LEGACY_ICON_PREFIXES))):
+        role["image"] = ICON_URL.format(role_id=role_id)
+    return role
+
+
+def build_locale_roles(
+    base_roles: list[dict[str, Any]],
+    csv_roles: dict[str, dict[str, Any]],
+) -> tuple[list[dict[str, Any]], list[str]]:
+    """Merge CSV roles over en_GB in en_GB order, then append roles only the CSV has."""
+    merged: list[dict[str, Any]] = []
+    missing: list[str] = []
+    base_ids: set[str] = set()
+    for base_role in base_roles:
+        role_id = base_role["id"]
+        base_ids.add(role_id)
+        csv_role = csv_roles.get(role_id)
+        if csv_role is None:
+            missing.append(role_id)
+            merged.append(dict(base_role))
+        else:
+            merged.append({**base_role, **csv_role})
+
+    merged.extend(dict(role) for role_id, role in csv_roles.items() if role_id not in base_ids)
+    return [normalize_icon_path(role) for role in merged], missing
+
+
+def build_script(
+    definition: ScriptDefinition,
+    locale: str,
+    roles_by_id: dict[str, dict[str, Any]],
+) -> tuple[list[dict[str, Any] | None], list[str]]:
+    meta = {"id": "_meta", "isOfficial": False, **definition.meta}
+    script: list[dict[str, Any] | None] = [meta]
+    unresolved: list[str] = []
+    for role_id in definition.roles:
+        role = roles_by_id.get(role_id)
+        if role is None:
+            # Kept as null like the Elixir generator, but reported
+            unresolved.append(role_id)
+            script.append(None)
+        else:
+            script.append({**role, "id": f"{locale}_{role_id}"})
+    return script, unresolved
+
+
+def write_if_changed(path: Path, text: str) -> bool:
+    """Atomically replace ``path`` with ``text`` unless it already holds exactly that."""
+    data = text.encode("utf-8")
+    try:
+        if path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+    return True
+
+
+def generate_locale(
+    csv_path: Path,
+    *,
+    base_roles: list[dict[str, Any]],
+    definitions: list[ScriptDefinition],
+    json_dir: Path,
+    scripts_dir: Path,
+    night_orders_dir: Path,
+    write_scripts: bool,
+) -> LocaleReport:
+    locale = locale_from_csv(csv_path)
+    report = LocaleReport(locale, csv_path)
+
+    started = time.perf_counter()
+    night_order = load_night_order_overrides(night_orders_dir, locale)
+    csv_roles: dict[str, dict[str, Any]] = {}
+    with CsvStream(csv_path) as stream:
+        for _, row in stream.rows():
+            report.rows += 1
+            if clean_text(row.get("id")) == "":
+                continue
+            role = csv_row_to_role(row, night_order)
+            csv_roles[role["id"]] = role
+
+    roles, report.missing_from_csv = build_locale_roles(base_roles, csv_roles)
+    report.roles = len(roles)
+    report.csv_only = len(roles) - len(base_roles)
+    report.parse_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    report.json_written = write_if_changed(
+        json_dir / f"{locale}.json",
+        json.dumps(roles, ensure_ascii=False, sort_keys=True, separators=(",", ":")),
+    )
+
+    if write_scripts:
+        roles_by_id = {role["id"]: role for role in roles}
+        for definition in definitions:
+            script, unresolved = build_script(definition, locale, roles_by_id)
+            if unresolved:
+                report.unresolved[definition.name] = unresolved
+            text = json.dumps(script, ensure_ascii=False, sort_keys=True, indent=2) + "\n"
+            if write_if_changed(scripts_dir / locale / f"{definition.name}.json", text):
+                report.scripts_written += 1
+            else:
+                report.scripts_unchanged += 1
+    report.write_seconds = time.perf_counter() - started
+    return report
+
+
+def collect_locale_csvs(csv_dir: Path, locales: list[str], scripts_csv: Path) -> list[Path]:
+    paths = [path for path in sorted(csv_dir.glob("*.csv")) if path.resolve() != scripts_csv]
+    if locales:
+        wanted = {locale_from_csv(Path(f"{locale}.csv")) for locale in locales}
+        paths = [path for path in paths if locale_from_csv(path) in wanted]
+    return paths
+
+
+def print_report(report: LocaleReport, verbose: bool) -> None:
+    scripts = ""
+    if report.scripts_written or report.scripts_unchanged:
+        scripts = f", scripts {report.scripts_written} written / {report.scripts_unchanged} unchanged"
+    print(
+        f"[ok] {report.locale}: {report.rows} rows -> {report.roles} roles "
+        f"({report.csv_only} CSV-only, {len(report.missing_from_csv)} en_GB-only), "
+        f"json {'written' if report.json_written else 'unchanged'}{scripts}, "
+        f"parse {report.parse_seconds:.2f}s, write {report.write_seconds:.2f}s"
+    )
+    if verbose and report.missing_from_csv:
+        print(f"[info] {report.locale}: not in CSV, en_GB used: {', '.join(report.missing_from_csv)}")
+    for script_name, role_ids in report.unresolved.items():
+        print(f"[warn] {report.locale}/{script_name}.json: unknown role id(s) written as null: {', '.join(role_ids)}")
+
+
+def parse_args() -> argparse.Namespace:
+    script_dir = Path(__file__).resolve().parent
+    assets_dir = script_dir / "assets"
+
+    parser = argparse.ArgumentParser(
+        description="Generate assets/json/<locale>.json and assets/scripts/<locale>/*.json from the locale CSVs"
+    )
+    parser.add_argument(
+        "--locale",
+        action="append",
+        default=[],
+        help=f"Locale to generate, repeatable (default: {', '.join(DEFAULT_LOCALES)})",
+    )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Generate every locale CSV in --csv-dir",
+    )
+    parser.add_argument(
+        "--csv-dir",
+        type=Path,
+        default=assets_dir / "csv",
+        help="Directory holding <locale>.csv files (default: translations-tooling/assets/csv)",
+    )
+    parser.add_argument(
+        "--base",
+        type=Path,
+        default=assets_dir / "json" / "en_GB.json",
+        help="Roles the CSV values are merged over (default: translations-tooling/assets/json/en_GB.json)",
+    )
+    parser.add_argument(
+        "--definitions-dir",
+        type=Path,
+        default=assets_dir / "script_definitions",
+        help="Script role lists (default: translations-tooling/assets/script_definitions)",
+    )
+    parser.add_argument(
+        "--json-dir",
+        type=Path,
+        default=assets_dir / "json",
+        help="Output directory for <locale>.json (default: translations-tooling/assets/json)",
+    )
+    parser.add_argument(
+        "--scripts-dir",
+        type=Path,
+        default=assets_dir / "scripts",
+        help="Output directory for <locale>/<script>.json (default: translations-tooling/assets/scripts)",
+    )
+    parser.add_argument(
+        "--night-orders-dir",
+        type=Path,
+        default=assets_dir / "night_orders",
+        help="Per-locale night order overrides (default: translations-tooling/assets/night_orders)",
+    )
+    parser.add_argument(
+        "--skip-scripts",
+        action="store_true",
+        help="Only generate assets/json/<locale>.json",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=0,
+        help="Number of worker processes (default: 0, one per CPU core)",
+    )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="List the en_GB roles each locale CSV does not translate",
+    )
+
+    args = parser.parse_args()
+    if args.jobs < 0:
+        parser.error("--jobs must be zero or a positive integer")
+    if args.all and args.locale:
+        parser.error("--all and --locale are mutually exclusive")
+    if not args.all and not args.locale:
+        args.locale = list(DEFAULT_LOCALES)
+    return args
+
+
+def main() -> int:
+    args = parse_args()
+
+    csv_paths = collect_locale_csvs(args.csv_dir, args.locale, (args.csv_dir / "scripts.csv").resolve())
+    # The locale whose roles JSON is the --base input is never regenerated over it
+    base_path = args.base.resolve()
+    for path in [path for path in csv_paths if (args.json_dir / f"{locale_from_csv(path)}.json").resolve() == base_path]:
+        print(f"[skip] {path.name}: its roles JSON is the --base input {args.base}")
+        csv_paths.remove(path)
+    if not csv_paths:
+        print(f"[error] no locale CSV to generate in {args.csv_dir}", file=sys.stderr)
+        return 1
+    if not args.base.exists():
+        print(f"[error] base roles not found: {args.base}", file=sys.stderr)
+        return 1
+
+    started = time.perf_counter()
+    generate = partial(
+        generate_locale,
+        base_roles=load_base_roles(args.base),
+        definitions=[] if args.skip_scripts else load_script_definitions(args.definitions_dir),
+        json_dir=args.json_dir,
+        scripts_dir=args.scripts_dir,
+        night_orders_dir=args.night_orders_dir,
+        write_scripts=not args.skip_scripts,
+    )
+    workers = min(args.jobs or os.cpu_count() or 1, len(csv_paths))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            reports = list(executor.map(generate, csv_paths))
+    else:
+        reports = [generate(path) for path in csv_paths]
+
+    for report in reports:
+        print_report(report, args.verbose)
+
+    written = sum(report.scripts_written + report.json_written for report in reports)
+    total = sum(report.scripts_written + report.scripts_unchanged + 1 for report in reports)
+    print(
+        f"[summary] {len(reports)} locale(s), {sum(report.rows for report in reports)} CSV rows, "
+        f"{written}/{total} file(s) written with {workers} worker(s) in {time.perf_counter() - started:.2f}s"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,8 +1,10 @@
 from .pdf_generator import PDFGenerator, FontManager
 from .styles import StyleManager
 from .image_handler import ImageHandler
+from .downloader import ImageDownloader
+from .image_cache import ProcessedImageCache
 from .config import FontConfig
-from .data_processor import DataProcessor
+from .data_processor import DataProcessor, load_script_json
 from .table_builder import TableBuilder
 from .footer_handler import FooterHandler
 from .exceptions import (
@@ -19,8 +21,11 @@ __all__ = [
     'FontManager', 
     'StyleManager',
     'ImageHandler',
+    'ImageDownloader',
+    'ProcessedImageCache',
     'FontConfig',
     'DataProcessor',
+    'load_script_json',
     'TableBuilder',
     'FooterHandler',
     'PDFGenerationError',
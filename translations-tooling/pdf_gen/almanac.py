@@ -0,0 +1,80 @@
+import sys
+import time
+import logging
+import argparse
+from pathlib import Path
+from typing import List, Dict, Any
+
+from .batch import create_renderer
+from .data_processor import load_script_json
+from .constants import META_ID, VALID_TEAMS
+from .memory import format_peak_memory
+from .tracing import drain_trace_events, enable_tracing, write_trace
+
+LOCALE_JSON_DIR = "assets/json"
+DEFAULT_OUTPUT_DIR = "assets/pdf"
+
+
+def load_almanac_data(locale: str, title: str) -> List[Dict[str, Any]]:
+    """Every character of a locale JSON as script data, led by a _meta entry"""
+    characters = [
+        item for item in load_script_json(Path(LOCALE_JSON_DIR) / f"{locale}.json")
+        if isinstance(item, dict) and item.get("team") in VALID_TEAMS
+    ]
+    return [{"id": META_ID, "name": title}] + characters
+
+
+def main():
+    """Render an almanac of every character in a locale JSON"""
+    parser = argparse.ArgumentParser(
+        description="Render every character of assets/json/<locale>.json into one PDF."
+    )
+    parser.add_argument("locale", help="Locale JSON to read, e.g. ko_KR")
+    parser.add_argument(
+        "-o",
+        "--output",
+        help=f"Path to the output PDF (default: {DEFAULT_OUTPUT_DIR}/<locale>/almanac.pdf)",
+    )
+    parser.add_argument("--title", help="Document title (default: 전체 캐릭터 (<locale>))")
+    parser.add_argument(
+        "--no-stream",
+        action="store_true",
+        help="Build every flowable up front instead of streaming team tables",
+    )
+    parser.add_argument(
+        "--trace",
+        metavar="PATH",
+        help="Record timing spans and counters to a Chrome trace (.json) or JSON lines (.jsonl) file",
+    )
+
+    args = parser.parse_args()
+    if args.trace:
+        enable_tracing()
+    output_path = Path(args.output or f"{DEFAULT_OUTPUT_DIR}/{args.locale}/almanac.pdf")
+
+    try:
+        data = load_almanac_data(args.locale, args.title or f"전체 캐릭터 ({args.locale})")
+        renderer = create_renderer()
+        started = time.perf_counter()
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        renderer.pdf_generator.create_pdf(data, str(output_path), streaming=not args.no_stream)
+    except Exception as e:
+        logging.error(f"An error occurred: {e}")
+        sys.exit(1)
+
+    print(
+        f"[ok] {len(data) - 1} character(s) -> {output_path} "
+        f"in {time.perf_counter() - started:.2f}s, {output_path.stat().st_size / 1024:.1f} KiB"
+    )
+    print(f"[memory] peak RSS {format_peak_memory()}")
+    if args.trace:
+        write_trace(args.trace, drain_trace_events())
+        print(f"[trace] {args.trace}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+    main()
@@ -0,0 +1,472 @@
+import os
+import sys
+import glob
+import time
+import logging
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+
+from .config import FontConfig
+from .data_processor import load_script_json
+from .pdf_generator import FontManager, PDFGenerator
+from .styles import StyleManager
+from .image_handler import ImageHandler
+from .icon_index import IconIndex
+from .build_manifest import BuildManifest, Fingerprinter, InputFingerprint
+from .fonts import font_subset_stats
+from .memory import peak_memory_bytes
+from .tracing import counter_totals, drain_trace_events, enable_tracing, span, write_trace
+
+
+DEFAULT_OUTPUT_DIR = "assets/pdf"
+
+
+@dataclass
+class BatchJob:
+    """A single script JSON to render and where to write it"""
+    input_path: Path
+    output_path: Path
+    reason: Optional[str] = None
+
+
+@dataclass
+class BatchResult:
+    """Outcome of rendering a single batch job"""
+    job: BatchJob
+    elapsed: float
+    error: Optional[str] = None
+    image_cache_hits: int = 0
+    image_cache_misses: int = 0
+    previous_size: Optional[int] = None
+    size: Optional[int] = None
+    unique_images: int = 0
+    image_references: int = 0
+    font_subsets: int = 0
+    font_subsets_reused: int = 0
+    font_bytes: int = 0
+    font_bytes_hinted: int = 0
+    startup_time: float = 0.0
+    peak_memory: Optional[int] = None
+    # Trace events recorded by a worker process, handed back to the parent
+    trace_events: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def collect_jobs(sources: List[str], output_dir: str) -> List[BatchJob]:
+    """Expand directories and glob patterns into render jobs.
+
+    Every script is written to ``<output_dir>/<parent folder>/<name>.pdf``,
+    whether it came from a directory (walked recursively) or a glob, so
+    ``assets/scripts/ko_KR`` and ``assets/scripts/ko_KR/*.json`` both render
+    ``assets/scripts/ko_KR/tb.json`` to ``<output_dir>/ko_KR/tb.pdf``.
+    """
+    output_root = Path(output_dir)
+    jobs: Dict[Path, BatchJob] = {}
+
+    for source in sources:
+        source_path = Path(source)
+        if source_path.is_dir():
+            matches = sorted(source_path.rglob("*.json"))
+        else:
+            matches = [Path(match) for match in sorted(glob.glob(source, recursive=True))]
+            if not matches:
+                logging.warning(f"No script JSON matched: {source}")
+        for input_path in matches:
+            if input_path.suffix != ".json" or not input_path.is_file():
+                continue
+            output_path = output_root / input_path.parent.name / f"{input_path.stem}.pdf"
+            jobs.setdefault(input_path, BatchJob(input_path, output_path))
+
+    return list(jobs.values())
+
+
+class BatchRenderer:
+    """Renders many scripts with one generator so fonts, styles and images are reused"""
+
+    def __init__(self, pdf_generator: PDFGenerator, startup_time: float = 0.0, streaming: bool = False):
+        self.pdf_generator = pdf_generator
+        self.streaming = streaming
+        # Reported once, with the first job this renderer handles
+        self._unreported_startup = startup_time
+
+    def render(self, jobs: List[BatchJob]) -> List[BatchResult]:
+        """Render every job, collecting failures instead of stopping the run"""
+        return [self.render_job(job) for job in jobs]
+
+    def render_job(self, job: BatchJob) -> BatchResult:
+        """Render a single job and time it"""
+        table_builder = self.pdf_generator.table_builder
+        before = table_builder.image_cache_stats()
+        fonts_before = font_subset_stats()
+        previous_size = _file_size(job.output_path)
+        started = time.perf_counter()
+        error = None
+        size = None
+        try:
+            with span("render_job", script=str(job.input_path)):
+                data = load_script_json(job.input_path)
+                pdf_bytes = self.pdf_generator.create_pdf_bytes(data, streaming=self.streaming)
+                _write_atomic(job.output_path, pdf_bytes)
+                size = len(pdf_bytes)
+        except Exception as e:
+            logging.error(f"Failed to render {job.input_path}: {e}")
+            error = str(e)
+        elapsed = time.perf_counter() - started
+        after = table_builder.image_cache_stats()
+        fonts_after = font_subset_stats()
+        startup_time, self._unreported_startup = self._unreported_startup, 0.0
+        return BatchResult(
+            job,
+            elapsed,
+            error=error,
+            image_cache_hits=after.hits - before.hits,
+            image_cache_misses=after.misses - before.misses,
+            previous_size=previous_size,
+            size=size,
+            unique_images=table_builder.shared_images.unique_images,
+            image_references=table_builder.shared_images.references,
+            font_subsets=fonts_after.subsets - fonts_before.subsets,
+            font_subsets_reused=fonts_after.reused - fonts_before.reused,
+            font_bytes=fonts_after.embedded_bytes - fonts_before.embedded_bytes,
+            font_bytes_hinted=fonts_after.hinted_bytes - fonts_before.hinted_bytes,
+            startup_time=startup_time,
+            peak_memory=peak_memory_bytes(),
+        )
+
+
+def _write_atomic(path: Path, data: memoryview) -> None:
+    """Replace a file in one step so a failed run never leaves a truncated PDF behind"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _file_size(path: Path) -> Optional[int]:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return None
+
+
+def prefetch_images(jobs: List[BatchJob], image_handler: ImageHandler, revalidate: bool = False) -> None:
+    """Resolve every job's icons and download its remote images up front in one concurrent pass"""
+    items = []
+    for job in jobs:
+        try:
+            items.extend(item for item in load_script_json(job.input_path) if isinstance(item, dict))
+        except Exception:
+            # Unreadable scripts are reported when the job itself is rendered
+            continue
+    for item in items:
+        if item.get("id"):
+            image_handler.icon_index.resolve(item["id"])
+    image_handler.prefetch(items, revalidate=revalidate)
+
+
+def plan_jobs(
+    jobs: List[BatchJob],
+    fingerprinter: Fingerprinter,
+    manifest: BuildManifest,
+    force: bool = False
+) -> Tuple[List[BatchJob], List[BatchJob], Dict[Path, InputFingerprint]]:
+    """Split jobs into those whose inputs changed since the last build and those to skip"""
+    pending: List[BatchJob] = []
+    skipped: List[BatchJob] = []
+    fingerprints: Dict[Path, InputFingerprint] = {}
+    for job in jobs:
+        try:
+            items = load_script_json(job.input_path)
+        except Exception:
+            # Rendered anyway so the failure is reported with the job
+            job.reason = "unreadable script"
+            pending.append(job)
+            continue
+
+        fingerprint = fingerprinter.fingerprint(job.input_path, items)
+        fingerprints[job.input_path] = fingerprint
+        job.reason = "forced" if force else manifest.rebuild_reason(job.output_path, fingerprint)
+        if job.reason:
+            pending.append(job)
+        else:
+            skipped.append(job)
+    return pending, skipped, fingerprints
+
+
+def refresh_fingerprints(
+    jobs: List[BatchJob], fingerprinter: Fingerprinter, fingerprints: Dict[Path, InputFingerprint]
+) -> None:
+    """Fingerprint planned jobs again once their images are downloaded.
+
+    A remote image is fingerprinted by its URL until it is cached and by its
+    content afterwards, so the manifest must record the post-prefetch value.
+    """
+    for job in jobs:
+        if job.input_path not in fingerprints:
+            continue
+        try:
+            items = load_script_json(job.input_path)
+        except Exception:
+            continue
+        fingerprints[job.input_path] = fingerprinter.fingerprint(job.input_path, items)
+
+
+def create_renderer(image_handler: Optional[ImageHandler] = None, streaming: bool = False) -> BatchRenderer:
+    """Create a renderer with freshly registered fonts and styles"""
+    started = time.perf_counter()
+    font_manager = FontManager(FontConfig())
+    pdf_generator = PDFGenerator(font_manager, StyleManager(), image_handler or ImageHandler())
+    return BatchRenderer(pdf_generator, startup_time=time.perf_counter() - started, streaming=streaming)
+
+
+# Per-process renderer, set up once by the pool initializer
+_worker_renderer: Optional[BatchRenderer] = None
+
+
+def _init_worker(
+    streaming: bool = False, trace: bool = False, failed_urls: Optional[Dict[str, str]] = None
+) -> None:
+    """Process pool initializer: register fonts and build styles once per worker.
+
+    ``failed_urls`` carries the downloads that already failed in the parent so
+    workers do not request them again.
+    """
+    global _worker_renderer
+    if trace:
+        enable_tracing()
+    _worker_renderer = create_renderer(ImageHandler(failed_urls=failed_urls), streaming=streaming)
+
+
+def _render_in_worker(job: BatchJob) -> BatchResult:
+    """Render a job with the worker's renderer"""
+    result = _worker_renderer.render_job(job)
+    result.trace_events = drain_trace_events()
+    return result
+
+
+def render_parallel(
+    jobs: List[BatchJob],
+    max_workers: int,
+    streaming: bool = False,
+    trace: bool = False,
+    failed_urls: Optional[Dict[str, str]] = None
+) -> List[BatchResult]:
+    """Spread jobs over a process pool, returning results in job order.
+
+    A job whose worker dies (or whose worker failed to initialize) is reported
+    as a failed result instead of aborting the whole run.
+    """
+    results: List[BatchResult] = []
+    with ProcessPoolExecutor(
+        max_workers=max_workers, initializer=_init_worker, initargs=(streaming, trace, failed_urls)
+    ) as executor:
+        futures = [(job, executor.submit(_render_in_worker, job)) for job in jobs]
+        for job, future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                logging.error(f"Worker failed to render {job.input_path}: {e}")
+                results.append(BatchResult(job, 0.0, error=str(e) or type(e).__name__))
+    return results
+
+
+def _format_size_change(previous_size: Optional[int], size: Optional[int]) -> str:
+    if size is None:
+        return ""
+    if not previous_size:
+        return f"{size / 1024:.1f} KiB (new)"
+    change = (size - previous_size) / previous_size * 100
+    return f"{previous_size / 1024:.1f} -> {size / 1024:.1f} KiB ({change:+.1f}%)"
+
+
+def print_icon_report(icon_index: IconIndex) -> None:
+    """Print ambiguous icon names and ids whose lookup shadowed another icon"""
+    for line in icon_index.report():
+        print(f"[icons] {line}")
+
+
+def save_trace(path: str, results: List[BatchResult]) -> None:
+    """Write this process's trace plus the events workers sent back, and print the counter totals"""
+    events = drain_trace_events()
+    for result in results:
+        events.extend(result.trace_events)
+    write_trace(path, events)
+    spans = sum(1 for event in events if event["ph"] == "X")
+    counters = ", ".join(f"{name}={value:g}" for name, value in sorted(counter_totals(events).items()))
+    print(f"[trace] {spans} span(s) -> {path}" + (f"; {counters}" if counters else ""))
+
+
+def print_summary(results: List[BatchResult], skipped: List[BatchJob], total_elapsed: float) -> None:
+    """Print skipped files, per-file timings and sizes, then totals"""
+    for job in skipped:
+        print(f"[skip] {job.input_path} -> {job.output_path} (inputs unchanged)")
+
+    for result in results:
+        status = "ok" if result.ok else "error"
+        line = f"[{status}] {result.elapsed:7.2f}s {result.job.input_path} -> {result.job.output_path}"
+        if result.job.reason:
+            line += f" [{result.job.reason}]"
+        if result.error:
+            line += f" ({result.error})"
+        else:
+            line += (
+                f" {_format_size_change(result.previous_size, result.size)}"
+                f", {result.unique_images} unique image(s) for {result.image_references} reference(s)"
+            )
+        print(line)
+
+    compared = [result for result in results if result.ok and result.previous_size and result.size]
+    if compared:
+        before = sum(result.previous_size for result in compared)
+        after = sum(result.size for result in compared)
+        print(f"[size] {len(compared)} existing PDF(s): {_format_size_change(before, after)}")
+
+    rendered = [result for result in results if result.ok]
+    if rendered:
+        startups = [result.startup_time for result in results if result.startup_time]
+        font_bytes = sum(result.font_bytes for result in rendered)
+        hinted_bytes = sum(result.font_bytes_hinted for result in rendered)
+        saved = (1 - font_bytes / hinted_bytes) * 100 if hinted_bytes else 0.0
+        print(
+            f"[fonts] startup {max(startups, default=0.0):.2f}s per process, "
+            f"{font_bytes / len(rendered) / 1024:.1f} KiB embedded per PDF "
+            f"({hinted_bytes / len(rendered) / 1024:.1f} KiB with hinting, {saved:.1f}% saved), "
+            f"{sum(result.font_subsets_reused for result in rendered)}/"
+            f"{sum(result.font_subsets for result in rendered)} subset(s) reused"
+        )
+
+    # Peaks are measured in the process that rendered each PDF (a worker with -j)
+    peaks = [result.peak_memory for result in results if result.peak_memory]
+    if peaks:
+        print(f"[memory] peak RSS {max(peaks) / (1024 * 1024):.1f} MiB while rendering")
+
+    hits = sum(result.image_cache_hits for result in results)
+    misses = sum(result.image_cache_misses for result in results)
+    lookups = hits + misses
+    hit_rate = hits / lookups * 100 if lookups else 0.0
+    print(f"[cache] member images: {hits} hit(s), {misses} miss(es), {hit_rate:.1f}% hit rate")
+
+    failed = sum(1 for result in results if not result.ok)
+    print(
+        f"[summary] rendered {len(results) - failed}/{len(results)} PDF(s) "
+        f"in {total_elapsed:.2f}s, {failed} failure(s), {len(skipped)} skipped as unchanged"
+    )
+
+
+def main():
+    """Batch entry point rendering every script JSON under the given paths"""
+    parser = argparse.ArgumentParser(
+        description="Render many script JSON files to PDF in a single process."
+    )
+    parser.add_argument(
+        "sources",
+        nargs="+",
+        help="Script JSON files, directories (searched recursively) or glob patterns",
+    )
+    parser.add_argument(
+        "-o",
+        "--output-dir",
+        default=DEFAULT_OUTPUT_DIR,
+        help=f"Directory for generated PDFs (default: {DEFAULT_OUTPUT_DIR})",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes (default: 1, 0 uses every CPU core)",
+    )
+    parser.add_argument(
+        "--refresh-images",
+        action="store_true",
+        help="Revalidate cached remote images with conditional requests (ETag/Last-Modified)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Render every PDF even when its inputs are unchanged since the last build",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Build team tables lazily in small chunks to keep memory flat for very large scripts",
+    )
+    parser.add_argument(
+        "--trace",
+        metavar="PATH",
+        help="Record timing spans and counters to a Chrome trace (.json) or JSON lines (.jsonl) file",
+    )
+
+    args = parser.parse_args()
+    if args.jobs < 0:
+        parser.error("--jobs must be zero or a positive integer")
+    if args.trace:
+        enable_tracing()
+
+    jobs = collect_jobs(args.sources, args.output_dir)
+    if not jobs:
+        logging.error("No script JSON files found")
+        sys.exit(1)
+
+    started = time.perf_counter()
+    image_handler = ImageHandler()
+    fingerprinter = Fingerprinter(image_handler, streaming=args.stream)
+    if args.refresh_images:
+        # Revalidated images can change any job's inputs, so every job is checked before planning
+        prefetch_images(jobs, image_handler, revalidate=True)
+
+    manifest = BuildManifest()
+    jobs, skipped, fingerprints = plan_jobs(jobs, fingerprinter, manifest, force=args.force)
+    if jobs and not args.refresh_images:
+        # Only jobs that will render touch the network; up-to-date runs stay offline
+        prefetch_images(jobs, image_handler)
+        refresh_fingerprints(jobs, fingerprinter, fingerprints)
+
+    workers = min(args.jobs or os.cpu_count() or 1, len(jobs))
+    if not jobs:
+        results = []
+    elif workers > 1:
+        results = render_parallel(
+            jobs, workers, streaming=args.stream, trace=bool(args.trace), failed_urls=image_handler.failed_urls
+        )
+    else:
+        try:
+            renderer = create_renderer(image_handler, streaming=args.stream)
+        except Exception as e:
+            logging.error(f"An error occurred: {e}")
+            sys.exit(1)
+        results = renderer.render(jobs)
+
+    for result in results:
+        if result.ok and result.job.input_path in fingerprints:
+            manifest.record(result.job.output_path, fingerprints[result.job.input_path])
+        else:
+            manifest.forget(result.job.output_path)
+    manifest.save()
+
+    print_icon_report(image_handler.icon_index)
+    print_summary(results, skipped, time.perf_counter() - started)
+    if args.trace:
+        save_trace(args.trace, results)
+
+    if any(not result.ok for result in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+    main()
@@ -0,0 +1,307 @@
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import platform
+import functools
+import statistics
+import subprocess
+import tempfile
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import PIL
+import reportlab
+
+from .batch import DEFAULT_OUTPUT_DIR, collect_jobs, prefetch_images
+from .data_processor import load_script_json
+from .config import FontConfig
+from .fonts import clear_subset_cache
+from .image_cache import ProcessedImageCache
+from .image_handler import ImageHandler
+from .pdf_generator import FontManager, PDFGenerator
+from .styles import StyleManager
+
+BENCHMARK_VERSION = 1
+DEFAULT_SOURCES = ["assets/scripts/ko_KR"]
+DEFAULT_OUTPUT = ".cache/benchmark.json"
+SCENARIOS = ["cold", "warm"]
+
+# Reported in this order; "other" is whatever create_pdf spends outside the timed stages
+STAGES = ["process", "images", "optimize", "layout", "serialize", "other"]
+
+
+class StageTimer:
+    """Accumulates time per pipeline stage.
+
+    Stages nest (images are optimized while the layout pulls streamed tables,
+    the canvas is saved inside ``doc.build``), so each stage only counts the
+    time not already counted by a stage running inside it.
+    """
+
+    def __init__(self):
+        self.totals: Dict[str, float] = {}
+        # [stage, started, time spent in nested stages]
+        self._stack: List[List[Any]] = []
+
+    def wrap(self, target: Any, attribute: str, stage: str) -> None:
+        """Replace ``target.attribute`` with a version timed under ``stage``"""
+        original = getattr(target, attribute)
+
+        @functools.wraps(original)
+        def timed(*args, **kwargs):
+            self._stack.append([stage, time.perf_counter(), 0.0])
+            try:
+                return original(*args, **kwargs)
+            finally:
+                name, started, nested = self._stack.pop()
+                elapsed = time.perf_counter() - started
+                self.totals[name] = self.totals.get(name, 0.0) + elapsed - nested
+                if self._stack:
+                    self._stack[-1][2] += elapsed
+
+        setattr(target, attribute, timed)
+
+    def reset(self) -> None:
+        self.totals = {}
+
+
+def instrument(pdf_generator: PDFGenerator, timer: StageTimer) -> None:
+    """Time the stages of ``create_pdf`` on this generator instance only"""
+    timer.wrap(pdf_generator.data_processor, "validate_and_process_data", "process")
+    timer.wrap(pdf_generator.data_processor, "group_characters_by_team", "process")
+    timer.wrap(pdf_generator.image_handler, "prefetch", "images")
+    timer.wrap(pdf_generator.image_handler, "resolve_image_path", "images")
+    timer.wrap(pdf_generator.image_handler, "flush", "images")
+    timer.wrap(pdf_generator.table_builder, "get_team_image", "images")
+    # Decoding, resizing and JPEG encoding, or the processed cache lookup that replaces them
+    timer.wrap(pdf_generator.table_builder, "_load_processed_image", "optimize")
+
+    create_document = pdf_generator._create_document
+
+    def create_timed_document(output):
+        doc = create_document(output)
+        timer.wrap(doc, "build", "layout")
+        start_build = doc._startBuild
+
+        def start_timed_build(*args, **kwargs):
+            start_build(*args, **kwargs)
+            timer.wrap(doc.canv, "save", "serialize")
+
+        doc._startBuild = start_timed_build
+        return doc
+
+    pdf_generator._create_document = create_timed_document
+
+
+def create_instrumented_generator(processed_cache_dir: Optional[str] = None):
+    """Create a generator with its stages timed, returning it with its timer and startup time"""
+    started = time.perf_counter()
+    processed_cache = ProcessedImageCache(processed_cache_dir) if processed_cache_dir else None
+    pdf_generator = PDFGenerator(FontManager(FontConfig()), StyleManager(), ImageHandler(), processed_cache)
+    startup_time = time.perf_counter() - started
+    timer = StageTimer()
+    instrument(pdf_generator, timer)
+    return pdf_generator, timer, startup_time
+
+
+def measure(pdf_generator: PDFGenerator, timer: StageTimer, path: Path, streaming: bool) -> Dict[str, Any]:
+    """Render one script in memory and return its total and per-stage times"""
+    data = load_script_json(path)
+    timer.reset()
+    started = time.perf_counter()
+    try:
+        size = len(pdf_generator.create_pdf_bytes(data, streaming=streaming))
+        error = None
+    except Exception as e:
+        size = None
+        error = str(e)
+    total = time.perf_counter() - started
+    stages = {stage: timer.totals.get(stage, 0.0) for stage in STAGES}
+    stages["other"] = max(total - sum(stages.values()), 0.0)
+    return {"total": total, "stages": stages, "size": size, "error": error}
+
+
+def run_scenario(scenario: str, paths: List[str], repeat: int, streaming: bool) -> List[Dict[str, Any]]:
+    """Render every script ``repeat`` times and return one record per script.
+
+    cold: each render gets a new generator, an empty processed image cache and
+    no cached font subsets; font registration is only paid by the first render
+    in the process and is reported as ``startup``.
+    warm: one generator renders every script once untimed, then the timed runs.
+    """
+    runs: Dict[str, List[Dict[str, Any]]] = {path: [] for path in paths}
+    startups: Dict[str, float] = {}
+
+    if scenario == "cold":
+        for _ in range(repeat):
+            for path in paths:
+                with tempfile.TemporaryDirectory(prefix="pdf_gen_bench_") as processed_cache_dir:
+                    clear_subset_cache(os.path.join(processed_cache_dir, "fonts"))
+                    pdf_generator, timer, startup_time = create_instrumented_generator(processed_cache_dir)
+                    startups.setdefault(path, startup_time)
+                    runs[path].append(measure(pdf_generator, timer, Path(path), streaming))
+    else:
+        pdf_generator, timer, _ = create_instrumented_generator()
+        for path in paths:
+            measure(pdf_generator, timer, Path(path), streaming)
+        for _ in range(repeat):
+            for path in paths:
+                runs[path].append(measure(pdf_generator, timer, Path(path), streaming))
+
+    return [_summarize(path, runs[path], startups.get(path)) for path in paths]
+
+
+def _summarize(path: str, runs: List[Dict[str, Any]], startup_time: Optional[float]) -> Dict[str, Any]:
+    """Median of each stage over the runs of one script"""
+    record = {
+        "script": path,
+        "runs": len(runs),
+        "total": statistics.median(run["total"] for run in runs),
+        "min": min(run["total"] for run in runs),
+        "stages": {stage: statistics.median(run["stages"][stage] for run in runs) for stage in STAGES},
+        "size": runs[-1]["size"],
+    }
+    if startup_time is not None:
+        record["startup"] = startup_time
+    errors = [run["error"] for run in runs if run["error"]]
+    if errors:
+        record["error"] = errors[-1]
+    return record
+
+
+def scenario_totals(records: List[Dict[str, Any]]) -> Dict[str, float]:
+    """Sum of the per-script medians, overall and per stage"""
+    totals = {"total": sum(record["total"] for record in records)}
+    for stage in STAGES:
+        totals[stage] = sum(record["stages"][stage] for record in records)
+    return totals
+
+
+def environment() -> Dict[str, Any]:
+    """Where the numbers were taken, so results from different machines aren't mixed up"""
+    try:
+        revision = subprocess.run(
+            ["git", "describe", "--always", "--dirty"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        revision = None
+    return {
+        "revision": revision,
+        "python": platform.python_version(),
+        "reportlab": reportlab.Version,
+        "pillow": PIL.__version__,
+        "platform": platform.platform(),
+        "cpu_count": multiprocessing.cpu_count(),
+    }
+
+
+def print_report(results: Dict[str, Any]) -> None:
+    """Print per-stage totals and the slowest scripts of each scenario"""
+    for scenario, records in results["scenarios"].items():
+        totals = scenario_totals(records)
+        print(
+            f"[{scenario}] {len(records)} script(s), median of {results['repeat']} run(s): "
+            f"{totals['total']:.2f}s"
+        )
+        for stage in STAGES:
+            share = totals[stage] / totals["total"] * 100 if totals["total"] else 0.0
+            print(f"  {stage:<10} {totals[stage]:8.3f}s {share:5.1f}%")
+        startups = [record["startup"] for record in records if "startup" in record]
+        if startups:
+            print(f"  {'startup':<10} {max(startups):8.3f}s (first render in the process, not in total)")
+        for record in sorted(records, key=lambda record: record["total"], reverse=True)[:3]:
+            print(f"  slowest    {record['total']:8.3f}s {record['script']}")
+        for record in records:
+            if "error" in record:
+                print(f"[error] {scenario} {record['script']}: {record['error']}")
+
+
+def print_comparison(baseline: Dict[str, Any], results: Dict[str, Any]) -> None:
+    """Print stage-by-stage changes against an earlier result file, over the scripts both measured"""
+    print(f"[compare] {baseline['environment'].get('revision')} -> {results['environment'].get('revision')}")
+    for scenario, records in results["scenarios"].items():
+        before_records = {record["script"]: record for record in baseline["scenarios"].get(scenario, [])}
+        common = [record for record in records if record["script"] in before_records]
+        if not common:
+            continue
+        before = scenario_totals([before_records[record["script"]] for record in common])
+        after = scenario_totals(common)
+        for key in ["total"] + STAGES:
+            change = (after[key] - before[key]) / before[key] * 100 if before[key] else 0.0
+            print(f"  {scenario:<5} {key:<10} {before[key]:8.3f}s -> {after[key]:8.3f}s ({change:+6.1f}%)")
+
+
+def main():
+    """Benchmark entry point timing each stage of create_pdf over real scripts"""
+    parser = argparse.ArgumentParser(
+        description="Time data processing, images, optimization, layout and serialization of create_pdf."
+    )
+    parser.add_argument(
+        "sources",
+        nargs="*",
+        default=DEFAULT_SOURCES,
+        help=f"Script JSON files, directories or glob patterns (default: {' '.join(DEFAULT_SOURCES)})",
+    )
+    parser.add_argument("-o", "--output", default=DEFAULT_OUTPUT, help=f"Result JSON (default: {DEFAULT_OUTPUT})")
+    parser.add_argument(
+        "--scenario",
+        choices=SCENARIOS + ["all"],
+        default="all",
+        help="Caches to measure with (default: all)",
+    )
+    parser.add_argument("-n", "--repeat", type=int, default=3, help="Timed runs per script (default: 3)")
+    parser.add_argument("--stream", action="store_true", help="Benchmark the streaming rendering mode")
+    parser.add_argument("--compare", help="Earlier result JSON to compare against")
+
+    args = parser.parse_args()
+    if args.repeat < 1:
+        parser.error("--repeat must be a positive integer")
+
+    paths = [str(job.input_path) for job in collect_jobs(args.sources, DEFAULT_OUTPUT_DIR)]
+    if not paths:
+        logging.error("No script JSON files found")
+        sys.exit(1)
+
+    # Downloads are not part of any stage: fetch remote images before timing anything
+    prefetch_images(collect_jobs(paths, DEFAULT_OUTPUT_DIR), ImageHandler())
+
+    scenarios = SCENARIOS if args.scenario == "all" else [args.scenario]
+    results = {
+        "version": BENCHMARK_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "environment": environment(),
+        "repeat": args.repeat,
+        "streaming": args.stream,
+        "scenarios": {},
+    }
+    for scenario in scenarios:
+        logging.info(f"Running {scenario} scenario over {len(paths)} script(s)")
+        # A fresh interpreter per scenario, so neither inherits the other's fonts or caches
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+            results["scenarios"][scenario] = executor.submit(
+                run_scenario, scenario, paths, args.repeat, args.stream
+            ).result()
+
+    output_path = Path(args.output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(results, ensure_ascii=False, indent=1), encoding="utf-8")
+
+    print_report(results)
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            print_comparison(json.load(f), results)
+    print(f"[saved] {output_path}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+    main()
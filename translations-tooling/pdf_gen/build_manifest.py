@@ -0,0 +1,183 @@
+import os
+import json
+import hashlib
+import logging
+from dataclasses import dataclass, asdict, fields
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from . import constants
+from .config import FontConfig
+from .constants import ASSETS_IMAGES_PATH, BUILD_MANIFEST_PATH, META_ID, PDF_GENERATOR_VERSION, VALID_TEAMS
+from .data_processor import primary_image_url
+from .image_handler import ImageHandler
+
+MANIFEST_VERSION = 1
+
+# Constants that tune caching and downloads without changing what ends up in a PDF
+RUNTIME_ONLY_CONSTANTS = {
+    "DOWNLOAD_MAX_WORKERS",
+    "DOWNLOAD_TIMEOUT",
+    "IMAGE_CACHE_MAX_BYTES",
+    "PROCESSED_CACHE_DIR",
+    "PROCESSED_CACHE_MAX_ENTRIES",
+    "MEMBER_IMAGE_LRU_SIZE",
+    "FONT_CACHE_DIR",
+    "FONT_CACHE_MAX_ENTRIES",
+    "PDF_GENERATOR_VERSION",
+    "BUILD_MANIFEST_PATH",
+    "SERVER_MAX_BODY_BYTES",
+    "SERVER_QUEUE_SIZE",
+}
+
+
+@dataclass
+class InputFingerprint:
+    """Digests of everything that goes into one rendered PDF"""
+    script: str
+    images: str
+    fonts: str
+    layout: str
+    version: int = PDF_GENERATOR_VERSION
+    # --stream splits team tables into chunks, which can move page breaks
+    streaming: bool = False
+
+    def changed_fields(self, other: "InputFingerprint") -> List[str]:
+        """Names of the inputs that differ from another fingerprint"""
+        return [f.name for f in fields(self) if getattr(self, f.name) != getattr(other, f.name)]
+
+
+class Fingerprinter:
+    """Computes input fingerprints, hashing each file once per process"""
+
+    def __init__(
+        self, image_handler: ImageHandler, font_config: Optional[FontConfig] = None, streaming: bool = False
+    ):
+        self.image_handler = image_handler
+        self.streaming = streaming
+        self._file_digests: Dict[Path, Tuple[int, int, str]] = {}
+        font_config = font_config or FontConfig()
+        self.fonts_digest = self._combine(
+            f"{f.name}={self._file_digest(Path(getattr(font_config, f.name)))}" for f in fields(font_config)
+        )
+        self.layout_digest = layout_digest()
+
+    def fingerprint(self, script_path: Path, items: List[Dict[str, Any]]) -> InputFingerprint:
+        """Fingerprint a script JSON and every icon and team image it references"""
+        images = []
+        teams = set()
+        for item in items:
+            if not isinstance(item, dict) or item.get("id") == META_ID:
+                continue
+            character_id = item.get("id", "")
+            icon_path = self.image_handler.icon_index.resolve(character_id) if character_id else None
+            if icon_path:
+                images.append(f"{character_id}={self._file_digest(icon_path)}")
+            else:
+                images.append(f"{character_id}={self._remote_digest(primary_image_url(item.get('image')))}")
+            if item.get("team") in VALID_TEAMS:
+                teams.add(item["team"])
+        for team in sorted(teams):
+            images.append(f"team:{team}={self._file_digest(Path(ASSETS_IMAGES_PATH) / f'{team}.png')}")
+
+        return InputFingerprint(
+            script=self._file_digest(script_path),
+            images=self._combine(images),
+            fonts=self.fonts_digest,
+            layout=self.layout_digest,
+            streaming=self.streaming,
+        )
+
+    def _remote_digest(self, url: Optional[str]) -> str:
+        """Content hash of a downloaded image, or the URL itself until it is cached"""
+        if not url:
+            return "none"
+        entry = self.image_handler.cache_index.get(url)
+        if entry and entry.content_hash:
+            return entry.content_hash
+        return f"uncached:{url}"
+
+    def _file_digest(self, path: Path) -> str:
+        try:
+            stat = path.stat()
+        except OSError:
+            return "missing"
+        memo = self._file_digests.get(path)
+        if memo and memo[:2] == (stat.st_mtime_ns, stat.st_size):
+            return memo[2]
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        self._file_digests[path] = (stat.st_mtime_ns, stat.st_size, digest)
+        return digest
+
+    @staticmethod
+    def _combine(parts) -> str:
+        return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+def layout_digest() -> str:
+    """Digest of the layout values in constants.py"""
+    values = [
+        f"{name}={getattr(constants, name)!r}"
+        for name in sorted(vars(constants))
+        if name.isupper() and name not in RUNTIME_ONLY_CONSTANTS
+    ]
+    return hashlib.sha256("\n".join(values).encode("utf-8")).hexdigest()
+
+
+class BuildManifest:
+    """Fingerprints of the inputs each PDF was last rendered from"""
+
+    def __init__(self, path: str = BUILD_MANIFEST_PATH):
+        self.path = Path(path)
+        self._entries: Dict[str, InputFingerprint] = self._load()
+        self._dirty = False
+
+    def rebuild_reason(self, output_path: Path, fingerprint: InputFingerprint) -> Optional[str]:
+        """Why an output must be rendered again, or None when it is up to date"""
+        previous = self._entries.get(str(output_path))
+        if previous is None:
+            return "not built before"
+        if not output_path.exists():
+            return "output missing"
+        changed = previous.changed_fields(fingerprint)
+        if changed:
+            return f"{', '.join(changed)} changed"
+        return None
+
+    def record(self, output_path: Path, fingerprint: InputFingerprint) -> None:
+        self._entries[str(output_path)] = fingerprint
+        self._dirty = True
+
+    def forget(self, output_path: Path) -> None:
+        if self._entries.pop(str(output_path), None) is not None:
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the manifest atomically"""
+        if not self._dirty:
+            return
+        payload = {
+            "version": MANIFEST_VERSION,
+            "outputs": {key: asdict(value) for key, value in sorted(self._entries.items())},
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(payload, ensure_ascii=False, indent=1), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+    def _load(self) -> Dict[str, InputFingerprint]:
+        try:
+            raw = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logging.warning(f"Ignoring unreadable build manifest {self.path}: {e}")
+            return {}
+        if raw.get("version") != MANIFEST_VERSION:
+            return {}
+        try:
+            return {key: InputFingerprint(**values) for key, values in raw.get("outputs", {}).items()}
+        except TypeError as e:
+            logging.warning(f"Ignoring malformed build manifest {self.path}: {e}")
+            return {}
@@ -0,0 +1,80 @@
+import sys
+import time
+import logging
+import argparse
+from pathlib import Path
+
+from .cache_index import CacheIndex
+from .constants import IMAGE_CACHE_MAX_BYTES, PROCESSED_CACHE_DIR
+
+
+def _format_bytes(size: int) -> str:
+    return f"{size / (1024 * 1024):.1f} MiB"
+
+
+def _format_time(timestamp) -> str:
+    if timestamp is None:
+        return "-"
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(timestamp))
+
+
+def print_stats(cache_dir: Path) -> None:
+    """Print download and processed cache usage"""
+    stats = CacheIndex(cache_dir).stats()
+    formats = ", ".join(f"{name}={count}" for name, count in sorted(stats.formats.items())) or "-"
+    print(f"[cache] {cache_dir}: {stats.entries} image(s), {_format_bytes(stats.total_bytes)}")
+    print(f"[cache] formats: {formats}")
+    print(f"[cache] last access: oldest {_format_time(stats.oldest_access)}, newest {_format_time(stats.newest_access)}")
+
+    processed_dir = Path(PROCESSED_CACHE_DIR)
+    if processed_dir.exists():
+        processed = [path.stat().st_size for path in processed_dir.glob("*.jpg")]
+        print(f"[cache] {processed_dir}: {len(processed)} processed icon(s), {_format_bytes(sum(processed))}")
+
+
+def prune(cache_dir: Path, max_bytes: int) -> None:
+    """Evict least recently used images until the cache fits the size cap"""
+    index = CacheIndex(cache_dir)
+    evicted = index.evict(max_bytes)
+    index.save()
+    freed = sum(entry.size for entry in evicted)
+    print(f"[cache] pruned {len(evicted)} image(s), freed {_format_bytes(freed)}")
+    print(f"[cache] now {index.stats().entries} image(s), {_format_bytes(index.stats().total_bytes)}")
+
+
+def main():
+    """Inspect or prune the pdf_gen image cache"""
+    parser = argparse.ArgumentParser(description="Inspect or prune the pdf_gen image cache.")
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=Path(".cache"),
+        help="Image cache directory (default: .cache)",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("stats", help="Show cache size, entry count and formats")
+    prune_parser = subparsers.add_parser("prune", help="Evict least recently used images")
+    prune_parser.add_argument(
+        "--max-mb",
+        type=float,
+        default=IMAGE_CACHE_MAX_BYTES / (1024 * 1024),
+        help=f"Size cap in MiB (default: {IMAGE_CACHE_MAX_BYTES // (1024 * 1024)})",
+    )
+
+    args = parser.parse_args()
+    if not args.cache_dir.is_dir():
+        logging.error(f"Cache directory not found: {args.cache_dir}")
+        sys.exit(1)
+
+    if args.command == "stats":
+        print_stats(args.cache_dir)
+    else:
+        prune(args.cache_dir, int(args.max_mb * 1024 * 1024))
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+    main()
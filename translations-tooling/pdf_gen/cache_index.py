@@ -0,0 +1,230 @@
+import os
+import json
+import time
+import hashlib
+import logging
+from collections import Counter
+from dataclasses import dataclass, asdict, field
+from pathlib import Path
+from typing import Dict, List, Optional
+from PIL import Image
+
+from .downloader import Validators
+
+INDEX_FILE = "index.json"
+LEGACY_VALIDATORS_FILE = "http_validators.json"
+INDEX_VERSION = 1
+
+
+def url_key(url: str) -> str:
+    """Key used for a URL in the index and as the cached file's stem"""
+    return hashlib.md5(url.encode()).hexdigest()
+
+
+@dataclass
+class CacheEntry:
+    """Index record for one downloaded image"""
+    filename: str
+    url: Optional[str] = None
+    content_hash: Optional[str] = None
+    size: int = 0
+    format: Optional[str] = None
+    last_access: float = field(default_factory=time.time)
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @property
+    def validators(self) -> Optional[Validators]:
+        if not self.etag and not self.last_modified:
+            return None
+        return Validators(etag=self.etag, last_modified=self.last_modified)
+
+
+@dataclass
+class CacheIndexStats:
+    """Summary of the download cache"""
+    entries: int
+    total_bytes: int
+    formats: Dict[str, int]
+    oldest_access: Optional[float]
+    newest_access: Optional[float]
+
+
+class CacheIndex:
+    """JSON manifest of the download cache with O(1) lookups and LRU eviction by size"""
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = Path(cache_dir)
+        self.path = self.cache_dir / INDEX_FILE
+        self._entries: Dict[str, CacheEntry] = {}
+        self._total_bytes = 0
+        self._dirty = False
+        self._legacy_validators_path: Optional[Path] = None
+        self._load()
+
+    def contains(self, url: str) -> bool:
+        """Whether the URL is cached, without touching the filesystem"""
+        return url_key(url) in self._entries
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        return self._entries.get(url_key(url))
+
+    def path_for(self, entry: CacheEntry) -> Path:
+        return self.cache_dir / entry.filename
+
+    def touch(self, url: str) -> None:
+        """Mark a cached URL as just used"""
+        entry = self.get(url)
+        if entry:
+            entry.last_access = time.time()
+            self._dirty = True
+
+    def record(
+        self,
+        url: str,
+        filename: str,
+        data: bytes,
+        image_format: Optional[str],
+        validators: Optional[Validators] = None
+    ) -> CacheEntry:
+        """Add or replace the entry for a freshly downloaded URL"""
+        key = url_key(url)
+        previous = self._entries.get(key)
+        if previous:
+            self._total_bytes -= previous.size
+
+        entry = CacheEntry(
+            filename=filename,
+            url=url,
+            content_hash=hashlib.sha256(data).hexdigest(),
+            size=len(data),
+            format=image_format,
+            etag=validators.etag if validators else None,
+            last_modified=validators.last_modified if validators else None,
+        )
+        self._entries[key] = entry
+        self._total_bytes += entry.size
+        self._dirty = True
+        return entry
+
+    def evict(self, max_bytes: int) -> List[CacheEntry]:
+        """Delete least recently used files until the cache fits in ``max_bytes``"""
+        evicted: List[CacheEntry] = []
+        if self._total_bytes <= max_bytes:
+            return evicted
+
+        for key, entry in sorted(self._entries.items(), key=lambda item: item[1].last_access):
+            if self._total_bytes <= max_bytes:
+                break
+            self.path_for(entry).unlink(missing_ok=True)
+            del self._entries[key]
+            self._total_bytes -= entry.size
+            evicted.append(entry)
+
+        if evicted:
+            self._dirty = True
+            logging.info(f"Evicted {len(evicted)} cached image(s) to stay under {max_bytes} bytes")
+        return evicted
+
+    def stats(self) -> CacheIndexStats:
+        accesses = [entry.last_access for entry in self._entries.values()]
+        formats = Counter(entry.format or "unknown" for entry in self._entries.values())
+        return CacheIndexStats(
+            entries=len(self._entries),
+            total_bytes=self._total_bytes,
+            formats=dict(formats),
+            oldest_access=min(accesses) if accesses else None,
+            newest_access=max(accesses) if accesses else None,
+        )
+
+    def save(self) -> None:
+        """Write the index atomically, merging entries other processes added meanwhile"""
+        if not self._dirty:
+            return
+
+        for key, entry in self._read_entries().items():
+            current = self._entries.get(key)
+            if current is None and self.path_for(entry).exists():
+                self._entries[key] = entry
+                self._total_bytes += entry.size
+            elif current is not None and current.filename == entry.filename:
+                current.last_access = max(current.last_access, entry.last_access)
+
+        payload = {
+            "version": INDEX_VERSION,
+            "entries": {key: asdict(entry) for key, entry in self._entries.items()},
+        }
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(payload, ensure_ascii=False, indent=1), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+        if self._legacy_validators_path:
+            self._legacy_validators_path.unlink(missing_ok=True)
+            self._legacy_validators_path = None
+
+    def _read_entries(self) -> Dict[str, CacheEntry]:
+        try:
+            raw = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logging.warning(f"Ignoring unreadable cache index {self.path}: {e}")
+            return {}
+        if raw.get("version") != INDEX_VERSION:
+            return {}
+        return {key: CacheEntry(**values) for key, values in raw.get("entries", {}).items()}
+
+    def _load(self) -> None:
+        """Load the index and reconcile it with the files actually on disk"""
+        entries = self._read_entries()
+        files = {
+            item.name: item.stat().st_size
+            for item in os.scandir(self.cache_dir)
+            if item.is_file() and not item.name.endswith((".json", ".tmp"))
+        }
+
+        # Drop entries whose file disappeared, adopt files the index does not know yet
+        self._entries = {key: entry for key, entry in entries.items() if entry.filename in files}
+        known = {entry.filename for entry in self._entries.values()}
+        for filename, size in files.items():
+            if filename in known:
+                continue
+            path = self.cache_dir / filename
+            self._entries[Path(filename).stem] = CacheEntry(
+                filename=filename,
+                size=size,
+                format=_sniff_format(path),
+                last_access=os.path.getmtime(path),
+            )
+        self._total_bytes = sum(entry.size for entry in self._entries.values())
+        self._dirty = self._entries.keys() != entries.keys()
+
+        self._migrate_legacy_validators()
+
+    def _migrate_legacy_validators(self) -> None:
+        legacy_path = self.cache_dir / LEGACY_VALIDATORS_FILE
+        if not legacy_path.exists():
+            return
+        try:
+            legacy = json.loads(legacy_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            legacy = {}
+        for url, values in legacy.items():
+            entry = self._entries.get(url_key(url))
+            if entry:
+                entry.url = entry.url or url
+                entry.etag = values.get("etag")
+                entry.last_modified = values.get("last_modified")
+        # Removed once the merged index has been written
+        self._legacy_validators_path = legacy_path
+        self._dirty = True
+
+
+def _sniff_format(path: Path) -> Optional[str]:
+    """Read just the image header to find its format"""
+    try:
+        with Image.open(path) as image:
+            return image.format
+    except Exception:
+        return None
@@ -32,6 +32,37 @@ COLOR_SECONDARY: Final = HexColor("#999999")
 # Image quality
 JPEG_QUALITY: Final = 85
 
+# Remote image downloads
+DOWNLOAD_MAX_WORKERS: Final = 8
+DOWNLOAD_TIMEOUT: Final = 10
+IMAGE_CACHE_MAX_BYTES: Final = 200 * 1024 * 1024
+
+# Processed member image cache
+PROCESSED_CACHE_DIR: Final = ".cache/processed"
+PROCESSED_CACHE_MAX_ENTRIES: Final = 2000
+
+# In-memory member image cache (encoded bytes per character id)
+MEMBER_IMAGE_LRU_SIZE: Final = 512
+
+# Incremental batch builds; bump the version when rendering changes in ways the inputs don't capture
+PDF_GENERATOR_VERSION: Final = 1
+BUILD_MANIFEST_PATH: Final = ".cache/pdf_manifest.json"
+
+# Embedded font subsets reused across documents (hint-stripped TTF bytes)
+FONT_SUBSET_CACHE_SIZE: Final = 64
+
+# The same subsets persisted across runs, keyed by font file content and glyphs
+FONT_CACHE_DIR: Final = ".cache/fonts"
+FONT_CACHE_MAX_ENTRIES: Final = 512
+
+# Streaming rendering: rows per lazily built team table, image readers kept alive per document
+STREAM_TABLE_ROWS: Final = 16
+STREAM_SHARED_IMAGES: Final = 16
+
+# Render server: largest accepted script JSON, requests allowed to wait for a worker
+SERVER_MAX_BODY_BYTES: Final = 1024 * 1024
+SERVER_QUEUE_SIZE: Final = 8
+
 # File paths
 ASSETS_IMAGES_PATH: Final = "assets/images"
 ASSETS_ICONS_PATH: Final = "assets/icons"
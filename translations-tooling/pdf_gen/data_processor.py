@@ -1,10 +1,29 @@
+import json
 import logging
-from typing import List, Dict, Any, Optional
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Union
 from .models import CharacterData, MetaData, PDFData, TeamType, TeamSection
 from .constants import VALID_TEAMS, META_ID
 from .exceptions import DataValidationError
 
 
+def primary_image_url(image: Any) -> Optional[str]:
+    """URL to render for a script item's ``image``, which may list alignment variants"""
+    if isinstance(image, list):
+        image = image[0] if image else None
+    return image if isinstance(image, str) and image else None
+
+
+def load_script_json(path: Union[str, Path]) -> List[Dict[str, Any]]:
+    """Load a script JSON file, wrapping single objects in a list"""
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    if not isinstance(data, list):
+        data = [data]
+    return data
+
+
 class DataProcessor:
     """Handles data processing and validation for PDF generation"""
     
@@ -56,7 +75,7 @@ class DataProcessor:
                     name=item.get("name", "N/A"),
                     ability=item.get("ability", "N/A"),
                     team=TeamType(team),
-                    image_url=item.get("image")
+                    image_url=primary_image_url(item.get("image"))
                 )
                 characters.append(character)
             except ValueError as e:
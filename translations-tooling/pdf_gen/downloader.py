@@ -0,0 +1,85 @@
+import logging
+import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional
+from requests.adapters import HTTPAdapter
+
+from .constants import DOWNLOAD_MAX_WORKERS, DOWNLOAD_TIMEOUT
+
+
+@dataclass
+class Validators:
+    """HTTP cache validators remembered for a downloaded URL"""
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def to_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+@dataclass
+class DownloadResult:
+    """Outcome of fetching a single URL"""
+    url: str
+    content: Optional[bytes] = None
+    not_modified: bool = False
+    validators: Optional[Validators] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class ImageDownloader:
+    """Fetches remote images concurrently over a pooled session with conditional requests"""
+
+    def __init__(self, max_workers: int = DOWNLOAD_MAX_WORKERS, timeout: float = DOWNLOAD_TIMEOUT):
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def fetch(self, url: str, validators: Optional[Validators] = None) -> DownloadResult:
+        """Fetch a URL, sending If-None-Match/If-Modified-Since when validators are known"""
+        headers = validators.to_headers() if validators else {}
+        try:
+            response = self.session.get(url, headers=headers, timeout=self.timeout)
+            if response.status_code == 304 and validators:
+                return DownloadResult(url, not_modified=True, validators=validators)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            return DownloadResult(url, error=str(e))
+
+        return DownloadResult(
+            url,
+            content=response.content,
+            validators=Validators(
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            ),
+        )
+
+    def fetch_all(self, targets: Dict[str, Optional[Validators]]) -> Iterable[DownloadResult]:
+        """Fetch many URLs concurrently, yielding results as they complete"""
+        if not targets:
+            return
+        workers = min(self.max_workers, len(targets))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(self.fetch, url, validators) for url, validators in targets.items()]
+            for future in as_completed(futures):
+                result = future.result()
+                if not result.ok:
+                    logging.error(f"Error downloading image from {result.url}: {result.error}")
+                yield result
+
+    def close(self) -> None:
+        self.session.close()
@@ -0,0 +1,100 @@
+import hashlib
+from collections import OrderedDict
+from io import BytesIO
+from typing import Iterable, Optional
+
+from reportlab.lib.utils import ImageReader
+from reportlab.platypus import Flowable
+
+from .tracing import count
+
+
+def content_digest(data: bytes) -> str:
+    """Stable digest used to identify identical image streams"""
+    return hashlib.sha1(data).hexdigest()
+
+
+class SharedImage(Flowable):
+    """Image flowable drawn from a reader shared by every identical image in a document.
+
+    ReportLab registers image XObjects under a digest of their decoded pixels,
+    so identical icons are written once; sharing the reader means the pixels
+    are decoded (and digested) once per distinct image instead of once per
+    occurrence.
+    """
+
+    def __init__(self, reader: ImageReader, width: float, height: float):
+        super().__init__()
+        self.reader = reader
+        self.drawWidth = width
+        self.drawHeight = height
+        self.hAlign = "CENTER"
+
+    def wrap(self, availWidth, availHeight):
+        return self.drawWidth, self.drawHeight
+
+    def draw(self):
+        self.canv.drawImage(self.reader, 0, 0, self.drawWidth, self.drawHeight, mask="auto")
+
+
+class SharedImageRegistry:
+    """Hands out one ImageReader per distinct image stream within a document.
+
+    With ``max_readers`` set only the most recently used readers are kept, so
+    decoded pixels of images already drawn can be released while streaming.
+    """
+
+    def __init__(self, max_readers: Optional[int] = None):
+        self._readers: "OrderedDict[str, ImageReader]" = OrderedDict()
+        self._digests = set()
+        self.max_readers = max_readers
+        self.references = 0
+
+    def create_image(self, image_bytes: bytes, width: float, height: float) -> SharedImage:
+        """Create a flowable, reusing the reader of an identical earlier image"""
+        digest = content_digest(image_bytes)
+        reader = self._readers.get(digest)
+        if reader is None:
+            reader = ImageReader(BytesIO(image_bytes))
+            self._readers[digest] = reader
+            if digest not in self._digests:
+                self._digests.add(digest)
+                count("embedded_image_bytes", len(image_bytes))
+            if self.max_readers is not None and len(self._readers) > self.max_readers:
+                self._readers.popitem(last=False)
+        else:
+            self._readers.move_to_end(digest)
+        self.references += 1
+        return SharedImage(reader, width, height)
+
+    @property
+    def unique_images(self) -> int:
+        return len(self._digests)
+
+
+class LazyFlowables(list):
+    """Flowable list for ``doc.build`` that pulls items from an iterator as layout reaches them.
+
+    ReportLab consumes the story from the front (``len()``, ``[0]``, ``del [0]``
+    and re-inserting split remainders), so only the next flowable, plus any run
+    chained by keepWithNext, has to exist at a time.
+    """
+
+    def __init__(self, flowables: Iterable[Flowable]):
+        super().__init__()
+        self._pending = iter(flowables)
+
+    def __len__(self):
+        self._fill()
+        return super().__len__()
+
+    def __getitem__(self, index):
+        self._fill()
+        return super().__getitem__(index)
+
+    def _fill(self) -> None:
+        while not super().__len__() or super().__getitem__(-1).getKeepWithNext():
+            flowable = next(self._pending, None)
+            if flowable is None:
+                return
+            self.append(flowable)
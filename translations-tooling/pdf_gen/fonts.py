@@ -0,0 +1,289 @@
+import os
+import time
+import struct
+import hashlib
+import logging
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont, TTFontFace, TTFontMaker
+
+from .constants import FONT_CACHE_DIR, FONT_CACHE_MAX_ENTRIES, FONT_SUBSET_CACHE_SIZE
+from .image_cache import LRUCache
+from .tracing import count
+
+# Bump when subsetting or hint stripping changes so stale cached subsets are ignored
+FONT_SUBSET_VERSION = 1
+
+# Tables holding TrueType hinting programs; PDF viewers rasterize fine without them
+HINTING_TABLES = ("cvt ", "fpgm", "prep")
+
+# Composite glyph flags (see the OpenType 'glyf' specification)
+ARG_1_AND_2_ARE_WORDS = 0x0001
+WE_HAVE_A_SCALE = 0x0008
+MORE_COMPONENTS = 0x0020
+WE_HAVE_AN_X_AND_Y_SCALE = 0x0040
+WE_HAVE_A_TWO_BY_TWO = 0x0080
+WE_HAVE_INSTRUCTIONS = 0x0100
+
+
+@dataclass
+class FontSubsetStats:
+    """Counters for font subsets embedded by this process"""
+    subsets: int = 0
+    reused: int = 0
+    hinted_bytes: int = 0
+    embedded_bytes: int = 0
+
+
+class FontSubsetCache:
+    """On-disk cache of hint-stripped subset bytes, keyed by font file content and code points"""
+
+    def __init__(self, cache_dir: str = FONT_CACHE_DIR, max_entries: int = FONT_CACHE_MAX_ENTRIES):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self._entry_count = sum(1 for _ in self.cache_dir.glob("*.subset"))
+        # Source digests memoized by (mtime, size) so unchanged fonts are hashed once per process
+        self._source_digests: Dict[Path, Tuple[int, int, str]] = {}
+        self._lock = threading.Lock()
+
+    def make_key(self, source: Path, subset: List[int]) -> str:
+        """Build a cache key from the font file hash and the ordered code points"""
+        source_digest = self._source_digest(Path(source))
+        code_points = ",".join(map(str, subset))
+        return hashlib.sha256(f"v{FONT_SUBSET_VERSION}:{source_digest}:{code_points}".encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[Tuple[int, bytes]]:
+        """Return (size with hinting, stripped bytes) for a key, refreshing its access time"""
+        path = self._entry_path(key)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        if len(data) < 4:
+            return None
+        os.utime(path)
+        return struct.unpack(">L", data[:4])[0], data[4:]
+
+    def put(self, key: str, hinted_size: int, data: bytes) -> None:
+        """Store a subset and evict the oldest entries beyond the limit"""
+        path = self._entry_path(key)
+        existed = path.exists()
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            tmp_path.write_bytes(struct.pack(">L", hinted_size) + data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logging.warning(f"Could not write font subset cache entry {path}: {e}")
+            tmp_path.unlink(missing_ok=True)
+            return
+
+        with self._lock:
+            if not existed:
+                self._entry_count += 1
+            if self._entry_count > self.max_entries:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until the cache is within its limit"""
+        entries = []
+        for path in self.cache_dir.glob("*.subset"):
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except FileNotFoundError:
+                continue
+        entries.sort()
+
+        excess = len(entries) - self.max_entries
+        for _, path in entries[:max(excess, 0)]:
+            path.unlink(missing_ok=True)
+        self._entry_count = min(len(entries), self.max_entries)
+        if excess > 0:
+            logging.info(f"Evicted {excess} font subset cache entries")
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.subset"
+
+    def _source_digest(self, source: Path) -> str:
+        stat = source.stat()
+        memo = self._source_digests.get(source)
+        if memo and memo[0] == stat.st_mtime_ns and memo[1] == stat.st_size:
+            return memo[2]
+
+        digest = hashlib.sha256(source.read_bytes()).hexdigest()
+        self._source_digests[source] = (stat.st_mtime_ns, stat.st_size, digest)
+        return digest
+
+
+# (font file, code points) -> (size with hinting, stripped subset bytes)
+_subset_cache: LRUCache[Tuple[str, Tuple[int, ...]], Tuple[int, bytes]] = LRUCache(FONT_SUBSET_CACHE_SIZE)
+# Created on first use so importing the module does not touch the filesystem
+_disk_cache: Optional[FontSubsetCache] = None
+_disk_cache_dir: str = FONT_CACHE_DIR
+_disk_cache_lock = threading.Lock()
+_subset_stats = FontSubsetStats()
+_subset_stats_lock = threading.Lock()
+
+
+def font_subset_stats() -> FontSubsetStats:
+    """Snapshot of the subset counters, for diffing around a render"""
+    with _subset_stats_lock:
+        return FontSubsetStats(**vars(_subset_stats))
+
+
+def clear_subset_cache(disk_cache_dir: Optional[str] = None) -> None:
+    """Forget every in-memory subset so the next documents embed fonts from scratch.
+
+    ``disk_cache_dir`` moves the on-disk cache (an empty directory gives a cold
+    run); without it the persisted subsets are still used.
+    """
+    global _subset_cache, _disk_cache, _disk_cache_dir
+    _subset_cache = LRUCache(FONT_SUBSET_CACHE_SIZE)
+    if disk_cache_dir is not None:
+        _disk_cache, _disk_cache_dir = None, disk_cache_dir
+
+
+def _subset_disk_cache() -> FontSubsetCache:
+    global _disk_cache
+    with _disk_cache_lock:
+        if _disk_cache is None:
+            _disk_cache = FontSubsetCache(_disk_cache_dir)
+        return _disk_cache
+
+
+class SubsetTTFontFace(TTFontFace):
+    """TrueType face whose embedded subsets drop hinting and are shared across documents and runs"""
+
+    def makeSubset(self, subset):
+        key = (self.filename, tuple(subset))
+        cached = _subset_cache.get(key)
+        reused = cached is not None
+        if not reused:
+            disk_cache = _subset_disk_cache()
+            disk_key = disk_cache.make_key(self.filename, subset)
+            cached = disk_cache.get(disk_key)
+            if cached is not None:
+                count("font_subset_disk_hits")
+                reused = True
+            else:
+                hinted = super().makeSubset(subset)
+                cached = (len(hinted), strip_hinting(hinted))
+                disk_cache.put(disk_key, *cached)
+            _subset_cache.put(key, cached)
+        hinted_size, data = cached
+
+        with _subset_stats_lock:
+            _subset_stats.subsets += 1
+            _subset_stats.reused += reused
+            _subset_stats.hinted_bytes += hinted_size
+            _subset_stats.embedded_bytes += len(data)
+        count("embedded_font_bytes", len(data))
+        return data
+
+
+class SubsetTTFont(TTFont):
+    """TTFont embedding hint-free subsets through SubsetTTFontFace"""
+
+    def __init__(self, name: str, filename: str, **kwargs):
+        super().__init__(name, filename, **kwargs)
+        # Same parsed face, only the subset writer differs; avoids parsing the file twice
+        self.face.__class__ = SubsetTTFontFace
+
+
+def strip_hinting(font_data: bytes) -> bytes:
+    """Rebuild a TrueType font without hinting tables and per-glyph instructions"""
+    tables = _read_tables(font_data)
+    head = tables["head"]
+    long_offsets = struct.unpack(">h", head[50:52])[0] == 1
+    loca = tables["loca"]
+    if long_offsets:
+        offsets = struct.unpack(f">{len(loca) // 4}L", loca)
+    else:
+        offsets = [offset * 2 for offset in struct.unpack(f">{len(loca) // 2}H", loca)]
+
+    glyf = tables["glyf"]
+    glyphs = []
+    new_offsets = [0]
+    for start, end in zip(offsets, offsets[1:]):
+        glyph = _strip_glyph_instructions(glyf[start:end]) if end > start else b""
+        glyph += b"\0" * (-len(glyph) % 4)
+        glyphs.append(glyph)
+        new_offsets.append(new_offsets[-1] + len(glyph))
+
+    output = TTFontMaker()
+    for tag, data in tables.items():
+        if tag not in HINTING_TABLES and tag not in ("glyf", "loca", "head", "maxp"):
+            output.add(tag, data)
+
+    output.add("glyf", b"".join(glyphs))
+    if new_offsets[-1] >> 1 > 0xFFFF:
+        output.add("loca", struct.pack(f">{len(new_offsets)}L", *new_offsets))
+        index_to_loc_format = 1
+    else:
+        output.add("loca", struct.pack(f">{len(new_offsets)}H", *(offset >> 1 for offset in new_offsets)))
+        index_to_loc_format = 0
+    output.add("head", head[:50] + struct.pack(">h", index_to_loc_format) + head[52:])
+
+    maxp = tables["maxp"]
+    if len(maxp) >= 32:
+        # maxSizeOfInstructions
+        maxp = maxp[:26] + b"\0\0" + maxp[28:]
+    output.add("maxp", maxp)
+    return output.makeStream()
+
+
+def _read_tables(font_data: bytes) -> Dict[str, bytes]:
+    num_tables = struct.unpack(">H", font_data[4:6])[0]
+    tables = {}
+    for index in range(num_tables):
+        entry = 12 + index * 16
+        tag = font_data[entry:entry + 4].decode("latin1")
+        offset, length = struct.unpack(">LL", font_data[entry + 8:entry + 16])
+        tables[tag] = font_data[offset:offset + length]
+    return tables
+
+
+def _strip_glyph_instructions(glyph: bytes) -> bytes:
+    number_of_contours = struct.unpack(">h", glyph[:2])[0]
+    if number_of_contours >= 0:
+        length_pos = 10 + 2 * number_of_contours
+        instruction_length = struct.unpack(">H", glyph[length_pos:length_pos + 2])[0]
+        return glyph[:length_pos] + b"\0\0" + glyph[length_pos + 2 + instruction_length:]
+
+    # Composite glyph: instructions follow the last component when any component flags them
+    data = bytearray(glyph)
+    has_instructions = False
+    pos = 10
+    flags = MORE_COMPONENTS
+    while flags & MORE_COMPONENTS:
+        flags = struct.unpack(">H", data[pos:pos + 2])[0]
+        has_instructions |= bool(flags & WE_HAVE_INSTRUCTIONS)
+        struct.pack_into(">H", data, pos, flags & ~WE_HAVE_INSTRUCTIONS)
+        pos += 4 + (4 if flags & ARG_1_AND_2_ARE_WORDS else 2)
+        if flags & WE_HAVE_A_SCALE:
+            pos += 2
+        elif flags & WE_HAVE_AN_X_AND_Y_SCALE:
+            pos += 4
+        elif flags & WE_HAVE_A_TWO_BY_TWO:
+            pos += 8
+    return bytes(data[:pos]) if has_instructions else glyph
+
+
+_registered: Dict[str, str] = {}
+_registration_lock = threading.Lock()
+
+
+def register_font(name: str, path: str) -> bool:
+    """Register a font once per process; returns False when it already was"""
+    with _registration_lock:
+        if _registered.get(name) == path:
+            return False
+        started = time.perf_counter()
+        pdfmetrics.registerFont(SubsetTTFont(name, path))
+        _registered[name] = path
+        logging.info(f"Successfully registered font: {name} ({time.perf_counter() - started:.3f}s)")
+        return True
@@ -0,0 +1,102 @@
+import os
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+ICON_PREFIX = "Icon_"
+ICON_SUFFIX = ".png"
+
+
+def candidate_names(icon_id: str) -> List[str]:
+    """Icon names tried for a character id, in priority order.
+
+    Matches the historical lookup: the full id, the id without its locale
+    prefix (``ko_KR_washerwoman`` -> ``washerwoman``) and the last segment.
+    """
+    parts = icon_id.split("_")
+    return [icon_id, "_".join(parts[2:]), parts[-1]]
+
+
+class IconIndex:
+    """In-memory index of bundled icons, built with one directory scan"""
+
+    def __init__(self, icons_dir: Path):
+        self.icons_dir = Path(icons_dir)
+        self._icons: Dict[str, Path] = {}
+        self._resolved: Dict[str, Optional[Path]] = {}
+        self._lock = threading.Lock()
+        self.ambiguous: List[Tuple[str, List[Path]]] = []
+        self.shadowed: Dict[str, Tuple[Path, List[Path]]] = {}
+        self._scan()
+
+    def __len__(self) -> int:
+        return len(self._icons)
+
+    def resolve(self, icon_id: str) -> Optional[Path]:
+        """Return the icon for a character id using dict lookups only"""
+        with self._lock:
+            if icon_id in self._resolved:
+                return self._resolved[icon_id]
+
+            matches: List[Path] = []
+            for name in candidate_names(icon_id):
+                path = self._icons.get(name)
+                if path and path not in matches:
+                    matches.append(path)
+
+            resolved = matches[0] if matches else None
+            if len(matches) > 1:
+                self.shadowed[icon_id] = (resolved, matches[1:])
+                logging.warning(
+                    f"Icon for '{icon_id}' resolves to {resolved.name}, shadowing "
+                    f"{', '.join(path.name for path in matches[1:])}"
+                )
+            self._resolved[icon_id] = resolved
+            return resolved
+
+    def report(self) -> List[str]:
+        """Human readable lines for ambiguous icon names and shadowed matches"""
+        lines = []
+        for name, paths in self.ambiguous:
+            lines.append(f"ambiguous icon name '{name}': {', '.join(path.name for path in paths)}")
+        for icon_id, (resolved, others) in sorted(self.shadowed.items()):
+            lines.append(
+                f"'{icon_id}' uses {resolved.name}, shadowing {', '.join(path.name for path in others)}"
+            )
+        return lines
+
+    def _scan(self) -> None:
+        if not self.icons_dir.is_dir():
+            logging.warning(f"Icon directory not found: {self.icons_dir}")
+            return
+
+        by_folded_name: Dict[str, List[Path]] = {}
+        for entry in os.scandir(self.icons_dir):
+            if not (entry.is_file() and entry.name.startswith(ICON_PREFIX) and entry.name.endswith(ICON_SUFFIX)):
+                continue
+            name = entry.name[len(ICON_PREFIX):-len(ICON_SUFFIX)]
+            path = self.icons_dir / entry.name
+            self._icons[name] = path
+            by_folded_name.setdefault(name.lower(), []).append(path)
+
+        # Names differing only by case resolve differently on case-insensitive filesystems
+        for name, paths in sorted(by_folded_name.items()):
+            if len(paths) > 1:
+                self.ambiguous.append((name, sorted(paths)))
+                logging.warning(f"Ambiguous icon name '{name}': {', '.join(path.name for path in paths)}")
+
+
+_indexes: Dict[Path, IconIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def load_icon_index(icons_dir: Path) -> IconIndex:
+    """Return the process-wide index for a directory, scanning it on first use"""
+    key = Path(icons_dir).resolve()
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = IconIndex(icons_dir)
+            _indexes[key] = index
+        return index
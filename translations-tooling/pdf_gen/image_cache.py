@@ -0,0 +1,147 @@
+import os
+import logging
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+from .constants import PROCESSED_CACHE_DIR, PROCESSED_CACHE_MAX_ENTRIES, MEMBER_IMAGE_LRU_SIZE
+
+# Bump when the resize/flatten/encode pipeline changes so stale entries are ignored
+PROCESSED_IMAGE_VERSION = 1
+
+
+class ProcessedImageCache:
+    """On-disk cache of optimized member image bytes, keyed by source content and render parameters"""
+
+    def __init__(self, cache_dir: str = PROCESSED_CACHE_DIR, max_entries: int = PROCESSED_CACHE_MAX_ENTRIES):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self._entry_count = sum(1 for _ in self.cache_dir.glob("*.jpg"))
+        # Source digests memoized by (mtime, size) so unchanged files are hashed once per process
+        self._source_digests: Dict[Path, Tuple[int, int, str]] = {}
+
+    def make_key(self, source: Path, size: Tuple[int, int], quality: int) -> str:
+        """Build a cache key from the source file hash and the render parameters"""
+        source_digest = self._source_digest(source)
+        params = f"v{PROCESSED_IMAGE_VERSION}:{size[0]}x{size[1]}:q{quality}"
+        return hashlib.sha256(f"{source_digest}:{params}".encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return cached bytes for a key, refreshing its access time"""
+        path = self._entry_path(key)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        os.utime(path)
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store bytes for a key and evict the oldest entries beyond the limit"""
+        path = self._entry_path(key)
+        existed = path.exists()
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logging.warning(f"Could not write processed image cache entry {path}: {e}")
+            tmp_path.unlink(missing_ok=True)
+            return
+
+        if not existed:
+            self._entry_count += 1
+        if self._entry_count > self.max_entries:
+            self._evict()
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until the cache is within its limit"""
+        entries = []
+        for path in self.cache_dir.glob("*.jpg"):
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except FileNotFoundError:
+                continue
+        entries.sort()
+
+        excess = len(entries) - self.max_entries
+        for _, path in entries[:max(excess, 0)]:
+            path.unlink(missing_ok=True)
+        self._entry_count = min(len(entries), self.max_entries)
+        if excess > 0:
+            logging.info(f"Evicted {excess} processed image cache entries")
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.jpg"
+
+    def _source_digest(self, source: Path) -> str:
+        stat = source.stat()
+        memo = self._source_digests.get(source)
+        if memo and memo[0] == stat.st_mtime_ns and memo[1] == stat.st_size:
+            return memo[2]
+
+        digest = hashlib.sha256(source.read_bytes()).hexdigest()
+        self._source_digests[source] = (stat.st_mtime_ns, stat.st_size, digest)
+        return digest
+
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for an in-memory cache"""
+    hits: int = 0
+    misses: int = 0
+    size: int = 0
+    max_size: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class LRUCache(Generic[K, V]):
+    """Bounded, thread-safe least-recently-used cache with hit/miss counters"""
+
+    def __init__(self, max_size: int = MEMBER_IMAGE_LRU_SIZE):
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+        self.max_size = max_size
+        self._entries: "OrderedDict[K, V]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: K) -> Optional[V]:
+        """Return the cached value and mark it as most recently used"""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: K, value: V) -> None:
+        """Insert a value, evicting the least recently used entry when full"""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> CacheStats:
+        """Snapshot of the current counters"""
+        with self._lock:
+            return CacheStats(self._hits, self._misses, len(self._entries), self.max_size)
+
+    def __len__(self) -> int:
+        return len(self._entries)
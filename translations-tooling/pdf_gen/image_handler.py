@@ -1,68 +1,169 @@
+import os
 import logging
-import requests
-import hashlib
 from pathlib import Path
 from PIL import Image
 from io import BytesIO
-from typing import Dict, Optional
+from typing import Any, Dict, Iterable, Optional
+
+from .cache_index import CacheIndex, url_key
+from .data_processor import primary_image_url
+from .constants import IMAGE_CACHE_MAX_BYTES
+from .downloader import DownloadResult, ImageDownloader, Validators
+from .icon_index import IconIndex, load_icon_index
+from .tracing import count, span
+
+IMAGE_FORMAT_EXTENSIONS = {"JPEG": ".jpg", "PNG": ".png", "WEBP": ".webp", "GIF": ".gif"}
+
 
 class ImageHandler:
     """Handles image processing and retrieval with local caching"""
-    def __init__(self, assets_path: str = "assets", cache_dir: str = ".cache"):
+    def __init__(
+        self,
+        assets_path: str = "assets",
+        cache_dir: str = ".cache",
+        downloader: Optional[ImageDownloader] = None,
+        max_cache_bytes: int = IMAGE_CACHE_MAX_BYTES,
+        failed_urls: Optional[Dict[str, str]] = None
+    ):
         self.assets_path = Path(assets_path)
+        self.icon_index: IconIndex = load_icon_index(self.assets_path / "icons")
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
-        
-    def _get_cache_path(self, url: str) -> Path:
+        self.downloader = downloader or ImageDownloader()
+        self.cache_index = CacheIndex(self.cache_dir)
+        self.max_cache_bytes = max_cache_bytes
+        # URLs that failed to download this run (url -> error), never requested again
+        self.failed_urls: Dict[str, str] = dict(failed_urls or {})
+
+    def _get_cache_path(self, url: str, extension: str) -> Path:
         """Generate a unique cache path for a given URL"""
-        # Create a unique filename using URL hash
-        url_hash = hashlib.md5(url.encode()).hexdigest()
-        return self.cache_dir / f"{url_hash}.png"
-        
+        # Create a unique filename using URL hash, keeping the source format's extension
+        return self.cache_dir / f"{url_key(url)}{extension}"
+
     def get_image(self, item: Dict[str, str]) -> Optional[Image.Image]:
         """Get image from local storage or download from URL"""
-        icon_id = item["id"]
-        
-        # First try to find in assets directory
-        path_patterns = [
-            f"icons/Icon_{icon_id}.png",
-            f"icons/Icon_{'_'.join(icon_id.split('_')[2:])}.png",
-            f"icons/Icon_{icon_id.split('_')[-1]}.png"
-        ]
-        for pattern in path_patterns:
-            full_path = self.assets_path / pattern
-            if full_path.exists():
-                logging.info(f"Found image at: {full_path}")
-                return Image.open(full_path)
-                
-        # If not in assets, try to get from cache or download
-        return self._download_image(item.get("image"))
-        
-    def _download_image(self, url: str) -> Optional[Image.Image]:
-        """Download image from URL with caching"""
+        image_path = self.resolve_image_path(item)
+        if not image_path:
+            return None
+        return Image.open(image_path)
+
+    def resolve_image_path(self, item: Dict[str, str]) -> Optional[Path]:
+        """Resolve a local path for the item's image, downloading it into the cache if needed"""
+        with span("resolve_image_path", id=item["id"]):
+            asset_path = self._find_asset(item["id"])
+            if asset_path:
+                logging.info(f"Found image at: {asset_path}")
+                return asset_path
+
+            # If not in assets, try to get from cache or download
+            return self._download_image(primary_image_url(item.get("image")))
+
+    def prefetch(self, items: Iterable[Dict[str, str]], revalidate: bool = False) -> None:
+        """Download every remote image the items need in one concurrent pass.
+
+        Items backed by a bundled icon and URLs that already failed this run are
+        skipped. Already cached URLs are only requested again when
+        ``revalidate`` is set, in which case a conditional request lets the
+        server answer 304 instead of resending the image.
+        """
+        targets: Dict[str, Optional[Validators]] = {}
+        for item in items:
+            url = primary_image_url(item.get("image"))
+            if not url or url in targets or url in self.failed_urls or self._find_asset(item.get("id", "")):
+                continue
+            entry = self.cache_index.get(url)
+            if entry is None:
+                targets[url] = None
+            elif revalidate:
+                targets[url] = entry.validators
+
+        if targets:
+            logging.info(f"Prefetching {len(targets)} remote image(s)")
+            for result in self.downloader.fetch_all(targets):
+                self._store_download(result)
+        self.flush()
+
+    def flush(self) -> None:
+        """Enforce the cache size limit and persist the cache index"""
+        self.cache_index.evict(self.max_cache_bytes)
+        self.cache_index.save()
+
+    def _find_asset(self, icon_id: str) -> Optional[Path]:
+        """Find a bundled icon for the character id"""
+        return self.icon_index.resolve(icon_id)
+
+    def _download_image(self, url: str) -> Optional[Path]:
+        """Download image from URL into the cache, returning the cached path"""
         if not url:
             return None
-            
+        if url in self.failed_urls:
+            count("download_failures_skipped")
+            return None
+
         # Check cache first
-        cache_path = self._get_cache_path(url)
-        if cache_path.exists():
+        entry = self.cache_index.get(url)
+        if entry:
+            cache_path = self.cache_index.path_for(entry)
             logging.info(f"Loading cached image from: {cache_path}")
-            return Image.open(cache_path)
-            
+            self.cache_index.touch(url)
+            count("download_cache_hits")
+            return cache_path
+
         # If not in cache, download and cache
-        try:
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            image = Image.open(BytesIO(response.content))
-            
-            # Save to cache
-            image.save(cache_path)
-            logging.info(f"Cached image to: {cache_path}")
-            
-            return image
-        except requests.RequestException as e:
-            logging.error(f"Error downloading image from {url}: {e}")
+        result = self.downloader.fetch(url)
+        if not result.ok:
+            logging.error(f"Error downloading image from {url}: {result.error}")
+        return self._store_download(result)
+
+    def _store_download(self, result: DownloadResult) -> Optional[Path]:
+        """Write fetched bytes to the cache as-is and remember their validators.
+
+        Failed downloads (already logged by the caller) and unreadable images
+        are recorded in ``failed_urls`` so the rest of the run skips them.
+        """
+        if not result.ok:
+            self.failed_urls[result.url] = result.error
             return None
+        if result.not_modified:
+            entry = self.cache_index.get(result.url)
+            logging.info(f"Cached image still fresh: {result.url}")
+            self.cache_index.touch(result.url)
+            count("downloads_not_modified")
+            return self.cache_index.path_for(entry) if entry else None
+
+        # Only the header is read here; pixels are decoded when the image is placed in a table
+        try:
+            with Image.open(BytesIO(result.content)) as image:
+                image_format = image.format
         except Exception as e:
-            logging.error(f"Error processing image from {url}: {e}")
-            return None
\ No newline at end of file
+            logging.error(f"Error processing image from {result.url}: {e}")
+            self.failed_urls[result.url] = str(e)
+            return None
+
+        count("downloads")
+        count("download_bytes", len(result.content))
+        cache_path = self._get_cache_path(result.url, _extension_for(image_format))
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(result.content)
+        os.replace(tmp_path, cache_path)
+        logging.info(f"Cached image to: {cache_path}")
+
+        previous = self.cache_index.get(result.url)
+        if previous and previous.filename != cache_path.name:
+            self.cache_index.path_for(previous).unlink(missing_ok=True)
+
+        self.cache_index.record(
+            result.url,
+            cache_path.name,
+            result.content,
+            image_format,
+            result.validators
+        )
+        return cache_path
+
+
+def _extension_for(image_format: Optional[str]) -> str:
+    """File extension matching a Pillow format name"""
+    if not image_format:
+        return ".img"
+    return IMAGE_FORMAT_EXTENSIONS.get(image_format, f".{image_format.lower()}")
@@ -1,5 +1,4 @@
 import os
-import json
 import logging
 import sys
 import argparse
@@ -8,6 +7,9 @@ from .pdf_generator import FontManager
 from .styles import StyleManager
 from .image_handler import ImageHandler
 from .pdf_generator import PDFGenerator
+from .data_processor import load_script_json
+from .memory import format_peak_memory
+from .tracing import drain_trace_events, enable_tracing, write_trace
 
 def main():
     """Main entry point"""
@@ -20,31 +22,42 @@ def main():
         "--output",
         help="Path to the output PDF file (optional)",
     )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Build team tables lazily to keep memory flat for very large scripts",
+    )
+    parser.add_argument(
+        "--trace",
+        metavar="PATH",
+        help="Record timing spans and counters to a Chrome trace (.json) or JSON lines (.jsonl) file",
+    )
     
     args = parser.parse_args()
+    if args.trace:
+        enable_tracing()
 
     try:
         # Initialize components
         font_manager = FontManager(FontConfig())
-        font_manager.register_fonts()
         
         style_manager = StyleManager()
         image_handler = ImageHandler()
         pdf_generator = PDFGenerator(font_manager, style_manager, image_handler)
 
         # Process input
-        with open(args.input_json, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        if not isinstance(data, list):
-            data = [data]
+        data = load_script_json(args.input_json)
 
         # Generate output filename
         output_filename = args.output or f"{os.path.splitext(os.path.basename(args.input_json))[0]}.pdf"
 
         # Generate PDF
-        pdf_generator.create_pdf(data, output_filename)
+        pdf_generator.create_pdf(data, output_filename, streaming=args.stream)
         logging.info(f"PDF has been created successfully: {output_filename}")
+        logging.info(f"Peak memory: {format_peak_memory()}")
+        if args.trace:
+            write_trace(args.trace, drain_trace_events())
+            logging.info(f"Trace written to: {args.trace}")
         
     except Exception as e:
         logging.error(f"An error occurred: {e}")
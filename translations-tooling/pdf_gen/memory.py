@@ -0,0 +1,21 @@
+import sys
+from typing import Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def peak_memory_bytes() -> Optional[int]:
+    """Peak resident set size of the current process, if the platform reports it"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def format_peak_memory() -> str:
+    peak = peak_memory_bytes()
+    return "unavailable" if peak is None else f"{peak / (1024 * 1024):.1f} MiB"
@@ -0,0 +1,285 @@
+import os
+import sys
+import json
+import logging
+import argparse
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from socketserver import ThreadingMixIn, UnixStreamServer
+from typing import Any, Dict, List, Optional
+
+from .batch import BatchRenderer, create_renderer
+from .constants import SERVER_MAX_BODY_BYTES, SERVER_QUEUE_SIZE
+from .exceptions import PDFGenerationError
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8520
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+class RenderError(Exception):
+    """A script could not be rendered; carries the HTTP status to answer with"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+# Per-process renderer, set up once by the pool initializer
+_worker_renderer: Optional[BatchRenderer] = None
+
+
+def _init_worker(streaming: bool) -> None:
+    """Process pool initializer: register fonts, build styles and load caches once per worker"""
+    global _worker_renderer
+    _worker_renderer = create_renderer(streaming=streaming)
+
+
+def _render_in_worker(data: List[Dict[str, Any]]) -> bytes:
+    """Render script data in memory with the worker's warm renderer and return the PDF bytes"""
+    buffer = BytesIO()
+    _worker_renderer.pdf_generator.create_pdf(data, buffer, streaming=_worker_renderer.streaming)
+    # getvalue() hands over the buffer's bytes without copying when no view is held
+    return buffer.getvalue()
+
+
+class RenderPool:
+    """Warm worker processes behind a bounded request queue"""
+
+    def __init__(self, workers: int, queue_size: int = SERVER_QUEUE_SIZE, streaming: bool = False):
+        self.workers = workers
+        self.queue_size = queue_size
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(streaming,)
+        )
+        # Requests being rendered plus those waiting for a worker
+        self._slots = threading.BoundedSemaphore(workers + queue_size)
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.rendered = 0
+        self.rejected = 0
+        self.failed = 0
+
+    def warm_up(self) -> None:
+        """Start every worker now so the first requests don't pay for font registration"""
+        for future in [self._executor.submit(os.getpid) for _ in range(self.workers)]:
+            future.result()
+
+    def render(self, data: List[Dict[str, Any]]) -> bytes:
+        """Render on a worker, rejecting the request when the queue is full"""
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            raise RenderError(503, "Render queue is full, retry later")
+
+        with self._lock:
+            self.in_flight += 1
+        try:
+            pdf_bytes = self._executor.submit(_render_in_worker, data).result()
+        except PDFGenerationError as e:
+            with self._lock:
+                self.failed += 1
+            raise RenderError(422, str(e))
+        except Exception as e:
+            with self._lock:
+                self.failed += 1
+            logging.error(f"Render worker failed: {e}")
+            raise RenderError(500, "Render worker failed")
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+            self._slots.release()
+
+        with self._lock:
+            self.rendered += 1
+        return pdf_bytes
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "queue_size": self.queue_size,
+                "in_flight": self.in_flight,
+                "rendered": self.rendered,
+                "rejected": self.rejected,
+                "failed": self.failed,
+            }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+
+class RenderRequestHandler(BaseHTTPRequestHandler):
+    """POST /render with script JSON returns the PDF; GET /health reports pool counters"""
+
+    server_version = "pdf_gen"
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        if self.path != "/health":
+            self._send_error(404, "Not found")
+            return
+        self._send_json(200, {"status": "ok", **self.server.pool.stats()})
+
+    def do_POST(self):
+        if self.path != "/render":
+            self._send_error(404, "Not found")
+            return
+
+        try:
+            data = self._read_script()
+            pdf_bytes = self.server.pool.render(data)
+        except RenderError as e:
+            self._send_error(e.status, str(e))
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/pdf")
+        self.send_header("Content-Length", str(len(pdf_bytes)))
+        self.end_headers()
+        view = memoryview(pdf_bytes)
+        for start in range(0, len(view), STREAM_CHUNK_SIZE):
+            self.wfile.write(view[start:start + STREAM_CHUNK_SIZE])
+
+    def _read_script(self) -> List[Dict[str, Any]]:
+        # Validated before reading: rfile.read() with a negative length blocks until the client closes.
+        # A rejected body is left unread, so the connection can't be reused for the next request
+        header = self.headers.get("Content-Length")
+        if header is None:
+            self.close_connection = True
+            raise RenderError(411, "Content-Length required")
+        try:
+            length = int(header)
+        except ValueError:
+            length = -1
+        if length < 0:
+            self.close_connection = True
+            raise RenderError(400, f"Invalid Content-Length: {header!r}")
+        if length > SERVER_MAX_BODY_BYTES:
+            self.close_connection = True
+            raise RenderError(413, f"Script JSON larger than {SERVER_MAX_BODY_BYTES} bytes")
+
+        try:
+            data = json.loads(self.rfile.read(length))
+        except ValueError as e:
+            raise RenderError(400, f"Invalid JSON: {e}")
+        if isinstance(data, dict):
+            data = [data]
+        if not isinstance(data, list):
+            raise RenderError(400, "Script JSON must be a list of characters")
+        return data
+
+    def _send_json(self, status: int, payload: Dict[str, Any]) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        if status == 503:
+            self.send_header("Retry-After", "1")
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_error(self, status: int, message: str) -> None:
+        self._send_json(status, {"error": message})
+
+    def address_string(self):
+        # Unix socket peers have no (host, port) address
+        return self.client_address[0] if isinstance(self.client_address, tuple) else "unix"
+
+    def log_message(self, format, *args):
+        logging.info(f"{self.address_string()} {format % args}")
+
+
+class RenderHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, pool: RenderPool):
+        super().__init__(address, RenderRequestHandler)
+        self.pool = pool
+
+
+class RenderUnixServer(ThreadingMixIn, UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: str, pool: RenderPool):
+        super().__init__(path, RenderRequestHandler)
+        self.pool = pool
+
+    def get_request(self):
+        request, _ = super().get_request()
+        return request, ("unix", 0)
+
+
+def main():
+    """Serve PDF renders over HTTP or a Unix socket with warm worker processes"""
+    parser = argparse.ArgumentParser(
+        description="Render script JSON to PDF on demand, keeping fonts and caches warm."
+    )
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"Address to bind (default: {DEFAULT_HOST})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Port to bind (default: {DEFAULT_PORT})")
+    parser.add_argument("--unix-socket", help="Listen on this Unix socket path instead of TCP")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=2,
+        help="Number of render worker processes (default: 2, 0 uses every CPU core)",
+    )
+    parser.add_argument(
+        "--queue",
+        type=int,
+        default=SERVER_QUEUE_SIZE,
+        help=f"Requests allowed to wait for a worker before answering 503 (default: {SERVER_QUEUE_SIZE})",
+    )
+    parser.add_argument("--stream", action="store_true", help="Render with streaming team tables")
+
+    args = parser.parse_args()
+    if args.jobs < 0 or args.queue < 0:
+        parser.error("--jobs and --queue must be zero or positive integers")
+
+    pool = RenderPool(args.jobs or os.cpu_count() or 1, args.queue, streaming=args.stream)
+    try:
+        pool.warm_up()
+    except BrokenProcessPool as e:
+        # A worker initializer raised (e.g. fonts missing); the original error is logged by the worker
+        logging.error(f"Render workers failed to start: {e}")
+        pool.shutdown()
+        sys.exit(1)
+
+    try:
+        if args.unix_socket:
+            if os.path.exists(args.unix_socket):
+                os.unlink(args.unix_socket)
+            server = RenderUnixServer(args.unix_socket, pool)
+            where = args.unix_socket
+        else:
+            server = RenderHTTPServer((args.host, args.port), pool)
+            where = f"http://{args.host}:{args.port}"
+    except OSError as e:
+        logging.error(f"Could not start server: {e}")
+        pool.shutdown()
+        sys.exit(1)
+
+    logging.info(f"Serving PDF renders on {where} with {pool.workers} worker(s)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        pool.shutdown()
+        if args.unix_socket and os.path.exists(args.unix_socket):
+            os.unlink(args.unix_socket)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+    main()
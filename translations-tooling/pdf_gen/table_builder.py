@@ -1,10 +1,11 @@
 import os
 import logging
-from typing import List
+from typing import Dict, List, Optional, Tuple
 from reportlab.platypus import Table, TableStyle, Paragraph, Image as ReportLabImage
 from reportlab.lib.pagesizes import A4
 from PIL import Image
 from io import BytesIO
+from pathlib import Path
 
 from .models import CharacterData, TeamSection, TableRow
 from .constants import (
@@ -14,16 +15,29 @@ from .constants import (
 )
 from .styles import StyleManager
 from .image_handler import ImageHandler
+from .image_cache import CacheStats, LRUCache, ProcessedImageCache
+from .flowables import SharedImage, SharedImageRegistry
 from .exceptions import ImageProcessingError
+from .tracing import count, span
 
 
 class TableBuilder:
     """Handles table creation for PDF generation"""
     
-    def __init__(self, style_manager: StyleManager, image_handler: ImageHandler):
+    def __init__(
+        self, 
+        style_manager: StyleManager, 
+        image_handler: ImageHandler,
+        processed_cache: Optional[ProcessedImageCache] = None
+    ):
         self.style_manager = style_manager
         self.image_handler = image_handler
+        self.processed_cache = processed_cache or ProcessedImageCache()
         self.styles = style_manager.create_styles()
+        # Encoded JPEG bytes per character and header sizes per team, reused across documents
+        self.member_image_cache: LRUCache[Tuple[str, Optional[str]], bytes] = LRUCache()
+        self._team_image_cache: Dict[str, Tuple[int, int]] = {}
+        self.shared_images = SharedImageRegistry()
     
     def create_meta_table(self, title: str, author: str) -> Table:
         """Create meta information table"""
@@ -73,8 +87,20 @@ class TableBuilder:
             ])
         )
     
+    def begin_document(self, max_shared_images: Optional[int] = None) -> None:
+        """Start a new document so identical images are only shared within it"""
+        self.shared_images = SharedImageRegistry(max_shared_images)
+    
+    def image_cache_stats(self) -> CacheStats:
+        """Hit/miss counters of the in-memory member image cache"""
+        return self.member_image_cache.stats()
+    
     def create_team_table(self, team_section: TeamSection) -> Table:
         """Create table for team members"""
+        with span("create_team_table", team=team_section.team.value, rows=len(team_section.characters)):
+            return self._build_team_table(team_section)
+
+    def _build_team_table(self, team_section: TeamSection) -> Table:
         table_data = []
         
         for character in team_section.characters:
@@ -94,27 +120,59 @@ class TableBuilder:
             ])
         )
     
-    def _process_character_image(self, character: CharacterData) -> Paragraph | ReportLabImage:
+    def _process_character_image(self, character: CharacterData) -> Paragraph | SharedImage:
         """Process character image with optimization"""
+        with span("process_character_image", id=character.id):
+            return self._build_character_image(character)
+
+    def _build_character_image(self, character: CharacterData) -> Paragraph | SharedImage:
         try:
+            cache_key = (character.id, character.image_url)
+            image_bytes = self.member_image_cache.get(cache_key)
+            if image_bytes is not None:
+                count("member_image_cache_hits")
+                return self._create_member_image(image_bytes)
+            count("member_image_cache_misses")
+
             # Convert character data to dict format for image handler
             item_dict = {
                 "id": character.id,
                 "image": character.image_url
             }
             
-            img = self.image_handler.get_image(item_dict)
-            if not img:
+            image_path = self.image_handler.resolve_image_path(item_dict)
+            if not image_path:
                 return Paragraph("No image", self.styles["Korean"])
             
-            return self._optimize_and_convert_image(img)
+            image_bytes = self._load_processed_image(image_path)
+            self.member_image_cache.put(cache_key, image_bytes)
+            return self._create_member_image(image_bytes)
             
         except Exception as e:
             logging.error(f"Error processing image for character {character.id}: {e}")
             return Paragraph("Image error", self.styles["Korean"])
     
-    def _optimize_and_convert_image(self, img: Image.Image) -> ReportLabImage:
-        """Optimize and convert image for PDF"""
+    def _load_processed_image(self, image_path: Path) -> bytes:
+        """Return optimized image bytes, reusing the on-disk cache when the source is unchanged"""
+        with span("load_processed_image", path=str(image_path)):
+            cache_key = self.processed_cache.make_key(image_path, MEMBER_IMAGE_SIZE, JPEG_QUALITY)
+            image_bytes = self.processed_cache.get(cache_key)
+            if image_bytes is not None:
+                count("processed_cache_hits")
+                return image_bytes
+            count("processed_cache_misses")
+
+            with Image.open(image_path) as img:
+                image_bytes = self._encode_image(img)
+            self.processed_cache.put(cache_key, image_bytes)
+            return image_bytes
+    
+    def _encode_image(self, img: Image.Image) -> bytes:
+        """Resize, flatten and encode image as optimized JPEG bytes"""
+        with span("encode_image", size=img.size):
+            return self._resize_and_encode(img)
+
+    def _resize_and_encode(self, img: Image.Image) -> bytes:
         # Resize if image is larger than target size
         if img.size[0] > MEMBER_IMAGE_SIZE[0] or img.size[1] > MEMBER_IMAGE_SIZE[1]:
             img = img.resize(MEMBER_IMAGE_SIZE, Image.LANCZOS)
@@ -130,9 +188,12 @@ class TableBuilder:
             quality=JPEG_QUALITY,
             optimize=True
         )
-        
-        return ReportLabImage(
-            BytesIO(img_byte_arr.getvalue()),
+        return img_byte_arr.getvalue()
+    
+    def _create_member_image(self, image_bytes: bytes) -> SharedImage:
+        """Wrap encoded image bytes in a flowable shared by identical icons"""
+        return self.shared_images.create_image(
+            image_bytes,
             width=DISPLAY_IMAGE_SIZE[0],
             height=DISPLAY_IMAGE_SIZE[1]
         )
@@ -151,12 +212,21 @@ class TableBuilder:
     
     def get_team_image(self, team: str) -> ReportLabImage | Paragraph | None:
         """Get team header image"""
+        with span("get_team_image", team=team):
+            return self._load_team_image(team)
+
+    def _load_team_image(self, team: str) -> ReportLabImage | Paragraph | None:
         team_image_path = os.path.join(ASSETS_IMAGES_PATH, f"{team}.png")
         
+        cached_size = self._team_image_cache.get(team)
+        if cached_size:
+            return ReportLabImage(team_image_path, width=cached_size[0], height=cached_size[1])
+        
         if os.path.exists(team_image_path):
             try:
                 team_image = Image.open(team_image_path)
                 team_image.thumbnail((A4[0], TEAM_IMAGE_HEIGHT))
+                self._team_image_cache[team] = team_image.size
                 return ReportLabImage(
                     team_image_path, 
                     width=team_image.size[0], 
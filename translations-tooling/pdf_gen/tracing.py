@@ -0,0 +1,126 @@
+import os
+import json
+import time
+import threading
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+# Returned by span() while tracing is off, so instrumented code pays one global lookup
+_NO_SPAN = nullcontext()
+
+
+class Tracer:
+    """Collects timing spans and counters as Chrome trace events.
+
+    Spans become complete ("X") events and every counter update a counter
+    ("C") event carrying the running total for this process, so both open in
+    chrome://tracing or Perfetto with one lane per process and thread.
+    """
+
+    def __init__(self):
+        self.events: List[Dict[str, Any]] = []
+        self.counters: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self.pid = os.getpid()
+
+    @contextmanager
+    def span(self, name: str, **args):
+        started_us = time.time_ns() // 1000
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            event = {
+                "name": name,
+                "ph": "X",
+                "ts": started_us,
+                "dur": (time.perf_counter() - started) * 1e6,
+                "pid": self.pid,
+                "tid": threading.get_native_id(),
+            }
+            if args:
+                event["args"] = args
+            with self._lock:
+                self.events.append(event)
+
+    def count(self, name: str, value: float = 1) -> None:
+        with self._lock:
+            total = self.counters.get(name, 0) + value
+            self.counters[name] = total
+            self.events.append({
+                "name": name,
+                "ph": "C",
+                "ts": time.time_ns() // 1000,
+                "pid": self.pid,
+                "args": {name: total},
+            })
+
+    def drain(self) -> List[Dict[str, Any]]:
+        """Hand over the events recorded so far, e.g. from a worker process to the parent"""
+        with self._lock:
+            events, self.events = self.events, []
+        return events
+
+    def extend(self, events: Iterable[Dict[str, Any]]) -> None:
+        """Add events recorded by another process"""
+        with self._lock:
+            self.events.extend(events)
+
+
+_tracer: Optional[Tracer] = None
+
+
+def enable_tracing() -> Tracer:
+    """Start recording spans and counters in this process"""
+    global _tracer
+    # A forked worker starts its own trace instead of appending to a copy of the parent's
+    if _tracer is None or _tracer.pid != os.getpid():
+        _tracer = Tracer()
+    return _tracer
+
+
+def tracing_enabled() -> bool:
+    return _tracer is not None
+
+
+def span(name: str, **args):
+    """Time a block as a trace span; a no-op unless tracing is enabled"""
+    if _tracer is None:
+        return _NO_SPAN
+    return _tracer.span(name, **args)
+
+
+def count(name: str, value: float = 1) -> None:
+    """Add to a trace counter; a no-op unless tracing is enabled"""
+    if _tracer is not None:
+        _tracer.count(name, value)
+
+
+def drain_trace_events() -> List[Dict[str, Any]]:
+    return _tracer.drain() if _tracer is not None else []
+
+
+def counter_totals(events: Iterable[Dict[str, Any]]) -> Dict[str, float]:
+    """Final value of each counter summed over every process in the trace"""
+    last: Dict[tuple, float] = {}
+    for event in events:
+        if event["ph"] == "C":
+            last[(event["pid"], event["name"])] = event["args"][event["name"]]
+    totals: Dict[str, float] = {}
+    for (_, name), value in last.items():
+        totals[name] = totals.get(name, 0) + value
+    return totals
+
+
+def write_trace(path: str, events: List[Dict[str, Any]]) -> None:
+    """Write events as JSON lines (``.jsonl``) or as a Chrome trace JSON file (anything else)"""
+    output_path = Path(path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    events = sorted(events, key=lambda event: event["ts"])
+    with open(output_path, "w", encoding="utf-8") as f:
+        if output_path.suffix == ".jsonl":
+            for event in events:
+                f.write(json.dumps(event, ensure_ascii=False) + "\n")
+        else:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f, ensure_ascii=False)
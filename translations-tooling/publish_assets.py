@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+
+"""Precompress the published JSON/PDF assets and record their content hashes.
+
+Every JSON/PDF file under the given sources (relative to public/) gets gzip and,
+when the optional ``brotli`` module is installed, brotli siblings
+(``file.json.gz``, ``file.json.br``). A manifest maps each logical path to its
+content hash so clients and the deploy can tell what changed; files whose hash
+matches the previous manifest are not compressed again.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+try:
+    import brotli
+except ImportError:  # optional: gzip siblings are still written without it
+    brotli = None
+
+MANIFEST_VERSION = 1
+PUBLISHED_SUFFIXES = {".json", ".pdf"}
+DEFAULT_SOURCES = ["translations/assets", "scripts.json", "scripts.index.json", "scripts"]
+HASH_LENGTH = 16
+
+
+@dataclass
+class PublishResult:
+    path: str
+    entry: dict[str, Any]
+    compressed: bool
+    encoded_bytes: dict[str, int] = field(default_factory=dict)
+
+
+def available_encodings() -> list[str]:
+    return ["gzip", "br"] if brotli is not None else ["gzip"]
+
+
+def sibling_path(path: Path, encoding: str) -> Path:
+    return path.with_name(path.name + (".gz" if encoding == "gzip" else ".br"))
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    if encoding == "gzip":
+        # mtime=0 keeps the output byte-identical for identical input
+        return gzip.compress(data, compresslevel=9, mtime=0)
+    return brotli.compress(data, quality=11)
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def remove_siblings(path: Path) -> None:
+    for encoding in ("gzip", "br"):
+        sibling_path(path, encoding).unlink(missing_ok=True)
+
+
+def publish_file(
+    logical_path: str,
+    previous: dict[str, Any] | None,
+    *,
+    root: Path,
+    encodings: list[str],
+    force: bool,
+) -> PublishResult:
+    """Hash one file and (re)write its compressed siblings unless they already match that hash."""
+    path = root / logical_path
+    data = path.read_bytes()
+    digest = hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+
+    if not force and previous is not None and previous.get("hash") == digest:
+        # Unchanged content: only encodings that were never attempted (e.g. brotli just installed) are missing
+        recorded = previous.get("encodings", {})
+        attempted = set(previous.get("attempted", recorded))
+        if set(encodings) <= attempted and all(sibling_path(path, encoding).exists() for encoding in recorded):
+            return PublishResult(logical_path, previous, compressed=False)
+
+    entry: dict[str, Any] = {"hash": digest, "size": len(data), "encodings": {}, "attempted": encodings}
+    encoded_bytes: dict[str, int] = {}
+    for encoding in encodings:
+        target = sibling_path(path, encoding)
+        encoded = compress(data, encoding)
+        # Content that does not shrink (already-compressed data) is served as is
+        if len(encoded) >= len(data):
+            target.unlink(missing_ok=True)
+            continue
+        write_atomic(target, encoded)
+        entry["encodings"][encoding] = len(encoded)
+        encoded_bytes[encoding] = len(encoded)
+    return PublishResult(logical_path, entry, compressed=True, encoded_bytes=encoded_bytes)
+
+
+def collect_files(root: Path, sources: list[str]) -> list[str]:
+    """Logical paths (relative to root, POSIX separators) of every published file."""
+    paths: set[Path] = set()
+    for source in sources:
+        path = root / source
+        if path.is_dir():
+            paths.update(child for child in path.rglob("*") if child.is_file() and child.suffix in PUBLISHED_SUFFIXES)
+        elif path.is_file() and path.suffix in PUBLISHED_SUFFIXES:
+            paths.add(path)
+    return sorted(path.relative_to(root).as_posix() for path in paths)
+
+
+def load_manifest(path: Path) -> dict[str, Any]:
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if manifest.get("version") != MANIFEST_VERSION:
+        return {}
+    return manifest.get("files", {})
+
+
+def parse_args() -> argparse.Namespace:
+    script_dir = Path(__file__).resolve().parent
+    public_dir = script_dir.parent / "public"
+
+    parser = argparse.ArgumentParser(
+        description="Write gzip/brotli siblings and a content-hash manifest for published JSON/PDF assets"
+    )
+    parser.add_argument(
+        "sources",
+        nargs="*",
+        default=DEFAULT_SOURCES,
+        help=f"Files or directories relative to --root (default: {' '.join(DEFAULT_SOURCES)})",
+    )
+    parser.add_argument(
+        "--root",
+        type=Path,
+        default=public_dir,
+        help="Directory the site is served from (default: ../public)",
+    )
+    parser.add_argument(
+        "--manifest",
+        type=Path,
+        default=None,
+        help="Manifest of logical path -> content hash (default: <root>/asset-manifest.json)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Recompress every file even when its hash did not change",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=0,
+        help="Number of worker processes (default: 0, one per CPU core)",
+    )
+
+    args = parser.parse_args()
+    if args.jobs < 0:
+        parser.error("--jobs must be zero or a positive integer")
+    return args
+
+
+def main() -> int:
+    args = parse_args()
+    root = args.root.resolve()
+    manifest_path = (args.manifest or root / "asset-manifest.json").resolve()
+
+    if not root.is_dir():
+        print(f"[error] root directory not found: {root}", file=sys.stderr)
+        return 1
+    if brotli is None:
+        print("[warn] brotli module not installed; writing gzip siblings only (pip install brotli)", file=sys.stderr)
+
+    started = time.perf_counter()
+    previous_files = load_manifest(manifest_path)
+    logical_paths = collect_files(root, args.sources)
+    publish = partial(publish_file, root=root, encodings=available_encodings(), force=args.force)
+    previous_entries = [previous_files.get(logical_path) for logical_path in logical_paths]
+
+    workers = min(args.jobs or os.cpu_count() or 1, max(len(logical_paths), 1))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(publish, logical_paths, previous_entries, chunksize=16))
+    else:
+        results = [publish(logical_path, previous) for logical_path, previous in zip(logical_paths, previous_entries)]
+
+    # Files published last time but gone now (or no longer selected) lose their siblings
+    removed = sorted(set(previous_files) - set(logical_paths))
+    for logical_path in removed:
+        remove_siblings(root / logical_path)
+
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "files": {result.path: result.entry for result in results},
+    }
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    write_atomic(manifest_path, (json.dumps(manifest, ensure_ascii=False, indent=1, sort_keys=True) + "\n").encode("utf-8"))
+
+    compressed = [result for result in results if result.compressed]
+    print(
+        f"[ok] {len(results)} file(s): {len(compressed)} compressed, {len(results) - len(compressed)} unchanged, "
+        f"{len(removed)} removed, with {workers} worker(s) in {time.perf_counter() - started:.2f}s"
+    )
+    if compressed:
+        original = sum(result.entry["size"] for result in compressed)
+        for encoding in available_encodings():
+            encoded = sum(result.encoded_bytes.get(encoding, result.entry["size"]) for result in compressed)
+            print(f"[ok] {encoding}: {original} -> {encoded} bytes over the compressed files")
+    print(f"[ok] Wrote: {manifest_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
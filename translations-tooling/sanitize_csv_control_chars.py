@@ -3,12 +3,19 @@
 from __future__ import annotations
 
 import argparse
-import re
+import os
+import shutil
 import sys
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
 
-CONTROL_CHARS_RE = re.compile(r"[\x00-\x08\x0B-\x1F\x7F]")
+from csv_stream import CONTROL_BYTES, CONTROL_BYTES_RE, iter_chunks
+
+UTF8_BOM = b"\xef\xbb\xbf"
+# UTF-8 continuation bytes; every other byte starts a character
+CONTINUATION_BYTES = bytes(range(0x80, 0xC0))
 
 
 @dataclass
@@ -17,14 +24,45 @@ class FileResult:
     removed_count: int
     changed: bool
     skipped_missing: bool = False
+    # (line, column, code point) of each removed character, 1-based, in the original file
+    locations: list[tuple[int, int, int]] = field(default_factory=list)
+
+
+def char_count(data: bytes) -> int:
+    return len(data.translate(None, CONTINUATION_BYTES))
+
+
+class PositionTracker:
+    """Turns byte offsets of consecutive chunks into line/column positions without decoding."""
 
+    def __init__(self):
+        self.line = 1
+        self.column = 0
 
-def count_control_chars(text: str) -> int:
-    return len(CONTROL_CHARS_RE.findall(text))
+    def advance(self, data: bytes) -> None:
+        newline = data.rfind(b"\n")
+        if newline == -1:
+            self.column += char_count(data)
+        else:
+            self.line += data.count(b"\n")
+            self.column = char_count(data[newline + 1:])
 
+    def locate(self, chunk: bytes) -> list[tuple[int, int, int]]:
+        """Positions of every control byte in ``chunk``, advancing past the whole chunk."""
+        locations: list[tuple[int, int, int]] = []
+        position = 0
+        for match in CONTROL_BYTES_RE.finditer(chunk):
+            self.advance(chunk[position:match.start()])
+            locations.append((self.line, self.column + 1, chunk[match.start()]))
+            position = match.start()
+        self.advance(chunk[position:])
+        return locations
 
-def sanitize_text(text: str) -> str:
-    return CONTROL_CHARS_RE.sub("", text)
+
+def has_control_bytes(path: Path) -> bool:
+    """Fast pre-scan on raw bytes, stopping at the first hit."""
+    with path.open("rb") as source:
+        return any(CONTROL_BYTES_RE.search(chunk) for chunk in iter_chunks(source))
 
 
 def process_file(path: Path, *, dry_run: bool, ignore_missing: bool) -> FileResult:
@@ -33,23 +71,49 @@ def process_file(path: Path, *, dry_run: bool, ignore_missing: bool) -> FileResu
             return FileResult(path=path, removed_count=0, changed=False, skipped_missing=True)
         raise FileNotFoundError(f"file not found: {path}")
 
-    with path.open("r", encoding="utf-8-sig", newline="") as handle:
-        original = handle.read()
-
-    removed_count = count_control_chars(original)
-    sanitized = sanitize_text(original)
-    changed = sanitized != original
-
-    if changed and not dry_run:
-        with path.open("w", encoding="utf-8", newline="") as handle:
-            handle.write(sanitized)
-
-    return FileResult(path=path, removed_count=removed_count, changed=changed)
+    if not has_control_bytes(path):
+        return FileResult(path=path, removed_count=0, changed=False)
+
+    # Stream through a sibling file so large exports are never held in memory,
+    # then swap it in with an atomic rename
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tracker = PositionTracker()
+    locations: list[tuple[int, int, int]] = []
+    try:
+        with path.open("rb") as source:
+            output = None if dry_run else tmp_path.open("wb")
+            try:
+                for index, chunk in enumerate(iter_chunks(source)):
+                    if index == 0 and chunk.startswith(UTF8_BOM):
+                        # Not a character of the text; rewritten files are plain UTF-8
+                        chunk = chunk[len(UTF8_BOM):]
+                    locations.extend(tracker.locate(chunk))
+                    if output is not None:
+                        output.write(chunk.translate(None, CONTROL_BYTES))
+            finally:
+                if output is not None:
+                    output.close()
+
+        if not dry_run:
+            shutil.copymode(path, tmp_path)
+            os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+    return FileResult(path=path, removed_count=len(locations), changed=True, locations=locations)
+
+
+def format_locations(result: FileResult, limit: int) -> list[str]:
+    shown = result.locations if limit == 0 else result.locations[:limit]
+    lines = [f"  {result.path.name}:{line}:{column} U+{code:04X}" for line, column, code in shown]
+    if len(shown) < len(result.locations):
+        lines.append(f"  ... {len(result.locations) - len(shown)} more (--max-locations 0 lists all)")
+    return lines
 
 
 def parse_args() -> argparse.Namespace:
     script_dir = Path(__file__).resolve().parent
-    default_csv = script_dir / "assets" / "csv" / "ko_KR.csv"
+    default_csv_dir = script_dir / "assets" / "csv"
 
     parser = argparse.ArgumentParser(
         description="Remove ASCII control characters from CSV files (except TAB/LF/CR)."
@@ -59,7 +123,13 @@ def parse_args() -> argparse.Namespace:
         action="append",
         type=Path,
         dest="files",
-        help="CSV file path to sanitize. Repeat for multiple files.",
+        help="CSV file path to sanitize. Repeat for multiple files (default: every CSV in --csv-dir).",
+    )
+    parser.add_argument(
+        "--csv-dir",
+        type=Path,
+        default=default_csv_dir,
+        help="Directory sanitized when no --file is given (default: translations-tooling/assets/csv).",
     )
     parser.add_argument(
         "--dry-run",
@@ -76,28 +146,42 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Exit with code 1 when any control characters are found.",
     )
+    parser.add_argument(
+        "--max-locations",
+        type=int,
+        default=20,
+        help="Line:column positions listed per file (default: 20, 0 lists all).",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=0,
+        help="Number of worker processes (default: 0, one per CPU core).",
+    )
     args = parser.parse_args()
+    if args.jobs < 0 or args.max_locations < 0:
+        parser.error("--jobs and --max-locations must be zero or positive integers")
     if not args.files:
-        args.files = [default_csv]
+        args.files = sorted(args.csv_dir.glob("*.csv"))
     return args
 
 
 def main() -> int:
     args = parse_args()
 
-    results: list[FileResult] = []
-    for input_path in args.files:
-        path = input_path.resolve()
-        try:
-            result = process_file(
-                path,
-                dry_run=args.dry_run,
-                ignore_missing=args.ignore_missing,
-            )
-            results.append(result)
-        except FileNotFoundError as error:
-            print(f"[error] {error}", file=sys.stderr)
-            return 1
+    paths = [input_path.resolve() for input_path in args.files]
+    process = partial(process_file, dry_run=args.dry_run, ignore_missing=args.ignore_missing)
+    workers = min(args.jobs or os.cpu_count() or 1, max(len(paths), 1))
+    try:
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(process, paths))
+        else:
+            results = [process(path) for path in paths]
+    except FileNotFoundError as error:
+        print(f"[error] {error}", file=sys.stderr)
+        return 1
 
     found_count = 0
     changed_count = 0
@@ -116,6 +200,8 @@ def main() -> int:
         print(
             f"[ok] {status}: {result.path} (control chars removed={result.removed_count})"
         )
+        for line in format_locations(result, args.max_locations):
+            print(line)
 
     if args.dry_run:
         print(
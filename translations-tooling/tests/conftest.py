@@ -0,0 +1,6 @@
+import sys
+from pathlib import Path
+
+# The tooling is run from translations-tooling (python3 -m pdf_gen..., python3 <script>.py),
+# so make the package and the standalone scripts importable however pytest is invoked
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
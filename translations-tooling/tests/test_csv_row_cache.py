@@ -0,0 +1,104 @@
+"""Row cache of validate_google_sheet_csv: unchanged rows are reused, anything else is checked again."""
+
+import pytest
+
+from validate_google_sheet_csv import CsvTarget, RowCache, validate_targets
+
+HEADER = "id,name,team,edition,ability,firstNight"
+ROWS = [
+    "washerwoman,Washerwoman,townsfolk,tb,Learns a townsfolk,33",
+    "imp,Imp,demon,tb,Kills each night,",
+    "drunk,Drunk,outsider,tb,Thinks they are a townsfolk\x07,",
+]
+
+
+def write_csv(path, header, rows):
+    path.write_text("\n".join([header, *rows]) + "\n", encoding="utf-8")
+
+
+def validate(csv_path, cache_path, *, fail_on_control_chars=False):
+    row_cache = RowCache(cache_path)
+    result, indexes, _ = validate_targets(
+        [CsvTarget(csv_path, "characters")],
+        jobs=1,
+        fail_on_control_chars=fail_on_control_chars,
+        fail_on_header_normalization=False,
+        row_cache=row_cache,
+    )
+    row_cache.save()
+    return result, indexes[csv_path]
+
+
+def reused(result) -> str:
+    loaded = next(issue for issue in result.infos if issue.rule == "rows-loaded")
+    return loaded.message.split(", ")[1]
+
+
+def located(issues):
+    return [(issue.rule, issue.line, issue.id) for issue in issues]
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "characters.csv"
+    write_csv(path, HEADER, ROWS)
+    return path
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return tmp_path / ".cache" / "csv_validation.json"
+
+
+def test_unchanged_rows_are_reused_with_the_same_results(csv_path, cache_path):
+    first, first_index = validate(csv_path, cache_path)
+    assert reused(first) == "0 unchanged since the last run"
+    assert cache_path.exists()
+
+    second, second_index = validate(csv_path, cache_path)
+    assert reused(second) == "3 unchanged since the last run"
+    assert located(second.warnings) == located(first.warnings) == [("control-characters", 4, "drunk")]
+    assert second_index.rows == first_index.rows
+
+
+def test_changed_row_is_checked_again_and_moved_rows_keep_their_lines(csv_path, cache_path):
+    validate(csv_path, cache_path)
+
+    changed = "imp,Imp,demon,tb,Kills each night,dusk"
+    write_csv(csv_path, HEADER, [ROWS[2], ROWS[0], changed])
+    result, index = validate(csv_path, cache_path)
+    assert reused(result) == "2 unchanged since the last run"
+    # Line numbers and duplicates come from this run, not from the cached rows
+    assert located(result.warnings) == [
+        ("control-characters", 2, "drunk"),
+        ("non-numeric-night-order", 4, "imp"),
+    ]
+    assert index.rows["washerwoman"][0] == 3
+
+    # The cache holds the last run only: the original imp row is checked again
+    write_csv(csv_path, HEADER, [*ROWS, ROWS[0]])
+    result, _ = validate(csv_path, cache_path)
+    assert reused(result) == "3 unchanged since the last run"
+    assert located(result.errors) == [("duplicate-id", 5, "washerwoman")]
+
+
+def test_header_change_discards_the_cached_rows(csv_path, cache_path):
+    validate(csv_path, cache_path)
+
+    write_csv(csv_path, HEADER + ",note", ROWS)
+    result, _ = validate(csv_path, cache_path)
+    assert reused(result) == "0 unchanged since the last run"
+
+
+def test_strictness_change_discards_the_cached_rows(csv_path, cache_path):
+    validate(csv_path, cache_path)
+
+    result, _ = validate(csv_path, cache_path, fail_on_control_chars=True)
+    assert reused(result) == "0 unchanged since the last run"
+    assert located(result.errors) == [("control-characters", 4, "drunk")]
+    assert not result.warnings
+
+    # The strict results are what is cached now, so a strict rerun reuses them
+    result, _ = validate(csv_path, cache_path, fail_on_control_chars=True)
+    assert reused(result) == "3 unchanged since the last run"
+    assert located(result.errors) == [("control-characters", 4, "drunk")]
@@ -0,0 +1,105 @@
+"""One locale CSV through generate_translations_from_csv: roles JSON and a script against fixtures."""
+
+import json
+
+import pytest
+
+from generate_translations_from_csv import ICON_URL, collect_locale_csvs, generate_locale, load_script_definitions
+
+BASE_ROLES = [
+    {
+        "id": "washerwoman",
+        "name": "Washerwoman",
+        "team": "townsfolk",
+        "ability": "Learns a townsfolk",
+        "firstNight": 33,
+        "otherNight": 0,
+        "image": "../../assets/icons/Icon_washerwoman.png",
+    },
+    {"id": "imp", "name": "Imp", "team": "demon", "ability": "Kills each night", "firstNight": 0, "otherNight": 24},
+    {"id": "drunk", "name": "Drunk", "team": "outsider", "ability": "Thinks they are a townsfolk"},
+]
+CSV = """id,name,team,ability,reminders,firstNight,otherNight,flavor
+washerwoman,세탁부,,마을주민 하나를 알게 됩니다,"마을주민, 틀림",,,
+imp,임프,,"밤마다\r\n죽입니다",,,,"조용\x08히"
+goon,깡패,outsider,취하게 합니다,,,,
+,,,,,,,
+"""
+
+
+@pytest.fixture
+def dirs(tmp_path):
+    for name in ("csv", "definitions", "json", "scripts", "night_orders"):
+        (tmp_path / name).mkdir()
+    (tmp_path / "csv" / "xx_yy.csv").write_text(CSV, encoding="utf-8")
+    (tmp_path / "csv" / "scripts.csv").write_text("id,name\n", encoding="utf-8")
+    (tmp_path / "definitions" / "tiny.json").write_text(
+        json.dumps({"meta": {"name": "Tiny", "author": "tests"}, "roles": ["washerwoman", "goon", "baron", "imp"]}),
+        encoding="utf-8",
+    )
+    (tmp_path / "night_orders" / "xx_YY.json").write_text(
+        json.dumps({"firstNight": ["dusk", "imp", "washerwoman"], "otherNight": ["dusk", "imp"]}), encoding="utf-8"
+    )
+    return tmp_path
+
+
+def generate(dirs):
+    return generate_locale(
+        dirs / "csv" / "xx_yy.csv",
+        base_roles=BASE_ROLES,
+        definitions=load_script_definitions(dirs / "definitions"),
+        json_dir=dirs / "json",
+        scripts_dir=dirs / "scripts",
+        night_orders_dir=dirs / "night_orders",
+        write_scripts=True,
+    )
+
+
+def test_locale_is_named_from_the_csv_and_scripts_csv_is_not_a_locale(dirs):
+    paths = collect_locale_csvs(dirs / "csv", [], (dirs / "csv" / "scripts.csv").resolve())
+    assert [path.name for path in paths] == ["xx_yy.csv"]
+    assert collect_locale_csvs(dirs / "csv", ["xx_YY"], (dirs / "csv" / "scripts.csv").resolve()) == paths
+
+
+def test_roles_json_merges_the_csv_over_the_base_roles(dirs):
+    report = generate(dirs)
+    assert report.locale == "xx_YY"
+    assert (report.rows, report.roles, report.csv_only) == (4, 4, 1)
+    assert report.missing_from_csv == ["drunk"]
+
+    roles = json.loads((dirs / "json" / "xx_YY.json").read_text(encoding="utf-8"))
+    assert [role["id"] for role in roles] == ["washerwoman", "imp", "drunk", "goon"]
+    washerwoman, imp, drunk, goon = roles
+    # Blank cells keep the base values; lists are split; the night order override wins
+    assert washerwoman["name"] == "세탁부" and washerwoman["team"] == "townsfolk"
+    assert washerwoman["reminders"] == ["마을주민", "틀림"]
+    assert (washerwoman["firstNight"], washerwoman["otherNight"]) == (2, 0)
+    assert (imp["firstNight"], imp["otherNight"]) == (1, 1)
+    # Control characters from the sheet are cleaned
+    assert imp["ability"] == "밤마다\n죽입니다" and imp["flavor"] == "조용히"
+    assert drunk == {**BASE_ROLES[2], "image": ICON_URL.format(role_id="drunk")}
+    assert washerwoman["image"] == ICON_URL.format(role_id="washerwoman")
+    assert goon["team"] == "outsider"
+
+
+def test_script_roles_are_prefixed_and_unknown_ids_are_reported(dirs):
+    report = generate(dirs)
+    assert (report.scripts_written, report.scripts_unchanged) == (1, 0)
+    assert report.unresolved == {"tiny": ["baron"]}
+
+    script = json.loads((dirs / "scripts" / "xx_YY" / "tiny.json").read_text(encoding="utf-8"))
+    assert script[0] == {"id": "_meta", "isOfficial": False, "name": "Tiny", "author": "tests"}
+    assert [role and role["id"] for role in script[1:]] == ["xx_YY_washerwoman", "xx_YY_goon", None, "xx_YY_imp"]
+    assert script[1]["name"] == "세탁부"
+
+
+def test_rerun_leaves_unchanged_files_alone(dirs):
+    generate(dirs)
+    roles_path = dirs / "json" / "xx_YY.json"
+    script_path = dirs / "scripts" / "xx_YY" / "tiny.json"
+    mtimes = (roles_path.stat().st_mtime_ns, script_path.stat().st_mtime_ns)
+
+    report = generate(dirs)
+    assert not report.json_written
+    assert (report.scripts_written, report.scripts_unchanged) == (0, 1)
+    assert (roles_path.stat().st_mtime_ns, script_path.stat().st_mtime_ns) == mtimes
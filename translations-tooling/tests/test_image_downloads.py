@@ -0,0 +1,135 @@
+"""Remote image downloads against a local HTTP stand-in: revalidation, 304s and failures."""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+
+import pytest
+from PIL import Image
+
+from pdf_gen.image_handler import ImageHandler
+
+ETAG = '"v1"'
+LAST_MODIFIED = "Mon, 05 Oct 2026 10:00:00 GMT"
+
+
+def png_bytes(color: str) -> bytes:
+    buffer = BytesIO()
+    Image.new("RGB", (4, 4), color).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+class StandIn(BaseHTTPRequestHandler):
+    """Serves /etag.png (ETag only), /modified.png (Last-Modified only) and 404s"""
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append((self.path, dict(self.headers)))
+        if self.path == "/etag.png":
+            fresh = self.headers.get("If-None-Match") == server.etag
+            validator = ("ETag", server.etag)
+        elif self.path == "/modified.png":
+            fresh = self.headers.get("If-Modified-Since") == LAST_MODIFIED
+            validator = ("Last-Modified", LAST_MODIFIED)
+        else:
+            self.send_error(404)
+            return
+
+        if fresh:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "image/png")
+        self.send_header("Content-Length", str(len(server.body)))
+        self.send_header(*validator)
+        self.end_headers()
+        self.wfile.write(server.body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), StandIn)
+    httpd.requests = []
+    httpd.etag = ETAG
+    httpd.body = png_bytes("red")
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def handler(tmp_path):
+    return ImageHandler(assets_path=str(tmp_path / "assets"), cache_dir=str(tmp_path / "cache"))
+
+
+def url_for(server, path: str) -> str:
+    return f"http://127.0.0.1:{server.server_address[1]}{path}"
+
+
+def requests_to(server, path: str):
+    return [headers for request_path, headers in server.requests if request_path == path]
+
+
+def test_etag_revalidation_keeps_cache_on_304(server, handler):
+    url = url_for(server, "/etag.png")
+    handler.prefetch([{"id": "custom", "image": url}])
+    cached = handler.resolve_image_path({"id": "custom", "image": url})
+    assert cached.read_bytes() == server.body
+    assert handler.cache_index.get(url).etag == ETAG
+
+    # Cached and not revalidating: no request at all
+    handler.prefetch([{"id": "custom", "image": url}])
+    assert len(requests_to(server, "/etag.png")) == 1
+
+    handler.prefetch([{"id": "custom", "image": url}], revalidate=True)
+    requests = requests_to(server, "/etag.png")
+    assert len(requests) == 2
+    assert requests[1]["If-None-Match"] == ETAG
+    assert handler.resolve_image_path({"id": "custom", "image": url}) == cached
+    assert cached.read_bytes() == server.body
+
+
+def test_last_modified_revalidation_sends_if_modified_since(server, handler):
+    url = url_for(server, "/modified.png")
+    handler.prefetch([{"id": "custom", "image": url}])
+    assert handler.cache_index.get(url).last_modified == LAST_MODIFIED
+
+    handler.prefetch([{"id": "custom", "image": url}], revalidate=True)
+    requests = requests_to(server, "/modified.png")
+    assert len(requests) == 2
+    assert requests[1]["If-Modified-Since"] == LAST_MODIFIED
+    assert "If-None-Match" not in requests[1]
+
+
+def test_changed_etag_replaces_cached_image(server, handler):
+    url = url_for(server, "/etag.png")
+    handler.prefetch([{"id": "custom", "image": url}])
+
+    server.etag = '"v2"'
+    server.body = png_bytes("blue")
+    handler.prefetch([{"id": "custom", "image": url}], revalidate=True)
+    assert handler.resolve_image_path({"id": "custom", "image": url}).read_bytes() == server.body
+    assert handler.cache_index.get(url).etag == '"v2"'
+
+
+def test_failed_download_is_not_retried_in_the_same_run(server, handler):
+    url = url_for(server, "/missing.png")
+    item = {"id": "custom", "image": url}
+    handler.prefetch([item])
+    handler.prefetch([item])
+    assert handler.resolve_image_path(item) is None
+    assert len(requests_to(server, "/missing.png")) == 1
+    assert url in handler.failed_urls
+
+    # A handler seeded with the failures (as batch workers are) skips the URL too
+    worker = ImageHandler(
+        assets_path=str(handler.assets_path), cache_dir=str(handler.cache_dir), failed_urls=handler.failed_urls
+    )
+    assert worker.resolve_image_path(item) is None
+    assert len(requests_to(server, "/missing.png")) == 1
@@ -0,0 +1,74 @@
+"""Control character removal and its file:line:column report in sanitize_csv_control_chars."""
+
+from functools import partial
+
+import pytest
+
+import csv_stream
+import sanitize_csv_control_chars
+from sanitize_csv_control_chars import UTF8_BOM, FileResult, format_locations, process_file
+
+# Columns count characters, not bytes: the Korean syllables are three bytes each
+TEXT = "id,name,ability\nimp,임프,밤마다\x08 죽입니다\r\n\x07drunk,\t술꾼,없음\x1f\n"
+EXPECTED = [(2, 11, 0x08), (2, 17, 0x0D), (3, 1, 0x07), (3, 14, 0x1F)]
+CLEANED = "id,name,ability\nimp,임프,밤마다 죽입니다\ndrunk,\t술꾼,없음\n"
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "ko_KR.csv"
+    path.write_bytes(TEXT.encode("utf-8"))
+    return path
+
+
+def test_reports_line_and_column_of_each_removed_character(csv_path):
+    result = process_file(csv_path, dry_run=False, ignore_missing=False)
+    assert result.changed and result.removed_count == 4
+    assert result.locations == EXPECTED
+    # Tabs and newlines are kept
+    assert csv_path.read_text(encoding="utf-8") == CLEANED
+
+
+def test_dry_run_reports_without_rewriting(csv_path):
+    result = process_file(csv_path, dry_run=True, ignore_missing=False)
+    assert result.locations == EXPECTED
+    assert csv_path.read_bytes() == TEXT.encode("utf-8")
+    assert not list(csv_path.parent.glob(".*.tmp"))
+
+
+@pytest.mark.parametrize("size", [1, 2, 5, 7])
+def test_positions_hold_across_chunk_boundaries(csv_path, monkeypatch, size):
+    # Small chunks split lines and multi-byte characters between reads
+    monkeypatch.setattr(sanitize_csv_control_chars, "iter_chunks", partial(csv_stream.iter_chunks, size=size))
+    result = process_file(csv_path, dry_run=False, ignore_missing=False)
+    assert result.locations == EXPECTED
+    assert csv_path.read_text(encoding="utf-8") == CLEANED
+
+
+def test_bom_is_dropped_and_not_counted_as_a_column(tmp_path):
+    path = tmp_path / "scripts.csv"
+    path.write_bytes(UTF8_BOM + "\x0bid,name\n".encode("utf-8"))
+    result = process_file(path, dry_run=False, ignore_missing=False)
+    assert result.locations == [(1, 1, 0x0B)]
+    assert path.read_bytes() == b"id,name\n"
+
+
+def test_clean_and_missing_files_are_left_alone(tmp_path):
+    path = tmp_path / "clean.csv"
+    path.write_text("id,name\nimp,임프\n", encoding="utf-8")
+    assert process_file(path, dry_run=False, ignore_missing=False) == FileResult(path, 0, False)
+
+    missing = tmp_path / "missing.csv"
+    assert process_file(missing, dry_run=False, ignore_missing=True).skipped_missing
+    with pytest.raises(FileNotFoundError):
+        process_file(missing, dry_run=False, ignore_missing=False)
+
+
+def test_report_is_capped_by_max_locations(csv_path):
+    result = process_file(csv_path, dry_run=True, ignore_missing=False)
+    assert format_locations(result, 2) == [
+        "  ko_KR.csv:2:11 U+0008",
+        "  ko_KR.csv:2:17 U+000D",
+        "  ... 2 more (--max-locations 0 lists all)",
+    ]
+    assert len(format_locations(result, 0)) == 4
@@ -0,0 +1,67 @@
+"""Sharded script catalog of generate_public_scripts_json_from_csv: shard names, index and stale shards."""
+
+import json
+
+import pytest
+
+from generate_public_scripts_json_from_csv import SHARD_NAME_RE, minified_json, shard_name, write_catalog
+
+SCRIPTS = [
+    {"author": "TPI", "synopsis": "Clockmakers", "name": "Trouble Brewing", "id": "trouble_brewing", "official": True},
+    {"author": "Someone", "synopsis": "Kaboom", "name": "Kaboom", "id": "kaboom", "logo": "/logo.png"},
+]
+
+
+@pytest.fixture
+def paths(tmp_path):
+    return tmp_path / "scripts.index.json", tmp_path / "scripts"
+
+
+def test_shard_name_follows_the_content():
+    content = minified_json(SCRIPTS[0])
+    name = shard_name("trouble_brewing", content)
+    assert name.startswith("trouble_brewing.") and SHARD_NAME_RE.match(name)
+    assert shard_name("trouble_brewing", content) == name
+    assert shard_name("trouble_brewing", minified_json({**SCRIPTS[0], "synopsis": "Changed"})) != name
+
+
+def test_index_points_at_one_shard_per_script(paths):
+    index_path, shard_dir = paths
+    assert write_catalog(SCRIPTS, index_path, shard_dir) == (2, 0, 0)
+
+    index = json.loads(index_path.read_text(encoding="utf-8"))
+    assert [entry["id"] for entry in index] == ["trouble_brewing", "kaboom"]
+    assert index[0] == {
+        "id": "trouble_brewing",
+        "name": "Trouble Brewing",
+        "official": True,
+        "detail": f"scripts/{shard_name('trouble_brewing', minified_json(SCRIPTS[0]))}",
+    }
+    assert index[1]["logo"] == "/logo.png" and "synopsis" not in index[1]
+    for entry, script in zip(index, SCRIPTS):
+        assert json.loads((index_path.parent / entry["detail"]).read_text(encoding="utf-8")) == script
+
+    assert write_catalog(SCRIPTS, index_path, shard_dir) == (0, 2, 0)
+
+
+def test_changed_and_removed_scripts_drop_their_old_shards(paths):
+    index_path, shard_dir = paths
+    write_catalog(SCRIPTS, index_path, shard_dir)
+    unrelated = shard_dir / "README.json"
+    unrelated.write_text("{}", encoding="utf-8")
+
+    changed = {**SCRIPTS[0], "synopsis": "Changed"}
+    assert write_catalog([changed], index_path, shard_dir) == (1, 0, 2)
+    # Only hashed shard names are cleaned up, anything else in the directory stays
+    assert sorted(path.name for path in shard_dir.iterdir()) == sorted(
+        ["README.json", shard_name("trouble_brewing", minified_json(changed))]
+    )
+
+
+@pytest.mark.parametrize("script_id", ["../escape", "a/b", "Kaboom", "kaboom.v2"])
+def test_ids_that_are_not_file_names_are_rejected_before_writing(paths, script_id):
+    index_path, shard_dir = paths
+    with pytest.raises(ValueError, match="must match regex"):
+        write_catalog([*SCRIPTS, {**SCRIPTS[1], "id": script_id}], index_path, shard_dir)
+    assert not index_path.exists()
+    assert not shard_dir.exists() or not any(shard_dir.iterdir())
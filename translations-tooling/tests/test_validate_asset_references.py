@@ -0,0 +1,133 @@
+"""Asset reference checks of validate_google_sheet_csv against a local HTTP stand-in."""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from validate_google_sheet_csv import (
+    AppAssetBases,
+    AssetIndex,
+    AssetRef,
+    UrlChecker,
+    check_asset_references,
+    classify_reference,
+    load_app_asset_bases,
+)
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+MIRROR = "https://raw.githubusercontent.com/wonhyo-e/botc-translations/main/assets"
+
+
+class StandIn(BaseHTTPRequestHandler):
+    """200 for /ok.png, 405 on HEAD but 206 on GET for /nohead.png, 404 otherwise"""
+
+    def do_HEAD(self):
+        self.server.requests.append(("HEAD", self.path))
+        if self.path == "/nohead.png":
+            self.send_response(405)
+        else:
+            self.send_response(200 if self.path == "/ok.png" else 404)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_GET(self):
+        self.server.requests.append(("GET", self.path))
+        if self.path not in ("/ok.png", "/nohead.png"):
+            self.send_error(404)
+            return
+        self.send_response(206 if self.headers.get("Range") else 200)
+        self.send_header("Content-Length", "1")
+        self.end_headers()
+        self.wfile.write(b"x")
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), StandIn)
+    httpd.requests = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def app_bases():
+    return load_app_asset_bases(REPO_ROOT / "src" / "constants" / "urls.ts")
+
+
+@pytest.fixture
+def asset_index(tmp_path):
+    public = tmp_path / "public"
+    (public / "translations" / "assets" / "pdf" / "ko_KR").mkdir(parents=True)
+    (public / "translations" / "assets" / "pdf" / "ko_KR" / "tb.pdf").write_bytes(b"%PDF")
+    (tmp_path / "assets").mkdir()
+    return AssetIndex(public, tmp_path / "assets")
+
+
+def url_for(server, path: str) -> str:
+    return f"http://127.0.0.1:{server.server_address[1]}{path}"
+
+
+def ref(value: str, column: str = "pdf") -> AssetRef:
+    return AssetRef("scripts.csv", 2, "tb", column, value)
+
+
+def test_app_bases_come_from_urls_ts(app_bases):
+    assert app_bases.site == "/translations/assets"
+    assert MIRROR in app_bases.remote
+    assert "/botc-translations/assets" in app_bases.remote
+    assert classify_reference(f"{MIRROR}/pdf/ko_KR/tb.pdf", app_bases) == ("local", "/translations/assets/pdf/ko_KR/tb.pdf")
+    assert classify_reference("/botc-translations/assets/pdf/ko_KR/tb.pdf", app_bases) == (
+        "local",
+        "/translations/assets/pdf/ko_KR/tb.pdf",
+    )
+    # The app never rewrites GitHub blob pages, so neither does the validator
+    blob = "https://github.com/wonhyo-e/botc-translations/blob/main/assets/pdf/ko_KR/tb.pdf"
+    assert classify_reference(blob, app_bases) == ("remote", blob)
+
+
+def test_missing_local_asset_is_reported_unless_known(asset_index, app_bases):
+    refs = [ref("/botc-translations/assets/pdf/ko_KR/tb.pdf"), ref(f"{MIRROR}/pdf/ko_KR/gone.pdf")]
+    result = check_asset_references(refs, asset_index, None, app_bases)
+    assert [issue.rule for issue in result.errors] == ["asset-missing"]
+    assert "gone.pdf" in result.errors[0].message
+
+    known = {"/translations/assets/pdf/ko_KR/gone.pdf", "/translations/assets/pdf/ko_KR/tb.pdf"}
+    result = check_asset_references(refs, asset_index, None, app_bases, known)
+    assert not result.errors and not result.warnings
+    assert [issue.rule for issue in result.infos] == ["known-missing-resolved", "assets"]
+
+
+def test_remote_urls_are_skipped_without_a_checker(server, asset_index):
+    result = check_asset_references([ref(url_for(server, "/missing.png"), "logo")], asset_index, None, AppAssetBases((), ""))
+    assert not result.warnings
+    assert "skipped 1 URL(s)" in result.infos[-1].message
+    assert server.requests == []
+
+
+def test_remote_check_uses_head_then_get_and_caches_successes(server, asset_index, tmp_path):
+    refs = [ref(url_for(server, path), "logo") for path in ("/ok.png", "/nohead.png", "/missing.png")]
+    cache_path = tmp_path / "url_checks.json"
+    checker = UrlChecker(cache_path, jobs=2, timeout=5, ttl_hours=1)
+    result = check_asset_references(refs, asset_index, checker, AppAssetBases((), ""))
+
+    assert [issue.rule for issue in result.warnings] == ["asset-unreachable"]
+    assert "missing.png" in result.warnings[0].message and "HTTP 404" in result.warnings[0].message
+    assert ("GET", "/nohead.png") in server.requests
+    assert ("GET", "/ok.png") not in server.requests
+    checker.save()
+
+    # Successful URLs are served from the cache; the failure is requested again
+    server.requests.clear()
+    checker = UrlChecker(cache_path, jobs=2, timeout=5, ttl_hours=1)
+    result = check_asset_references(refs, asset_index, checker, AppAssetBases((), ""))
+    assert checker.cached == 2
+    assert server.requests == [("HEAD", "/missing.png")]
+    assert len(result.warnings) == 1
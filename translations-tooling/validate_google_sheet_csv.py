@@ -3,14 +3,24 @@
 from __future__ import annotations
 
 import argparse
-import csv
+import hashlib
+import json
+import os
 import re
 import sys
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
 from collections import defaultdict
-from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from functools import partial
 from pathlib import Path
+from typing import Any
+
+from csv_stream import CsvStream, clean_cell, parse_optional_bool
 
-CONTROL_CHARS_RE = re.compile(r"[\x00-\x08\x0B-\x1F\x7F]")
 SCRIPT_ID_RE = re.compile(r"^[a-z0-9_]+$")
 
 REQUIRED_CHARACTER_HEADERS = {
@@ -20,6 +30,12 @@ REQUIRED_CHARACTER_HEADERS = {
     "edition",
     "ability",
 }
+# Per-locale translation CSVs only carry the translated text; ids tie them to the characters CSV
+REQUIRED_LOCALE_HEADERS = {
+    "id",
+    "name",
+    "ability",
+}
 REQUIRED_SCRIPT_HEADERS = {
     "id",
     "name",
@@ -45,114 +61,249 @@ KNOWN_CHARACTER_HEADERS = REQUIRED_CHARACTER_HEADERS | OPTIONAL_CHARACTER_HEADER
 KNOWN_SCRIPT_HEADERS = REQUIRED_SCRIPT_HEADERS | OPTIONAL_SCRIPT_HEADERS
 ALLOWED_URL_PREFIXES = ("/translations/assets/", "https://", "http://", "/")
 ALLOWED_TEAMS = {"townsfolk", "outsider", "minion", "demon", "traveler", "fabled", "jinxes"}
+CONSISTENCY_COLUMNS = ("id", "team", "firstNight", "otherNight")
+# Missing ids named in the per-file summary before the rest are only counted
+MISSING_IDS_SHOWN = 10
+TARGET_HEADERS = {
+    "characters": (REQUIRED_CHARACTER_HEADERS, KNOWN_CHARACTER_HEADERS),
+    "locale": (REQUIRED_LOCALE_HEADERS, KNOWN_CHARACTER_HEADERS),
+    "scripts": (REQUIRED_SCRIPT_HEADERS, KNOWN_SCRIPT_HEADERS),
+}
+
+# Columns whose values reference a file or URL, checked after the scan against the asset index
+ASSET_COLUMNS = {
+    "characters": ("image",),
+    "locale": ("image",),
+    "scripts": ("json", "pdf", "logo"),
+}
+# json/pdf are what the site links to; a missing logo or icon only falls back to a default
+MISSING_ASSET_SEVERITY = {"json": "error", "pdf": "error", "logo": "warning", "image": "warning"}
+# The app rewrites its REMOTE_ASSET_BASES to TRANSLATIONS_DEFAULT_BASE (normalizeTranslationUrl);
+# both are read from its source so the validator resolves references exactly like the site
+APP_URLS_RELATIVE_PATH = Path("src") / "constants" / "urls.ts"
+APP_DEFAULT_BASE_RE = re.compile(r"TRANSLATIONS_DEFAULT_BASE\s*=\s*(['\"`])(.*?)\1", re.S)
+APP_REMOTE_BASES_RE = re.compile(r"REMOTE_ASSET_BASES\s*=\s*\[(.*?)\]", re.S)
+APP_STRING_RE = re.compile(r"(['\"`])(.*?)\1")
+URL_CHECK_USER_AGENT = "botc-translations-validator"
+
+# Bump when a row rule changes so cached row results are not reused
+ROW_CACHE_VERSION = 2
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+
+
+@dataclass
+class Issue:
+    rule: str
+    message: str
+    file: str | None = None
+    line: int | None = None
+    id: str | None = None
+
+    def __str__(self) -> str:
+        if self.file is None:
+            return self.message
+        if self.line is None:
+            return f"{self.file}: {self.message}"
+        return f"{self.file}:{self.line} {self.message}"
 
 
 @dataclass
 class ValidationResult:
-    errors: list[str] = field(default_factory=list)
-    warnings: list[str] = field(default_factory=list)
-    infos: list[str] = field(default_factory=list)
+    errors: list[Issue] = field(default_factory=list)
+    warnings: list[Issue] = field(default_factory=list)
+    infos: list[Issue] = field(default_factory=list)
 
     def merge(self, other: "ValidationResult") -> None:
         self.errors.extend(other.errors)
         self.warnings.extend(other.warnings)
         self.infos.extend(other.infos)
 
+    def add(self, severity: str, issue: Issue) -> None:
+        {"error": self.errors, "warning": self.warnings, "info": self.infos}[severity].append(issue)
 
-def sanitize_header(raw: str | None) -> str:
-    if raw is None:
-        return ""
 
-    value = raw.lstrip("\ufeff")
-    value = CONTROL_CHARS_RE.sub("", value)
-    return value.strip()
+@dataclass(frozen=True)
+class CsvTarget:
+    path: Path
+    kind: str  # "characters", "locale" or "scripts"
 
 
-def clean_text(raw: str | None) -> str:
-    if raw is None:
-        return ""
+@dataclass
+class IdIndex:
+    """Compact id-keyed view of one CSV for cross-locale checks."""
 
-    value = raw.replace("\r\n", "\n").replace("\r", "\n")
-    value = CONTROL_CHARS_RE.sub("", value)
-    return value.strip()
+    path: Path
+    kind: str
+    columns: frozenset[str]
+    # id -> (line, team, firstNight, otherNight), first definition only
+    rows: dict[str, tuple[int, str, str, str]] = field(default_factory=dict)
 
 
-def parse_optional_bool(raw: str | None) -> bool | None:
-    if raw is None:
-        return None
+@dataclass(frozen=True)
+class AssetRef:
+    file: str
+    line: int
+    id: str | None
+    column: str
+    value: str
 
-    value = clean_text(raw).lower()
-    if value == "":
-        return None
-    if value in {"true", "1", "yes", "y"}:
-        return True
-    if value in {"false", "0", "no", "n"}:
-        return False
-    return None
+
+@dataclass
+class FileReport:
+    result: ValidationResult
+    index: IdIndex | None = None
+    # Row results keyed by raw row hash, for the next run (None when caching is off)
+    cache: dict[str, Any] | None = None
+    refs: list[AssetRef] = field(default_factory=list)
 
 
-def add_issue(result: ValidationResult, message: str, as_error: bool) -> None:
+def add_issue(result: ValidationResult, issue: Issue, as_error: bool) -> None:
     if as_error:
-        result.errors.append(message)
+        result.errors.append(issue)
         return
-    result.warnings.append(message)
+    result.warnings.append(issue)
+
+
+def row_cache_signature(target: CsvTarget, raw_headers: list[str], fail_on_control_chars: bool) -> str:
+    """Row results only carry over while the header row, file kind and rule set stay the same."""
+    payload = json.dumps([ROW_CACHE_VERSION, target.kind, raw_headers, fail_on_control_chars])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def scan_row(
+    raw_row: list[str],
+    columns: list[tuple[int, str]],
+    kind: str,
+    *,
+    fail_on_control_chars: bool,
+) -> list[Any]:
+    """Clean one row and apply every row-local rule.
+
+    Returns ``[id, team, firstNight, otherNight, issues, refs]`` where each issue
+    is ``[severity, rule, message]`` and each ref a non-empty ``[column, value]``
+    from ASSET_COLUMNS; nothing in it depends on the line number, so it can be
+    cached by the row's content.
+    """
+    issues: list[list[str]] = []
+    row: dict[str, str] = {}
+    for index, key in columns:
+        value, has_control_chars = clean_cell(raw_row[index] if index < len(raw_row) else "")
+        if has_control_chars:
+            issues.append([
+                "error" if fail_on_control_chars else "warning",
+                "control-characters",
+                f"field '{key}' contains control characters",
+            ])
+        row[key] = value
+
+    row_id = row.get("id", "")
+    if row_id == "":
+        if any(value != "" for value in row.values()):
+            issues.append(["error", "empty-id", "has data but empty 'id'"])
+    else:
+        ROW_CHECKS[kind](row_id, row, issues)
+    refs = [[key, row[key]] for key in ASSET_COLUMNS[kind] if row.get(key, "") != ""]
+    return [row_id, row.get("team", "").lower(), row.get("firstNight", ""), row.get("otherNight", ""), issues, refs]
 
 
-def read_csv(
-    csv_path: Path,
+def validate_csv(
+    target: CsvTarget,
+    cache: dict[str, Any] | None = None,
     *,
     fail_on_control_chars: bool,
     fail_on_header_normalization: bool,
-) -> tuple[list[str], list[tuple[int, dict[str, str]]], ValidationResult]:
+) -> FileReport:
+    """Validate one CSV in a single pass: every cell is cleaned once and every row rule runs as it is read.
+
+    Also builds the file's id index during the same pass. With ``cache`` (the
+    file's section from the previous run, or ``{}``) rows whose raw content is
+    unchanged reuse their earlier results; only uniqueness is re-checked.
+    """
+    csv_path = target.path
+    file = str(csv_path)
     result = ValidationResult()
     if not csv_path.exists():
-        result.errors.append(f"{csv_path}: file does not exist")
-        return [], [], result
+        result.errors.append(Issue("file-missing", "file does not exist", file))
+        return FileReport(result)
 
-    with csv_path.open(encoding="utf-8-sig", newline="") as handle:
-        reader = csv.reader(handle)
-        try:
-            raw_headers = next(reader)
-        except StopIteration:
-            result.errors.append(f"{csv_path}: empty CSV (header row missing)")
-            return [], [], result
+    with CsvStream(csv_path) as stream:
+        if stream.empty:
+            result.errors.append(Issue("empty-csv", "empty CSV (header row missing)", file))
+            return FileReport(result)
 
-        headers = [sanitize_header(header) for header in raw_headers]
+        raw_headers = stream.raw_headers
+        headers = stream.headers
         for index, (raw_header, normalized_header) in enumerate(zip(raw_headers, headers), start=1):
             if normalized_header == "":
-                result.errors.append(f"{csv_path}: header column {index} is empty after sanitization")
+                result.errors.append(Issue("empty-header", f"header column {index} is empty after sanitization", file))
                 continue
             if raw_header != normalized_header:
                 add_issue(
                     result,
-                    f"{csv_path}: header '{raw_header}' normalized to '{normalized_header}'",
+                    Issue("header-normalized", f"header '{raw_header}' normalized to '{normalized_header}'", file),
                     as_error=fail_on_header_normalization,
                 )
 
         duplicates = [header for header, count in count_duplicates(headers).items() if count > 1]
         for duplicate in duplicates:
-            result.errors.append(f"{csv_path}: duplicated header '{duplicate}'")
-
-        dict_reader = csv.DictReader(handle, fieldnames=headers)
-        rows: list[tuple[int, dict[str, str]]] = []
-        for line_number, raw_row in enumerate(dict_reader, start=2):
-            row: dict[str, str] = {}
-            for raw_key, raw_value in raw_row.items():
-                key = sanitize_header(raw_key)
-                if key == "":
-                    continue
-                value = raw_value or ""
-                if CONTROL_CHARS_RE.search(value):
-                    add_issue(
-                        result,
-                        f"{csv_path}:{line_number} field '{key}' contains control characters",
-                        as_error=fail_on_control_chars,
-                    )
-                row[key] = value
-            rows.append((line_number, row))
-
-        result.infos.append(f"{csv_path}: loaded {len(rows)} row(s)")
-        return headers, rows, result
+            result.errors.append(Issue("duplicate-header", f"duplicated header '{duplicate}'", file))
+
+        required_headers, known_headers = TARGET_HEADERS[target.kind]
+        result.merge(ensure_required_headers(csv_path, headers, required_headers))
+        result.merge(validate_known_headers(csv_path, headers, known_headers))
+
+        signature = None
+        cached_rows: dict[str, list[Any]] = {}
+        new_rows: dict[str, list[Any]] = {}
+        if cache is not None:
+            signature = row_cache_signature(target, raw_headers, fail_on_control_chars)
+            if cache.get("signature") == signature:
+                cached_rows = cache.get("rows", {})
+
+        columns = stream.columns
+        id_index = IdIndex(csv_path, target.kind, frozenset(headers) & set(CONSISTENCY_COLUMNS))
+        refs: list[AssetRef] = []
+        seen_ids: dict[str, int] = {}
+        reused = 0
+        line_number = 1
+        for line_number, raw_row in stream.raw_rows():
+            if cache is None:
+                entry = scan_row(raw_row, columns, target.kind, fail_on_control_chars=fail_on_control_chars)
+            else:
+                row_key = hashlib.blake2b("\x1f".join(raw_row).encode("utf-8"), digest_size=16).hexdigest()
+                entry = cached_rows.get(row_key)
+                if entry is None:
+                    entry = scan_row(raw_row, columns, target.kind, fail_on_control_chars=fail_on_control_chars)
+                else:
+                    reused += 1
+                new_rows[row_key] = entry
+
+            row_id, team, first_night, other_night, issues, row_refs = entry
+            for severity, rule, message in issues:
+                result.add(severity, Issue(rule, message, file, line_number, row_id or None))
+            for column, value in row_refs:
+                refs.append(AssetRef(file, line_number, row_id or None, column, value))
+            if row_id == "":
+                continue
+
+            first_line = seen_ids.setdefault(row_id, line_number)
+            if first_line == line_number:
+                id_index.rows[row_id] = (line_number, team, first_night, other_night)
+            else:
+                result.errors.append(Issue(
+                    "duplicate-id",
+                    f"duplicated id '{row_id}' (first defined at line {first_line})",
+                    file,
+                    line_number,
+                    row_id,
+                ))
+
+        loaded = f"loaded {line_number - 1} row(s)"
+        if cache is not None:
+            loaded += f", {reused} unchanged since the last run"
+        result.infos.append(Issue("rows-loaded", loaded, file))
+        new_cache = None if cache is None else {"signature": signature, "rows": new_rows}
+        return FileReport(result, id_index, new_cache, refs)
 
 
 def count_duplicates(values: list[str]) -> dict[str, int]:
@@ -168,7 +319,7 @@ def ensure_required_headers(
     result = ValidationResult()
     missing = sorted(required_headers - set(headers))
     for header in missing:
-        result.errors.append(f"{csv_path}: missing required header '{header}'")
+        result.errors.append(Issue("missing-header", f"missing required header '{header}'", str(csv_path)))
     return result
 
 
@@ -178,111 +329,488 @@ def validate_known_headers(
     result = ValidationResult()
     unknown = sorted(set(headers) - known_headers)
     for header in unknown:
-        result.errors.append(f"{csv_path}: unknown header '{header}'")
+        result.errors.append(Issue("unknown-header", f"unknown header '{header}'", str(csv_path)))
     return result
 
 
-def validate_unique_ids(csv_path: Path, rows: list[tuple[int, dict[str, str]]]) -> ValidationResult:
-    result = ValidationResult()
-    seen: dict[str, int] = {}
-    for line_number, row in rows:
-        row_id = clean_text(row.get("id"))
-        has_non_empty_cell = any(clean_text(value) != "" for value in row.values())
-        if row_id == "":
-            if has_non_empty_cell:
-                result.errors.append(f"{csv_path}:{line_number} has data but empty 'id'")
+def check_character_row(row_id: str, row: dict[str, str], issues: list[list[str]]) -> None:
+    team = row.get("team", "").lower()
+    if team != "" and team not in ALLOWED_TEAMS:
+        issues.append(["warning", "unknown-team", f"id='{row_id}' uses unknown team '{team}'"])
+
+    for key in ("firstNight", "otherNight"):
+        value = row.get(key, "")
+        if value != "" and not value.lstrip("-").isdigit():
+            issues.append([
+                "warning",
+                "non-numeric-night-order",
+                f"id='{row_id}' has non-numeric '{key}' value '{value}'",
+            ])
+
+
+def check_script_row(row_id: str, row: dict[str, str], issues: list[list[str]]) -> None:
+    if not SCRIPT_ID_RE.fullmatch(row_id):
+        issues.append([
+            "error",
+            "script-id-format",
+            f"id='{row_id}' must match regex '{SCRIPT_ID_RE.pattern}'",
+        ])
+
+    for key in ("name", "author", "synopsis", "json", "pdf"):
+        if row.get(key, "") == "":
+            issues.append(["error", "empty-field", f"id='{row_id}' has empty '{key}'"])
+
+    for key, suffix in (("json", ".json"), ("pdf", ".pdf")):
+        url = row.get(key, "")
+        if any(char.isspace() for char in url):
+            issues.append(["error", f"{key}-path-whitespace", f"id='{row_id}' has whitespace in {key} path"])
+        if url != "" and not url.endswith(suffix):
+            issues.append([
+                "warning",
+                f"{key}-path-suffix",
+                f"id='{row_id}' has {key} path not ending with {suffix}",
+            ])
+        if url != "" and not url.startswith(ALLOWED_URL_PREFIXES):
+            issues.append([
+                "error",
+                f"{key}-path-prefix",
+                f"id='{row_id}' has unsupported {key} path '{url}'",
+            ])
+
+    for key in OPTIONAL_SCRIPT_BOOL_HEADERS:
+        if key not in row:
             continue
+        value = row[key]
+        if value != "" and parse_optional_bool(value) is None:
+            issues.append(["error", "invalid-boolean", f"id='{row_id}' has invalid boolean '{key}={value}'"])
+
+
+def load_reference_index(path: Path) -> IdIndex:
+    """Index a roles JSON (``assets/json/<LOCALE>.json``) for the cross-locale checks.
 
-        first_line = seen.get(row_id)
-        if first_line is None:
-            seen[row_id] = line_number
+    Rows carry line 0: the JSON is looked up by id, not by line. The JSON is
+    generated output that can lag the sheet, so its team differences are
+    reported as warnings rather than errors.
+    """
+    roles = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(roles, list):
+        raise ValueError("expected a list of roles")
+    columns: set[str] = set()
+    rows: dict[str, tuple[int, str, str, str]] = {}
+    for role in roles:
+        if not isinstance(role, dict) or not isinstance(role.get("id"), str) or role["id"] in rows:
             continue
+        columns.update(key for key in CONSISTENCY_COLUMNS if key in role)
+        values = ["" if role.get(key) is None else str(role[key]) for key in ("team", "firstNight", "otherNight")]
+        rows[role["id"]] = (0, *values)
+    return IdIndex(path, "reference", frozenset(columns), rows)
 
-        result.errors.append(
-            f"{csv_path}:{line_number} duplicated id '{row_id}' (first defined at line {first_line})"
-        )
-    return result
 
+def check_consistency(reference: IdIndex, index: IdIndex) -> ValidationResult:
+    """Compare one locale's ids, teams and night order against the reference locale.
 
-def validate_character_rows(csv_path: Path, rows: list[tuple[int, dict[str, str]]]) -> ValidationResult:
+    Teams and night order are only compared when both sides have a value;
+    blank cells leave the order to the reference or a night order override.
+    Ids missing from a locale are untranslated characters rather than broken
+    rows, so they are counted in one info per file. The characters CSV also
+    holds homebrew characters, so its extra ids are summarized the same way.
+    """
     result = ValidationResult()
-    for line_number, row in rows:
-        row_id = clean_text(row.get("id"))
-        if row_id == "":
+    file = str(index.path)
+    compared_columns = reference.columns & index.columns
+    team_issues = result.warnings if reference.kind == "reference" else result.errors
+    for row_id, (line_number, team, first_night, other_night) in index.rows.items():
+        reference_row = reference.rows.get(row_id)
+        if reference_row is None:
+            if index.kind != "characters":
+                result.warnings.append(Issue(
+                    "unknown-id",
+                    f"id='{row_id}' is not in reference {reference.path.name}",
+                    file,
+                    line_number,
+                    row_id,
+                ))
             continue
 
-        team = clean_text(row.get("team")).lower()
-        if team != "" and team not in ALLOWED_TEAMS:
-            result.warnings.append(
-                f"{csv_path}:{line_number} id='{row_id}' uses unknown team '{team}'"
-            )
-
-        for key in ("firstNight", "otherNight"):
-            value = clean_text(row.get(key))
-            if value != "" and not value.lstrip("-").isdigit():
-                result.warnings.append(
-                    f"{csv_path}:{line_number} id='{row_id}' has non-numeric '{key}' value '{value}'"
-                )
+        _, reference_team, reference_first_night, reference_other_night = reference_row
+        if "team" in compared_columns and team != "" and reference_team != "" and team != reference_team:
+            team_issues.append(Issue(
+                "team-mismatch",
+                f"id='{row_id}' has team '{team}' but reference {reference.path.name} has '{reference_team}'",
+                file,
+                line_number,
+                row_id,
+            ))
+        for key, value, reference_value in (
+            ("firstNight", first_night, reference_first_night),
+            ("otherNight", other_night, reference_other_night),
+        ):
+            if key in compared_columns and value != "" and reference_value != "" and value != reference_value:
+                result.warnings.append(Issue(
+                    "night-order-mismatch",
+                    f"id='{row_id}' has '{key}' order '{value}' "
+                    f"but reference {reference.path.name} has '{reference_value}'",
+                    file,
+                    line_number,
+                    row_id,
+                ))
 
+    missing = [row_id for row_id in reference.rows if row_id not in index.rows]
+    if missing:
+        shown = ", ".join(missing[:MISSING_IDS_SHOWN])
+        more = f", ... (+{len(missing) - MISSING_IDS_SHOWN} more)" if len(missing) > MISSING_IDS_SHOWN else ""
+        result.infos.append(Issue(
+            "missing-id",
+            f"{len(missing)} id(s) in reference {reference.path.name} not translated: {shown}{more}",
+            file,
+        ))
+    if index.kind == "characters":
+        extra = sum(1 for row_id in index.rows if row_id not in reference.rows)
+        result.infos.append(Issue("homebrew-ids", f"{extra} id(s) not in reference {reference.path.name} (homebrew)", file))
     return result
 
 
-def validate_script_rows(csv_path: Path, rows: list[tuple[int, dict[str, str]]]) -> ValidationResult:
+def check_all_consistency(reference_path: Path, indexes: dict[Path, IdIndex]) -> ValidationResult:
+    """Check every characters/locale index against the reference in one pass over their rows.
+
+    The reference is a CSV that was validated in this run, or a roles JSON,
+    which has the team and night order columns the locale CSVs lack.
+    """
     result = ValidationResult()
-    for line_number, row in rows:
-        row_id = clean_text(row.get("id"))
-        if row_id == "":
+    if reference_path.suffix == ".json":
+        try:
+            reference = load_reference_index(reference_path)
+        except (OSError, ValueError) as error:
+            result.warnings.append(Issue(
+                "reference-missing",
+                f"could not read reference roles JSON ({error}); skipping consistency checks",
+                str(reference_path),
+            ))
+            return result
+    else:
+        reference = indexes.get(reference_path)
+    if reference is None:
+        result.warnings.append(Issue(
+            "reference-missing",
+            "reference locale was not validated; skipping consistency checks",
+            str(reference_path),
+        ))
+        return result
+
+    compared = 0
+    for path, index in indexes.items():
+        if path == reference_path or index.kind == "scripts":
             continue
-        if not SCRIPT_ID_RE.fullmatch(row_id):
-            result.errors.append(
-                f"{csv_path}:{line_number} id='{row_id}' must match regex '{SCRIPT_ID_RE.pattern}'"
-            )
+        result.merge(check_consistency(reference, index))
+        compared += 1
+    result.infos.append(Issue("consistency", f"compared {compared} file(s) against reference {reference_path.name}"))
+    return result
 
-        for key in ("name", "author", "synopsis", "json", "pdf"):
-            if clean_text(row.get(key)) == "":
-                result.errors.append(f"{csv_path}:{line_number} id='{row_id}' has empty '{key}'")
 
-        json_url = clean_text(row.get("json"))
-        if any(char.isspace() for char in json_url):
-            result.errors.append(
-                f"{csv_path}:{line_number} id='{row_id}' has whitespace in json path"
-            )
-        if json_url != "" and not json_url.endswith(".json"):
-            result.warnings.append(
-                f"{csv_path}:{line_number} id='{row_id}' has json path not ending with .json"
-            )
-        if json_url != "" and not json_url.startswith(ALLOWED_URL_PREFIXES):
-            result.errors.append(
-                f"{csv_path}:{line_number} id='{row_id}' has unsupported json path '{json_url}'"
-            )
+ROW_CHECKS = {
+    "characters": check_character_row,
+    "locale": check_character_row,
+    "scripts": check_script_row,
+}
 
-        pdf_url = clean_text(row.get("pdf"))
-        if any(char.isspace() for char in pdf_url):
-            result.errors.append(
-                f"{csv_path}:{line_number} id='{row_id}' has whitespace in pdf path"
-            )
-        if pdf_url != "" and not pdf_url.endswith(".pdf"):
-            result.warnings.append(
-                f"{csv_path}:{line_number} id='{row_id}' has pdf path not ending with .pdf"
-            )
-        if pdf_url != "" and not pdf_url.startswith(ALLOWED_URL_PREFIXES):
-            result.errors.append(
-                f"{csv_path}:{line_number} id='{row_id}' has unsupported pdf path '{pdf_url}'"
-            )
 
-        for key in OPTIONAL_SCRIPT_BOOL_HEADERS:
-            if key not in row:
+class AssetIndex:
+    """Every file under public/ and translations-tooling/assets, built with one directory walk.
+
+    Keys are the paths CSV values use: ``/translations/assets/...`` (site paths,
+    from public/) and ``assets/...`` (translations-tooling copy, for paths
+    relative to a generated script). Resolving a reference is a set lookup.
+    """
+
+    def __init__(self, public_dir: Path, assets_dir: Path):
+        self.paths: set[str] = set()
+        for root, prefix in ((public_dir, "/"), (assets_dir, "assets/")):
+            for directory, _, files in os.walk(root):
+                relative = Path(directory).relative_to(root).as_posix()
+                base = prefix if relative == "." else f"{prefix}{relative}/"
+                self.paths.update(base + name for name in files)
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.paths
+
+
+@dataclass(frozen=True)
+class AppAssetBases:
+    """Asset URL bases the app rewrites to its own site path."""
+
+    remote: tuple[str, ...]
+    site: str
+
+    def normalize(self, url: str) -> str:
+        """Same rewrite as normalizeTranslationUrl in src/constants/urls.ts."""
+        for base in self.remote:
+            if url.startswith(base):
+                url = self.site + url[len(base):]
+        return url
+
+
+def load_app_asset_bases(urls_ts: Path) -> AppAssetBases:
+    """Read REMOTE_ASSET_BASES and TRANSLATIONS_DEFAULT_BASE from the app's urls.ts."""
+    source = urls_ts.read_text(encoding="utf-8")
+    default_base = APP_DEFAULT_BASE_RE.search(source)
+    remote_bases = APP_REMOTE_BASES_RE.search(source)
+    if default_base is None or remote_bases is None:
+        raise ValueError("REMOTE_ASSET_BASES or TRANSLATIONS_DEFAULT_BASE not found")
+    remote = tuple(match.group(2) for match in APP_STRING_RE.finditer(remote_bases.group(1)))
+    return AppAssetBases(remote, default_base.group(2).strip().rstrip("/"))
+
+
+def load_known_missing(path: Path) -> set[str]:
+    """Index keys listed one per line (``#`` starts a comment); an absent file lists nothing."""
+    try:
+        lines = path.read_text(encoding="utf-8").splitlines()
+    except FileNotFoundError:
+        return set()
+    return {line.split("#", 1)[0].strip() for line in lines} - {""}
+
+
+def strip_query(value: str) -> str:
+    return urllib.parse.unquote(value.split("#", 1)[0].split("?", 1)[0])
+
+
+def classify_reference(value: str, app_bases: AppAssetBases) -> tuple[str, str] | None:
+    """("local", index key) or ("remote", url); None for values that are not paths, such as logo keys."""
+    value = app_bases.normalize(value)
+    if value.startswith(("https://", "http://")):
+        return "remote", value
+    if value.startswith("/"):
+        return "local", strip_query(value)
+    relative = value
+    while relative.startswith("../"):
+        relative = relative[3:]
+    if relative.startswith("assets/"):
+        return "local", strip_query(relative)
+    return None
+
+
+def probe_url(url: str, timeout: float) -> str | None:
+    """None when the URL answers with a success status, otherwise why it failed."""
+    for method in ("HEAD", "GET"):
+        headers = {"User-Agent": URL_CHECK_USER_AGENT}
+        if method == "GET":
+            headers["Range"] = "bytes=0-0"
+        request = urllib.request.Request(url, method=method, headers=headers)
+        try:
+            with urllib.request.urlopen(request, timeout=timeout):
+                return None
+        except urllib.error.HTTPError as error:
+            # Some hosts refuse HEAD; retry those with a one-byte GET
+            if method == "HEAD" and error.code in (403, 405, 501):
                 continue
-            raw_value = row.get(key)
-            parsed = parse_optional_bool(raw_value)
-            if clean_text(raw_value) != "" and parsed is None:
-                result.errors.append(
-                    f"{csv_path}:{line_number} id='{row_id}' has invalid boolean '{key}={raw_value}'"
-                )
+            return f"HTTP {error.code}"
+        except (urllib.error.URLError, OSError, ValueError) as error:
+            return str(getattr(error, "reason", error))
+    return None
+
+
+class UrlChecker:
+    """Checks absolute URLs on a bounded thread pool, remembering successful checks between runs.
+
+    Failures are never cached, so a fixed link is picked up on the next run.
+    """
+
+    def __init__(self, cache_path: Path | None, *, jobs: int, timeout: float, ttl_hours: float):
+        self.cache_path = cache_path
+        self.jobs = jobs
+        self.timeout = timeout
+        self.ttl = ttl_hours * 3600
+        self.cached = 0
+        self._checked: dict[str, float] = {}
+        if cache_path is not None:
+            try:
+                self._checked = json.loads(cache_path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                self._checked = {}
+
+    def check(self, urls: set[str]) -> dict[str, str | None]:
+        now = time.time()
+        results: dict[str, str | None] = {}
+        pending: list[str] = []
+        for url in sorted(urls):
+            if now - self._checked.get(url, 0) < self.ttl:
+                results[url] = None
+            else:
+                pending.append(url)
+        self.cached = len(results)
+
+        if pending:
+            with ThreadPoolExecutor(max_workers=min(self.jobs, len(pending))) as executor:
+                for url, error in zip(pending, executor.map(partial(probe_url, timeout=self.timeout), pending)):
+                    results[url] = error
+                    if error is None:
+                        self._checked[url] = now
+                    else:
+                        self._checked.pop(url, None)
+        return results
+
+    def save(self) -> None:
+        if self.cache_path is None:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(self._checked, ensure_ascii=False, indent=1, sort_keys=True), encoding="utf-8")
+        os.replace(tmp_path, self.cache_path)
+
+
+def check_asset_references(
+    refs: list[AssetRef],
+    asset_index: AssetIndex,
+    url_checker: UrlChecker | None,
+    app_bases: AppAssetBases,
+    known_missing: set[str] | None = None,
+) -> ValidationResult:
+    """Resolve every json/pdf/logo/image reference against the asset index, then check remote URLs.
+
+    Targets in ``known_missing`` are reported as infos instead of errors/warnings;
+    entries that resolve again are listed so the allow-list can be trimmed.
+    """
+    result = ValidationResult()
+    known_missing = known_missing or set()
+    local = 0
+    remote: list[AssetRef] = []
+    known: set[str] = set()
+    resolved_known: set[str] = set()
+    for ref in refs:
+        reference = classify_reference(ref.value, app_bases)
+        if reference is None:
+            continue
+        kind, target = reference
+        if kind == "remote":
+            remote.append(ref)
+            continue
+        local += 1
+        if target in asset_index:
+            if target in known_missing:
+                resolved_known.add(target)
+        elif target in known_missing:
+            known.add(target)
+        else:
+            result.add(MISSING_ASSET_SEVERITY[ref.column], Issue(
+                "asset-missing",
+                f"id='{ref.id}' {ref.column} '{ref.value}' not found (looked up '{target}')",
+                ref.file,
+                ref.line,
+                ref.id,
+            ))
+
+    for target in sorted(resolved_known):
+        result.infos.append(Issue("known-missing-resolved", f"'{target}' exists now; remove it from the known-missing list"))
 
+    summary = f"resolved {local} local reference(s) against {len(asset_index)} indexed file(s)"
+    if known:
+        summary += f", {len(known)} known missing"
+    urls = {ref.value for ref in remote}
+    if url_checker is None:
+        summary += f", skipped {len(urls)} URL(s)"
+    elif urls:
+        started = time.perf_counter()
+        errors = url_checker.check(urls)
+        for ref in remote:
+            error = errors[ref.value]
+            if error is not None:
+                result.warnings.append(Issue(
+                    "asset-unreachable",
+                    f"id='{ref.id}' {ref.column} URL '{ref.value}' is unreachable ({error})",
+                    ref.file,
+                    ref.line,
+                    ref.id,
+                ))
+        summary += (
+            f", checked {len(urls)} URL(s) ({url_checker.cached} cached) "
+            f"in {time.perf_counter() - started:.2f}s"
+        )
+    result.infos.append(Issue("assets", summary))
     return result
 
 
+class RowCache:
+    """Per-row validation results from the previous run, keyed by file and raw row hash."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        try:
+            self._files: dict[str, Any] = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self._files = {}
+
+    def section(self, csv_path: Path) -> dict[str, Any]:
+        return self._files.get(str(csv_path), {})
+
+    def update(self, csv_path: Path, section: dict[str, Any]) -> None:
+        self._files[str(csv_path)] = section
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(self._files, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+
+
+def collect_targets(args: argparse.Namespace) -> list[CsvTarget]:
+    targets: list[CsvTarget] = []
+    characters_csv = args.characters.resolve()
+    scripts_csv = args.scripts.resolve()
+    if not args.skip_characters:
+        targets.append(CsvTarget(characters_csv, "characters"))
+        if not args.skip_locales:
+            targets.extend(
+                CsvTarget(path.resolve(), "locale")
+                for path in sorted(args.locales_dir.glob("*.csv"))
+                if path.resolve() not in {characters_csv, scripts_csv}
+            )
+    if not args.skip_scripts:
+        targets.append(CsvTarget(scripts_csv, "scripts"))
+    return targets
+
+
+def validate_targets(
+    targets: list[CsvTarget],
+    *,
+    jobs: int,
+    fail_on_control_chars: bool,
+    fail_on_header_normalization: bool,
+    row_cache: RowCache | None = None,
+) -> tuple[ValidationResult, dict[Path, IdIndex], list[AssetRef]]:
+    """Validate every CSV, in worker processes when there is more than one, merging results in target order."""
+    validate = partial(
+        validate_csv,
+        fail_on_control_chars=fail_on_control_chars,
+        fail_on_header_normalization=fail_on_header_normalization,
+    )
+    sections = [row_cache.section(target.path) if row_cache else None for target in targets]
+    workers = min(jobs or os.cpu_count() or 1, len(targets))
+    started = time.perf_counter()
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            reports = list(executor.map(validate, targets, sections))
+    else:
+        reports = [validate(target, section) for target, section in zip(targets, sections)]
+
+    merged = ValidationResult()
+    indexes: dict[Path, IdIndex] = {}
+    refs: list[AssetRef] = []
+    for target, report in zip(targets, reports):
+        merged.merge(report.result)
+        refs.extend(report.refs)
+        if report.index is not None:
+            indexes[report.index.path] = report.index
+        if row_cache is not None and report.cache is not None:
+            row_cache.update(target.path, report.cache)
+    merged.infos.append(Issue(
+        "run",
+        f"validated {len(targets)} file(s) with {workers} worker(s) in {time.perf_counter() - started:.2f}s",
+    ))
+    return merged, indexes, refs
+
+
 def print_result(result: ValidationResult) -> None:
     for info in result.infos:
         print(f"[info] {info}")
@@ -296,6 +824,83 @@ def print_result(result: ValidationResult) -> None:
     )
 
 
+def issues_with_severity(result: ValidationResult) -> list[tuple[str, Issue]]:
+    return (
+        [("error", issue) for issue in result.errors]
+        + [("warning", issue) for issue in result.warnings]
+        + [("info", issue) for issue in result.infos]
+    )
+
+
+def result_to_json(result: ValidationResult) -> dict[str, Any]:
+    return {
+        "summary": {
+            "errors": len(result.errors),
+            "warnings": len(result.warnings),
+            "infos": len(result.infos),
+        },
+        "issues": [{"severity": severity, **asdict(issue)} for severity, issue in issues_with_severity(result)],
+    }
+
+
+def artifact_uri(file: str) -> str:
+    """Repository-relative URI when the file is under the working directory, so code scanning can link it."""
+    path = Path(file)
+    try:
+        return path.resolve().relative_to(Path.cwd()).as_posix()
+    except ValueError:
+        return path.as_uri() if path.is_absolute() else path.as_posix()
+
+
+def result_to_sarif(result: ValidationResult) -> dict[str, Any]:
+    """SARIF 2.1.0 log with one result per error and warning."""
+    sarif_results = []
+    rules: set[str] = set()
+    for severity, issue in issues_with_severity(result):
+        if severity == "info":
+            continue
+        rules.add(issue.rule)
+        sarif_result: dict[str, Any] = {
+            "ruleId": issue.rule,
+            "level": severity,
+            "message": {"text": issue.message},
+        }
+        if issue.file is not None:
+            physical_location: dict[str, Any] = {"artifactLocation": {"uri": artifact_uri(issue.file)}}
+            if issue.line is not None:
+                physical_location["region"] = {"startLine": issue.line}
+            sarif_result["locations"] = [{"physicalLocation": physical_location}]
+        if issue.id is not None:
+            sarif_result["properties"] = {"id": issue.id}
+        sarif_results.append(sarif_result)
+
+    return {
+        "$schema": SARIF_SCHEMA,
+        "version": "2.1.0",
+        "runs": [
+            {
+                "tool": {
+                    "driver": {
+                        "name": "validate_google_sheet_csv",
+                        "rules": [{"id": rule} for rule in sorted(rules)],
+                    }
+                },
+                "results": sarif_results,
+            }
+        ],
+    }
+
+
+def write_report(result: ValidationResult, report_format: str, output: Path | None) -> None:
+    payload = result_to_sarif(result) if report_format == "sarif" else result_to_json(result)
+    text = json.dumps(payload, ensure_ascii=False, indent=2)
+    if output is None:
+        print(text)
+        return
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(text + "\n", encoding="utf-8")
+
+
 def parse_args() -> argparse.Namespace:
     script_dir = Path(__file__).resolve().parent
     default_csv_dir = script_dir / "assets" / "csv"
@@ -315,16 +920,128 @@ def parse_args() -> argparse.Namespace:
         default=default_csv_dir / "scripts.csv",
         help="Path to Scripts CSV export (default: translations-tooling/assets/csv/scripts.csv)",
     )
+    parser.add_argument(
+        "--locales-dir",
+        type=Path,
+        default=default_csv_dir,
+        help="Directory whose other *.csv files are validated as locale CSVs (default: translations-tooling/assets/csv)",
+    )
+    parser.add_argument(
+        "--reference",
+        type=Path,
+        default=default_csv_dir / "en_GB.csv",
+        help=(
+            "Validated locale CSV (or a roles JSON) every locale is compared against "
+            "(default: translations-tooling/assets/csv/en_GB.csv)"
+        ),
+    )
+    parser.add_argument(
+        "--skip-consistency",
+        action="store_true",
+        help="Skip cross-locale checks of ids, teams and night order against the reference",
+    )
     parser.add_argument(
         "--skip-characters",
         action="store_true",
-        help="Skip validation for Characters CSV",
+        help="Skip validation for Characters CSV and locale CSVs",
+    )
+    parser.add_argument(
+        "--skip-locales",
+        action="store_true",
+        help="Skip validation for locale CSVs",
     )
     parser.add_argument(
         "--skip-scripts",
         action="store_true",
         help="Skip validation for Scripts CSV",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=0,
+        help="Number of worker processes (default: 0, one per CPU core)",
+    )
+    parser.add_argument(
+        "--public-dir",
+        type=Path,
+        default=script_dir.parent / "public",
+        help="Site root that /... paths resolve against (default: ../public)",
+    )
+    parser.add_argument(
+        "--assets-dir",
+        type=Path,
+        default=script_dir / "assets",
+        help="Local copy of the GitHub mirror assets (default: translations-tooling/assets)",
+    )
+    parser.add_argument(
+        "--skip-assets",
+        action="store_true",
+        help="Do not check that json/pdf/logo/image references exist",
+    )
+    parser.add_argument(
+        "--app-urls",
+        type=Path,
+        default=script_dir.parent / APP_URLS_RELATIVE_PATH,
+        help="App source with REMOTE_ASSET_BASES, used to resolve mirror URLs (default: ../src/constants/urls.ts)",
+    )
+    parser.add_argument(
+        "--known-missing",
+        type=Path,
+        default=script_dir / "known_missing_assets.txt",
+        help="Referenced paths known to be missing, reported as info (default: translations-tooling/known_missing_assets.txt)",
+    )
+    parser.add_argument(
+        "--check-remote",
+        action="store_true",
+        help="Also request absolute http(s) URLs (needs network; off by default)",
+    )
+    parser.add_argument(
+        "--remote-jobs",
+        type=int,
+        default=8,
+        help="URLs requested at the same time (default: 8)",
+    )
+    parser.add_argument(
+        "--remote-timeout",
+        type=float,
+        default=10.0,
+        help="Seconds to wait for each URL (default: 10)",
+    )
+    parser.add_argument(
+        "--url-cache",
+        type=Path,
+        default=script_dir / ".cache" / "url_checks.json",
+        help="URLs that answered recently are not requested again (default: translations-tooling/.cache/url_checks.json)",
+    )
+    parser.add_argument(
+        "--url-cache-ttl",
+        type=float,
+        default=24.0,
+        help="Hours a successful URL check is reused (default: 24)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=("text", "json", "sarif"),
+        default="text",
+        help="Report format; json/sarif list every issue with file, line, id, rule and severity (default: text)",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help="Write the json/sarif report to this file and print the text report too (default: stdout only)",
+    )
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        default=script_dir / ".cache" / "csv_validation.json",
+        help="Per-row result cache; unchanged rows are not re-checked (default: translations-tooling/.cache/csv_validation.json)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-check every row and URL and leave the caches untouched",
+    )
     parser.add_argument(
         "--strict-warnings",
         action="store_true",
@@ -347,6 +1064,12 @@ def parse_args() -> argparse.Namespace:
     )
 
     args = parser.parse_args()
+    if args.jobs < 0:
+        parser.error("--jobs must be zero or a positive integer")
+    if args.remote_jobs < 1 or args.remote_timeout <= 0:
+        parser.error("--remote-jobs and --remote-timeout must be positive")
+    if args.output and args.format == "text":
+        parser.error("--output needs --format json or --format sarif")
     if args.strict:
         args.strict_warnings = True
         args.fail_on_control_chars = True
@@ -356,41 +1079,55 @@ def parse_args() -> argparse.Namespace:
 
 def main() -> int:
     args = parse_args()
-    result = ValidationResult()
 
     if args.skip_characters and args.skip_scripts:
         print("[error] both targets are skipped; nothing to validate", file=sys.stderr)
         return 1
 
-    if not args.skip_characters:
-        characters_csv = args.characters.resolve()
-        headers, rows, load_result = read_csv(
-            characters_csv,
-            fail_on_control_chars=args.fail_on_control_chars,
-            fail_on_header_normalization=args.fail_on_header_normalization,
-        )
-        result.merge(load_result)
-        if headers:
-            result.merge(ensure_required_headers(characters_csv, headers, REQUIRED_CHARACTER_HEADERS))
-            result.merge(validate_known_headers(characters_csv, headers, KNOWN_CHARACTER_HEADERS))
-            result.merge(validate_unique_ids(characters_csv, rows))
-            result.merge(validate_character_rows(characters_csv, rows))
+    row_cache = None if args.no_cache else RowCache(args.cache)
+    result, indexes, refs = validate_targets(
+        collect_targets(args),
+        jobs=args.jobs,
+        fail_on_control_chars=args.fail_on_control_chars,
+        fail_on_header_normalization=args.fail_on_header_normalization,
+        row_cache=row_cache,
+    )
+    if not args.skip_characters and not args.skip_locales and not args.skip_consistency:
+        result.merge(check_all_consistency(args.reference.resolve(), indexes))
+    url_checker = None
+    if not args.skip_assets:
+        try:
+            app_bases = load_app_asset_bases(args.app_urls)
+        except (OSError, ValueError) as error:
+            # Mirror URLs are then treated as remote, like any other absolute URL
+            result.warnings.append(Issue("app-urls-missing", f"could not read asset bases: {error}", str(args.app_urls)))
+            app_bases = AppAssetBases((), "")
+        if args.check_remote:
+            url_checker = UrlChecker(
+                None if args.no_cache else args.url_cache,
+                jobs=args.remote_jobs,
+                timeout=args.remote_timeout,
+                ttl_hours=args.url_cache_ttl,
+            )
+        asset_index = AssetIndex(args.public_dir.resolve(), args.assets_dir.resolve())
+        result.merge(check_asset_references(
+            refs, asset_index, url_checker, app_bases, load_known_missing(args.known_missing)
+        ))
+    if row_cache is not None:
+        try:
+            row_cache.save()
+        except OSError as error:
+            print(f"[warn] could not save row cache {args.cache}: {error}", file=sys.stderr)
+    if url_checker is not None:
+        try:
+            url_checker.save()
+        except OSError as error:
+            print(f"[warn] could not save URL cache {args.url_cache}: {error}", file=sys.stderr)
 
-    if not args.skip_scripts:
-        scripts_csv = args.scripts.resolve()
-        headers, rows, load_result = read_csv(
-            scripts_csv,
-            fail_on_control_chars=args.fail_on_control_chars,
-            fail_on_header_normalization=args.fail_on_header_normalization,
-        )
-        result.merge(load_result)
-        if headers:
-            result.merge(ensure_required_headers(scripts_csv, headers, REQUIRED_SCRIPT_HEADERS))
-            result.merge(validate_known_headers(scripts_csv, headers, KNOWN_SCRIPT_HEADERS))
-            result.merge(validate_unique_ids(scripts_csv, rows))
-            result.merge(validate_script_rows(scripts_csv, rows))
-
-    print_result(result)
+    if args.format == "text" or args.output:
+        print_result(result)
+    if args.format != "text":
+        write_report(result, args.format, args.output)
     if result.errors:
         return 1
     if args.strict_warnings and result.warnings: